@@ -45,7 +45,8 @@ class AuditorExporterMixin:
         """
         return export_to_json(results, file_path)
 
-    def export_results_to_html(self, results: Dict, file_path: str = "audit_report.html", thousand_separator: str = ",", decimal_places: int = 1) -> str:
+    def export_results_to_html(self, results: Dict, file_path: str = "audit_report.html", thousand_separator: str = ",", decimal_places: int = 1,
+                               compress: bool = False) -> str:
         """
         Export audit results to a beautiful HTML report
 
@@ -54,11 +55,13 @@ class AuditorExporterMixin:
             file_path: Path to save HTML file
             thousand_separator: Separator for thousands (default: ",")
             decimal_places: Number of decimal places to display (default: 1)
+            compress: Write a gzip-compressed report, adding ".gz" to file_path
+                unless it already ends with it (default: False)
 
         Returns:
             Path to saved HTML file
         """
-        return export_to_html(results, file_path, thousand_separator, decimal_places)
+        return export_to_html(results, file_path, thousand_separator, decimal_places, compress)
 
     def get_summary_stats(self, results: Dict) -> Dict:
         """
@@ -2,10 +2,24 @@
 CSS and JavaScript assets for HTML reports
 """
 
+import re
 
-def _generate_css_styles() -> str:
-    """Generate CSS styles for the HTML report"""
-    return """
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet
+
+    Only whitespace next to { } ; , > and after : is dropped, so selectors
+    and multi-word values keep their meaning.
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css).replace(';}', '}')
+    return f"\n{css.strip()}\n"
+
+
+# Minified once at import; reports embed the stylesheet in every page
+_CSS_STYLES = _minify_css("""
         :root {
             --text-main: #000;
             --text-muted: #666;
@@ -1099,6 +1113,19 @@ def _generate_css_styles() -> str:
 
         .confidence-bar-fill {
             height: 100%;
+            background: currentColor;
+        }
+
+        .conf-low {
+            color: #f59e0b;
+        }
+
+        .conf-mid {
+            color: #6606dc;
+        }
+
+        .conf-high {
+            color: #10b981;
         }
 
         .confidence-pct {
@@ -1114,12 +1141,37 @@ def _generate_css_styles() -> str:
             font-weight: 500;
         }
 
+        .relationship-type-badge.type-o2o {
+            background: #dbeafe;
+            color: #1e40af;
+        }
+
+        .relationship-type-badge.type-m2o {
+            background: #e0e7ff;
+            color: #4338ca;
+        }
+
+        .relationship-type-badge.type-m2m {
+            background: #fce7f3;
+            color: #9f1239;
+        }
+
+        .relationship-type-badge.type-other {
+            background: #f3f4f6;
+            color: #4b5563;
+        }
+
         .relationship-matching {
             font-weight: 500;
             color: #4b5563;
         }
 
-"""
+""")
+
+
+def _generate_css_styles() -> str:
+    """Generate CSS styles for the HTML report"""
+    return _CSS_STYLES
 
 
 def _generate_javascript() -> str:
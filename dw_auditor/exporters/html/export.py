@@ -2,14 +2,16 @@
 Main HTML export orchestration
 """
 
+import gzip
 from typing import Dict
 
 from .structure import _generate_header, _generate_metadata_cards, _generate_metadata_section, _generate_column_summary_table
-from .insights import _generate_column_insights
+from .insights import _iter_column_insights
 from .checks import _generate_issues_section
 
 
-def export_to_html(results: Dict, file_path: str = "audit_report.html", thousand_separator: str = ",", decimal_places: int = 1) -> str:
+def export_to_html(results: Dict, file_path: str = "audit_report.html", thousand_separator: str = ",", decimal_places: int = 1,
+                   compress: bool = False) -> str:
     """
     Export audit results to a beautiful HTML report
 
@@ -18,6 +20,8 @@ def export_to_html(results: Dict, file_path: str = "audit_report.html", thousand
         file_path: Path to save HTML file
         thousand_separator: Separator for thousands (default: ",")
         decimal_places: Number of decimal places to display (default: 1)
+        compress: Write a gzip-compressed report, adding ".gz" to file_path
+            unless it already ends with it (default: False)
 
     Returns:
         Path to saved HTML file
@@ -25,53 +29,67 @@ def export_to_html(results: Dict, file_path: str = "audit_report.html", thousand
     has_issues = any(col_data['issues'] for col_data in results['columns'].values())
 
     # Assemble the HTML report from components
-    html = _generate_header(results)
+    parts = [_generate_header(results)]
 
     # Tabs navigation
-    html += """
+    parts.append("""
     <nav class="tabs">
         <div class="tab active" data-tab="summary">Summary</div>
         <div class="tab" data-tab="insights">Insights</div>
         <div class="tab" data-tab="checks">Quality Checks</div>
         <div class="tab" data-tab="metadata">Metadata</div>
     </nav>
-    """
+    """)
 
     # Summary tab (metadata cards and column summary)
-    html += _generate_metadata_cards(results, has_issues)
-    html += _generate_column_summary_table(results)
-    html += """
+    parts.append(_generate_metadata_cards(results, has_issues))
+    parts.append(_generate_column_summary_table(results))
+    parts.append("""
     </section>
-    """
+    """)
 
-    # Insights tab (column insights only)
-    html += f"""
+    # Insights tab (column insights only). The two largest sections are
+    # written between their wrapper tags rather than copied into them, and
+    # the insights are kept as fragments instead of being joined first
+    parts.append("""
     <section id="insights" class="tab-content">
-        {_generate_column_insights(results, thousand_separator, decimal_places)}
+        """)
+    parts.extend(_iter_column_insights(results, thousand_separator, decimal_places))
+    parts.append("""
     </section>
-    """
+    """)
 
     # Quality Checks tab
-    html += f"""
+    parts.append("""
     <section id="checks" class="tab-content">
-        {_generate_issues_section(results, has_issues)}
+        """)
+    parts.append(_generate_issues_section(results, has_issues))
+    parts.append("""
     </section>
-    """
+    """)
 
     # Metadata tab
-    html += _generate_metadata_section(results)
+    parts.append(_generate_metadata_section(results))
 
     # Footer
-    html += """
+    parts.append("""
     <div class="footer">
         <p>Generated by SecureTableAuditor</p>
     </div>
 </body>
 </html>
-"""
+""")
+
+    if compress:
+        if not file_path.endswith('.gz'):
+            file_path += '.gz'
+        out = gzip.open(file_path, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        out = open(file_path, 'w', encoding='utf-8')
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    with out as f:
+        # Write the sections as they are instead of joining them into one more copy
+        f.writelines(parts)
 
     print(f"📄 HTML report saved to: {file_path}")
     return file_path
@@ -26,6 +26,21 @@ def meta_item(label: str, value: str, mono: bool = False) -> str:
 """
 
 
+# Badge markup depends only on the status, so it is rendered once here
+_STATUS_BADGES = {
+    status: f'<span class="badge {badge_class}">{badge_text}</span>'
+    for status, (badge_class, badge_text) in {
+        'OK': ('badge-ok', 'OK'),
+        'ERROR': ('badge-error', 'Error'),
+        'NO_CHECKS': ('badge-no-checks', 'No Checks'),
+        'NOT_CHECKED': ('badge-not-checked', 'Not Checked'),
+        'SKIPPED_COMPLEX_TYPE': ('badge-skipped', 'Skipped'),
+        'NOT_LOADED': ('badge-not-loaded', 'Not Loaded'),
+    }.items()
+}
+_NA_BADGE = '<span class="badge badge-na">N/A</span>'
+
+
 def status_badge(status: str) -> str:
     """
     Generate a status badge
@@ -36,17 +51,7 @@ def status_badge(status: str) -> str:
     Returns:
         HTML string with badge
     """
-    badge_map = {
-        'OK': ('badge-ok', 'OK'),
-        'ERROR': ('badge-error', 'Error'),
-        'NO_CHECKS': ('badge-no-checks', 'No Checks'),
-        'NOT_CHECKED': ('badge-not-checked', 'Not Checked'),
-        'SKIPPED_COMPLEX_TYPE': ('badge-skipped', 'Skipped'),
-        'NOT_LOADED': ('badge-not-loaded', 'Not Loaded'),
-    }
-
-    badge_class, badge_text = badge_map.get(status, ('badge-na', 'N/A'))
-    return f'<span class="badge {badge_class}">{badge_text}</span>'
+    return _STATUS_BADGES.get(status, _NA_BADGE)
 
 
 def info_box(content: str, box_type: str = 'success') -> str:
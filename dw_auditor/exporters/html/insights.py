@@ -2,7 +2,7 @@
 Column insights rendering (string/numeric/datetime insights for the Insights tab)
 """
 
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterator, List
 
 
 def _insights_to_dict(insights: List[Dict]) -> Dict:
@@ -49,15 +49,15 @@ def _insights_to_dict(insights: List[Dict]) -> Dict:
 def _render_string_insights(insights: List[Any]) -> str:
     """Render string column insights"""
     insights_dict = _insights_to_dict(insights)
-    html = ""
+    parts = []
 
     # Top values with visual bar chart
     if 'top_values' in insights_dict and insights_dict['top_values']:
-        html += """
+        parts.append("""
             <div class="insight-section">
                 <h4 class="insight-header">Top Values:</h4>
                 <div class="insight-content">
-"""
+""")
         for item in insights_dict['top_values']:
             value_str = str(item['value'])
             full_value = value_str
@@ -74,7 +74,7 @@ def _render_string_insights(insights: List[Any]) -> str:
             else:
                 bar_color = '#93c5fd'
 
-            html += f"""
+            parts.append(f"""
                     <div class="top-value-item" style="background: linear-gradient(to right, {bar_color} 0%, {bar_color} {bar_width}%, #f3f4f6 {bar_width}%, #f3f4f6 100%);" title="{full_value}">
                         <span class="top-value-label"><code>{value_str}</code></span>
                         <div class="top-value-stats">
@@ -82,26 +82,26 @@ def _render_string_insights(insights: List[Any]) -> str:
                             <span class="top-value-pct">{item['percentage']:.1f}%</span>
                         </div>
                     </div>
-"""
-        html += """
+""")
+        parts.append("""
                 </div>
             </div>
-"""
+""")
 
     # Length statistics
     if 'length_stats' in insights_dict:
         stats = insights_dict['length_stats']
-        html += """
+        parts.append("""
             <div class="mb-10">
                 <span class="text-muted text-sm" style="margin-right: 8px;">Length:</span>
-"""
+""")
         for stat_name, stat_value in stats.items():
-            html += f"""<span class="stat-pill"><span class="stat-pill-label">{stat_name}:</span> <span class="stat-pill-value">{stat_value}</span></span>"""
-        html += """
+            parts.append(f"""<span class="stat-pill"><span class="stat-pill-label">{stat_name}:</span> <span class="stat-pill-value">{stat_value}</span></span>""")
+        parts.append("""
             </div>
-"""
+""")
 
-    return html
+    return "".join(parts)
 
 
 def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",", decimal_places: int = 1) -> str:
@@ -113,31 +113,14 @@ def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",",
         decimal_places: Number of decimal places to display (default: 1)
     """
     insights_dict = _insights_to_dict(insights)
-    html = ""
+    parts = []
 
     def format_number(value: float, separator: str = thousand_separator, decimals: int = decimal_places) -> str:
         """Format number with configurable thousand separator and decimal places"""
-        # Format with specified decimal places
-        formatted = f"{value:.{decimals}f}"
-        # Split into integer and decimal parts
-        parts = formatted.split('.')
-        int_part = parts[0]
-        dec_part = parts[1] if len(parts) > 1 else None
-
-        # Handle negative numbers
-        int_part = int_part.lstrip('-')
-        is_negative = value < 0
-
-        # Add separator every 3 digits from right to left
-        int_with_sep = separator.join([int_part[max(0, i-3):i] for i in range(len(int_part), 0, -3)][::-1])
-
-        # Build result
-        if decimals > 0 and dec_part:
-            result = f"{int_with_sep}.{dec_part}"
-        else:
-            result = int_with_sep
-
-        return f"-{result}" if is_negative else result
+        # Group digits with the "," format spec, then swap in the separator;
+        # + 0 turns -0.0 into 0.0, which is printed without a sign
+        formatted = f"{value + 0:,.{decimals}f}"
+        return formatted if separator == ',' else formatted.replace(',', separator)
 
     # Check if we have any numeric insights to display
     has_stats = any(key in insights_dict for key in ['min', 'max', 'mean', 'median', 'std', 'quantiles'])
@@ -172,14 +155,14 @@ def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",",
         if min_val is not None and max_val is not None:
             value_range = max_val - min_val if max_val != min_val else 1
 
-            html += """
+            parts.append("""
             <div class="insight-section">
                 <h4 class="insight-header">Distribution Range:</h4>
                 <div class="insight-content p-12">
                     <div class="distribution-container">
                         <!-- Range bar -->
                         <div class="distribution-gradient"></div>
-"""
+""")
 
             # Calculate positions for all stats
             stats_data = []
@@ -199,17 +182,17 @@ def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",",
             # Render all visual markers first (adjusted for new bar position at top: 30px)
             for stat in stats_data:
                 if stat['marker'] == 'line':
-                    html += f"""
+                    parts.append(f"""
                         <div class="distribution-marker" style="left: {stat['pos']}%;"></div>
-"""
+""")
                 elif stat['marker'] == 'thick_line':
-                    html += f"""
+                    parts.append(f"""
                         <div class="distribution-marker-bold" style="left: {stat['pos']}%;"></div>
-"""
+""")
                 elif stat['marker'] == 'dot':
-                    html += f"""
+                    parts.append(f"""
                         <div class="distribution-marker-mean" style="left: {stat['pos']}%;"></div>
-"""
+""")
 
             # Create labels for all stats (no grouping, just individual labels)
             all_labels = []
@@ -245,83 +228,80 @@ def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",",
             # Sort by row and position
             all_labels.sort(key=lambda x: (x['row'], x['pos']))
 
-            # Assign vertical offsets to prevent overlap within each row
+            # Assign vertical offsets to prevent overlap within each row and
+            # render the labels, in one sweep over the sorted labels
             LABEL_WIDTH_ESTIMATE = 20  # Estimate ~20% width per label (increased for safety)
+            current_row = None
 
-            for row_type in ['top', 'bottom']:
-                row_labels = [l for l in all_labels if l['row'] == row_type]
-
-                # Track which vertical offset to use (0, 1, 2...)
-                offset_idx = 0
-                last_end_pos = -100  # Track where last label ended
-
-                for label in row_labels:
-                    # Check if this label would overlap with previous
-                    if label['pos'] - LABEL_WIDTH_ESTIMATE/2 < last_end_pos:
-                        # Overlap detected - use next vertical offset
-                        offset_idx = 1 if offset_idx == 0 else 0
-                    else:
-                        # No overlap - reset to primary position
-                        offset_idx = 0
-
-                    label['v_offset'] = offset_idx
-                    last_end_pos = label['pos'] + LABEL_WIDTH_ESTIMATE/2
-
-            # Render labels with vertical stacking
             for label in all_labels:
+                if label['row'] != current_row:
+                    # New row - track which vertical offset to use (0, 1, 2...)
+                    current_row = label['row']
+                    offset_idx = 0
+                    last_end_pos = -100  # Track where last label ended
+
+                # Check if this label would overlap with previous
+                if label['pos'] - LABEL_WIDTH_ESTIMATE/2 < last_end_pos:
+                    # Overlap detected - use next vertical offset
+                    offset_idx = 1 if offset_idx == 0 else 0
+                else:
+                    # No overlap - reset to primary position
+                    offset_idx = 0
+                last_end_pos = label['pos'] + LABEL_WIDTH_ESTIMATE/2
+
                 if label['row'] == 'top':
                     # Top row: primary at 5px, secondary at 15px (ensures labels stay within container)
-                    y_pos = '5px' if label['v_offset'] == 0 else '15px'
+                    y_pos = '5px' if offset_idx == 0 else '15px'
                 else:
                     # Bottom row: primary at 60px, secondary at 70px (below the axis bar)
-                    y_pos = '60px' if label['v_offset'] == 0 else '70px'
+                    y_pos = '60px' if offset_idx == 0 else '70px'
 
                 # Handle edge labels (Min at 0%, Max at 100%) with proper alignment
                 if label.get('is_edge'):
                     if label['pos'] == 0:
                         # Min label - left aligned
-                        html += f"""
+                        parts.append(f"""
                         <div class="distribution-label distribution-label-left" style="top: {y_pos}; color: {label['color']};">{label['label']}</div>
-"""
+""")
                     else:
                         # Max label - right aligned
-                        html += f"""
+                        parts.append(f"""
                         <div class="distribution-label distribution-label-right" style="top: {y_pos}; color: {label['color']};">{label['label']}</div>
-"""
+""")
                 else:
                     # Regular labels - center aligned
-                    html += f"""
+                    parts.append(f"""
                         <div class="distribution-label" style="top: {y_pos}; left: {label['pos']}%; transform: translateX(-50%); color: {label['color']};">{label['label']}</div>
-"""
+""")
 
-            html += """
+            parts.append("""
                     </div>
-"""
+""")
 
             # Additional stats row (std dev)
             if std is not None:
-                html += f"""
+                parts.append(f"""
                     <div class="std-footer">
                         <span><span class="text-bold">σ (Std Dev):</span> {std:.2f}</span>
                     </div>
-"""
+""")
 
-            html += """
+            parts.append("""
                 </div>
             </div>
-"""
+""")
 
     # Histogram visualization
     if 'histogram' in insights_dict and insights_dict['histogram']:
         buckets = insights_dict['histogram']
         max_count = max(bucket['count'] for bucket in buckets) if buckets else 1
 
-        html += """
+        parts.append("""
             <div class="insight-section" style="margin-top: 20px;">
                 <h4 class="insight-header">Distribution Histogram:</h4>
                 <div class="insight-content" style="padding: 15px;">
                     <div style="display: flex; align-items: flex-end; justify-content: space-between; height: 200px; gap: 2px; padding: 15px;">
-"""
+""")
 
         for bucket in buckets:
             bar_height = (bucket['count'] / max_count * 100) if max_count > 0 else 0
@@ -337,16 +317,16 @@ def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",",
             else:
                 bar_color = '#3b82f6'  # Blue
 
-            html += f"""
+            parts.append(f"""
                         <div style="flex: 1; height: 100%; display: flex; flex-direction: column; align-items: center; justify-content: flex-end; position: relative;">
                             <span style="position: absolute; top: -20px; font-size: 0.75em; color: #374151; font-weight: 600;">{bucket['percentage']:.1f}%</span>
                             <div style="width: 100%; height: {bar_height}%; background: {bar_color}; border-radius: 4px 4px 0 0; position: relative; display: flex; flex-direction: column; justify-content: flex-end; align-items: center; transition: all 0.2s; cursor: pointer;" onmouseover="this.style.opacity='0.7'" onmouseout="this.style.opacity='1'" title="{bucket['bucket']}: {format_number(bucket['count'])} ({bucket['percentage']:.1f}%)">
                                 <span style="font-size: 0.7em; color: #1f2937; font-weight: 600; writing-mode: vertical-rl; text-orientation: mixed; padding: 4px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{bucket['bucket']}</span>
                             </div>
                         </div>
-"""
+""")
 
-        html += """
+        parts.append("""
                     </div>
                     <div class="std-footer">
                         <span><span class="text-bold">Buckets:</span> """ + str(len(buckets)) + """</span>
@@ -354,14 +334,14 @@ def _render_numeric_insights(insights: List[Any], thousand_separator: str = ",",
                     </div>
                 </div>
             </div>
-"""
-    return html
+""")
+    return "".join(parts)
 
 
 def _render_datetime_insights(insights: List[Any]) -> str:
     """Render datetime column insights"""
     insights_dict = _insights_to_dict(insights)
-    html = ""
+    parts = []
 
     # Date range - visual timeline
     if 'min_date' in insights_dict and 'max_date' in insights_dict:
@@ -375,7 +355,7 @@ def _render_datetime_insights(insights: List[Any]) -> str:
         else:
             duration_text = f"{days:,} days"
 
-        html += f"""
+        parts.append(f"""
             <div style="margin-bottom: 15px;">
                 <h4 style="margin: 10px 0 8px 0; color: #6b7280; font-size: 0.95em;">Date Range:</h4>
                 <div style="background: white; padding: 12px; border-radius: 6px; border: 1px solid #e5e7eb;">
@@ -400,22 +380,22 @@ def _render_datetime_insights(insights: List[Any]) -> str:
                     </div>
                 </div>
             </div>
-"""
+""")
     elif 'min_date' in insights_dict or 'max_date' in insights_dict:
         # Fallback for incomplete date range
-        html += """
+        parts.append("""
             <div style="margin-bottom: 15px;">
                 <h4 style="margin: 10px 0 8px 0; color: #6b7280; font-size: 0.95em;">Date Range:</h4>
                 <div style="background: white; padding: 10px 12px; border-radius: 6px; border: 1px solid #e5e7eb; font-size: 0.9em;">
-"""
+""")
         if 'min_date' in insights_dict:
-            html += f"""<strong>From:</strong> {insights_dict['min_date']}<br>"""
+            parts.append(f"""<strong>From:</strong> {insights_dict['min_date']}<br>""")
         if 'max_date' in insights_dict:
-            html += f"""<strong>To:</strong> {insights_dict['max_date']}"""
-        html += """
+            parts.append(f"""<strong>To:</strong> {insights_dict['max_date']}""")
+        parts.append("""
                 </div>
             </div>
-"""
+""")
 
     # Timezone - compact inline display
     if 'timezone' in insights_dict:
@@ -425,22 +405,22 @@ def _render_datetime_insights(insights: List[Any]) -> str:
         else:
             tz_display = tz_value
 
-        html += f"""
+        parts.append(f"""
             <div style="margin-bottom: 15px;">
                 <div style="background: white; padding: 8px 12px; border-radius: 6px; border: 1px solid #e5e7eb; display: inline-flex; align-items: center; gap: 8px;">
                     <span style="color: #6b7280; font-size: 0.8em; font-weight: 600;">Timezone:</span>
                     <span style="color: #1f2937; font-size: 0.85em; font-weight: 500;">{tz_display}</span>
                 </div>
             </div>
-"""
+""")
 
     # Most common dates
     if 'most_common_dates' in insights_dict and insights_dict['most_common_dates']:
-        html += """
+        parts.append("""
             <div style="margin-bottom: 15px;">
                 <h4 style="margin: 10px 0 8px 0; color: #6b7280; font-size: 0.95em;">Most Common Dates:</h4>
                 <div style="background: white; padding: 10px; border-radius: 6px; border: 1px solid #e5e7eb;">
-"""
+""")
         for item in insights_dict['most_common_dates']:
             bar_width = item['percentage']
 
@@ -451,7 +431,7 @@ def _render_datetime_insights(insights: List[Any]) -> str:
             else:
                 bar_color = '#6ee7b7'
 
-            html += f"""
+            parts.append(f"""
                     <div style="background: linear-gradient(to right, {bar_color} 0%, {bar_color} {bar_width}%, #f3f4f6 {bar_width}%, #f3f4f6 100%);
                                 border-radius: 4px; padding: 6px 10px; margin: 3px 0;
                                 font-size: 0.9em; position: relative; overflow: hidden;">
@@ -459,19 +439,19 @@ def _render_datetime_insights(insights: List[Any]) -> str:
                         <span style="float: right; font-weight: bold; color: #1f2937; margin-left: 8px;">{item['percentage']:.1f}%</span>
                         <span style="float: right; color: #6b7280;">({item['count']:,})</span>
                     </div>
-"""
-        html += """
+""")
+        parts.append("""
                 </div>
             </div>
-"""
+""")
 
     # Most common days of week
     if 'most_common_days' in insights_dict and insights_dict['most_common_days']:
-        html += """
+        parts.append("""
             <div style="margin-bottom: 15px;">
                 <h4 style="margin: 10px 0 8px 0; color: #6b7280; font-size: 0.95em;">Most Common Days of Week:</h4>
                 <div style="background: white; padding: 10px; border-radius: 6px; border: 1px solid #e5e7eb;">
-"""
+""")
         for item in insights_dict['most_common_days']:
             bar_width = item['percentage']
 
@@ -482,7 +462,7 @@ def _render_datetime_insights(insights: List[Any]) -> str:
             else:
                 bar_color = '#c4b5fd'
 
-            html += f"""
+            parts.append(f"""
                     <div style="background: linear-gradient(to right, {bar_color} 0%, {bar_color} {bar_width}%, #f3f4f6 {bar_width}%, #f3f4f6 100%);
                                 border-radius: 4px; padding: 6px 10px; margin: 3px 0;
                                 font-size: 0.9em; position: relative; overflow: hidden;">
@@ -490,19 +470,19 @@ def _render_datetime_insights(insights: List[Any]) -> str:
                         <span style="float: right; font-weight: bold; color: #1f2937; margin-left: 8px;">{item['percentage']:.1f}%</span>
                         <span style="float: right; color: #6b7280;">({item['count']:,})</span>
                     </div>
-"""
-        html += """
+""")
+        parts.append("""
                 </div>
             </div>
-"""
+""")
 
     # Most common hours
     if 'most_common_hours' in insights_dict and insights_dict['most_common_hours']:
-        html += """
+        parts.append("""
             <div style="margin-bottom: 15px;">
                 <h4 style="margin: 10px 0 8px 0; color: #6b7280; font-size: 0.95em;">Most Common Hours:</h4>
                 <div style="background: white; padding: 10px; border-radius: 6px; border: 1px solid #e5e7eb;">
-"""
+""")
         for item in insights_dict['most_common_hours']:
             bar_width = item['percentage']
 
@@ -513,7 +493,7 @@ def _render_datetime_insights(insights: List[Any]) -> str:
             else:
                 bar_color = '#fcd34d'
 
-            html += f"""
+            parts.append(f"""
                     <div style="background: linear-gradient(to right, {bar_color} 0%, {bar_color} {bar_width}%, #f3f4f6 {bar_width}%, #f3f4f6 100%);
                                 border-radius: 4px; padding: 6px 10px; margin: 3px 0;
                                 font-size: 0.9em; position: relative; overflow: hidden;">
@@ -521,27 +501,27 @@ def _render_datetime_insights(insights: List[Any]) -> str:
                         <span style="float: right; font-weight: bold; color: #1f2937; margin-left: 8px;">{item['percentage']:.1f}%</span>
                         <span style="float: right; color: #6b7280;">({item['count']:,})</span>
                     </div>
-"""
-        html += """
+""")
+        parts.append("""
                 </div>
             </div>
-"""
+""")
 
-    return html
+    return "".join(parts)
 
 
 def _render_boolean_insights(insights: List[Any]) -> str:
     """Render boolean column insights"""
     insights_dict = _insights_to_dict(insights)
-    html = ""
+    parts = []
 
     # Boolean value distribution with visual bar chart (true/false/null)
     if 'boolean_distribution' in insights_dict and insights_dict['boolean_distribution']:
-        html += """
+        parts.append("""
             <div class="insight-section">
                 <h4 class="insight-header">Value Distribution:</h4>
                 <div class="insight-content">
-"""
+""")
         for item in insights_dict['boolean_distribution']:
             # Format value display
             value = item['value']
@@ -564,7 +544,7 @@ def _render_boolean_insights(insights: List[Any]) -> str:
 
             bar_width = item['percentage']
 
-            html += f"""
+            parts.append(f"""
                     <div class="top-value-item" style="background: linear-gradient(to right, {bar_color} 0%, {bar_color} {bar_width}%, #f3f4f6 {bar_width}%, #f3f4f6 100%);" title="{full_value}">
                         <span class="top-value-label"><code>{value_str}</code></span>
                         <div class="top-value-stats">
@@ -572,17 +552,19 @@ def _render_boolean_insights(insights: List[Any]) -> str:
                             <span class="top-value-pct">{item['percentage']:.1f}%</span>
                         </div>
                     </div>
-"""
-        html += """
+""")
+        parts.append("""
                 </div>
             </div>
-"""
+""")
 
-    return html
+    return "".join(parts)
 
 
-def _generate_column_insights(results: Dict, thousand_separator: str = ",", decimal_places: int = 1) -> str:
-    """Generate the column insights section
+def _iter_column_insights(results: Dict, thousand_separator: str = ",", decimal_places: int = 1) -> Iterator[str]:
+    """Yield the column insights section fragment by fragment
+
+    Lets the exporter write the section without joining it into one string.
 
     Args:
         results: Audit results dictionary
@@ -590,9 +572,9 @@ def _generate_column_insights(results: Dict, thousand_separator: str = ",", deci
         decimal_places: Number of decimal places to display (default: 1)
     """
     if 'column_insights' not in results or not results['column_insights']:
-        return ""
+        return
 
-    html = """
+    yield """
         <h2 style="margin-top: 0; color: #1f2937;">Column Insights</h2>
         <p style="color: #666; margin-bottom: 20px;">Data profiling and distribution analysis</p>
 """
@@ -605,7 +587,7 @@ def _generate_column_insights(results: Dict, thousand_separator: str = ",", deci
         # Get column dtype from column_summary
         dtype = results.get('column_summary', {}).get(col_name, {}).get('dtype', 'unknown')
 
-        html += f"""
+        yield f"""
         <div class="column-card">
             <div class="collapsible-header collapsible-section" onclick="toggleCollapse('{col_id}')">
                 <span class="collapse-icon" id="{col_id}-icon">▼</span>
@@ -616,16 +598,26 @@ def _generate_column_insights(results: Dict, thousand_separator: str = ",", deci
             </div>
             <div class="collapsible-content" id="{col_id}">
 """
-        
-        # Render different insight types
-        html += _render_string_insights(insights)
-        html += _render_numeric_insights(insights, thousand_separator, decimal_places)
-        html += _render_datetime_insights(insights)
-        html += _render_boolean_insights(insights)
-
-        html += """
+
+        # Render different insight types (skipped or errored columns have none)
+        if insights:
+            yield _render_string_insights(insights)
+            yield _render_numeric_insights(insights, thousand_separator, decimal_places)
+            yield _render_datetime_insights(insights)
+            yield _render_boolean_insights(insights)
+
+        yield """
             </div>
         </div>
 """
 
-    return html
+
+def _generate_column_insights(results: Dict, thousand_separator: str = ",", decimal_places: int = 1) -> str:
+    """Generate the column insights section
+
+    Args:
+        results: Audit results dictionary
+        thousand_separator: Character to use as thousand separator (default: ",")
+        decimal_places: Number of decimal places to display (default: 1)
+    """
+    return "".join(_iter_column_insights(results, thousand_separator, decimal_places))
@@ -3,6 +3,10 @@ HTML generation for table relationship visualizations
 """
 
 from typing import List, Dict, Optional, Tuple, Set
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import json
 import math
 
@@ -10,17 +14,601 @@ import math
 from .routing import (
     Grid, LaneRegistry,
     scan_corridors, select_best_corridor,
-    astar_route
+    route_auto, cleanup_waypoints
 )
 
+# Translation table for escaping user-derived text in SVG/XML markup
+_XML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;',
+})
 
-def _get_table_columns_for_diagram(table_name: str, relationships: List[Dict], tables_metadata: Dict[str, Dict]) -> Dict[str, List[str]]:
+
+def _xml_escape(value) -> str:
+    """Escape a value for use in SVG text content or attributes"""
+    return str(value).translate(_XML_ESCAPE)
+
+
+def _escape_names(relationships: List[Dict]) -> Dict[str, str]:
+    """
+    Escape every table and column name of the relationships once
+
+    Args:
+        relationships: Relationship dictionaries
+
+    Returns:
+        Dictionary mapping each name to its escaped form
+    """
+    escaped = {}
+    for rel in relationships:
+        for name in (rel['table1'], rel['column1'], rel['table2'], rel['column2']):
+            if name not in escaped:
+                escaped[name] = _xml_escape(name)
+    return escaped
+
+
+# Percentage thresholds and matching color classes for confidence/overlap badges:
+# orange below 70%, purple from 70%, green from 90% (colors live in assets.py)
+_PCT_THRESHOLDS = (70, 90)
+_PCT_CLASSES = ("conf-low", "conf-mid", "conf-high")
+
+# Relationship type badge classes (colors live in assets.py)
+_TYPE_CLASSES = {
+    "one-to-one": "type-o2o",
+    "many-to-one": "type-m2o",
+    "many-to-many": "type-m2m"
+}
+_DEFAULT_TYPE_CLASS = "type-other"
+
+# Click-to-highlight for SVG diagrams. Relationships are indexed by table once
+# on load, and each click updates every element's classes in a single frame
+_HIGHLIGHT_JS = """
+        (function() {
+            // Canvas mode has no .er-relationship nodes; its own click handler owns the table classes
+            if (document.getElementById('er-canvas')) return;
+
+            const tables = document.querySelectorAll('.er-table');
+            const relationships = document.querySelectorAll('.er-relationship');
+            const adjacency = new Map();  // table name -> [[relationship element, connected table name], ...]
+            let selectedTable = null;
+
+            relationships.forEach(rel => {
+                const table1 = rel.dataset.table1;
+                const table2 = rel.dataset.table2;
+                if (!adjacency.has(table1)) adjacency.set(table1, []);
+                adjacency.get(table1).push([rel, table2]);
+                if (table2 !== table1) {
+                    if (!adjacency.has(table2)) adjacency.set(table2, []);
+                    adjacency.get(table2).push([rel, table1]);
+                }
+            });
+
+            tables.forEach(table => {
+                table.addEventListener('click', function() {
+                    const tableName = this.dataset.table;
+
+                    // Toggle selection
+                    selectedTable = selectedTable === tableName ? null : tableName;
+                    const selected = selectedTable;
+
+                    // Apply all class changes in one frame, one write per element
+                    requestAnimationFrame(() => {
+                        if (selected === null) {
+                            tables.forEach(t => t.classList.remove('highlighted', 'dimmed'));
+                            relationships.forEach(r => r.classList.remove('highlighted', 'dimmed'));
+                            return;
+                        }
+
+                        const related = adjacency.get(selected) || [];
+                        const relatedTables = new Set([selected]);
+                        const relatedRels = new Set();
+                        for (const [rel, connectedTable] of related) {
+                            relatedRels.add(rel);
+                            relatedTables.add(connectedTable);
+                        }
+
+                        tables.forEach(t => {
+                            const hit = relatedTables.has(t.dataset.table);
+                            t.classList.toggle('dimmed', !hit);
+                            t.classList.toggle('highlighted', hit);
+                        });
+                        relationships.forEach(r => {
+                            const hit = relatedRels.has(r);
+                            r.classList.toggle('dimmed', !hit);
+                            r.classList.toggle('highlighted', hit);
+                        });
+                    });
+                });
+            });
+        })();
+"""
+
+# Tip text for _ZOOM_LOD_JS; only shown on pages that include the script
+_ZOOM_HINT = "Ctrl + scroll to zoom."
+
+# Ctrl/Cmd + wheel zoom for the SVG diagram. Below 60% zoom the container is
+# flagged data-zoom="low" and CSS hides the .lod-detail layer (labels, cardinality
+# boxes, column lists), leaving only table headers and relationship paths
+_ZOOM_LOD_JS = """
+        (function() {
+            const svg = document.getElementById('er-diagram');
+            // Canvas mode keeps a fixed-size canvas under the SVG overlay, so no zoom there
+            if (!svg || document.getElementById('er-canvas')) return;
+
+            const container = svg.closest('.er-diagram-container');
+            const baseWidth = parseFloat(svg.getAttribute('width'));
+            const baseHeight = parseFloat(svg.getAttribute('height'));
+            let zoom = 1;
+
+            // Scale through the viewBox so lines and text stay crisp
+            svg.setAttribute('viewBox', '0 0 ' + baseWidth + ' ' + baseHeight);
+            container.dataset.zoom = 'high';
+
+            container.addEventListener('wheel', function(event) {
+                // Plain wheel keeps scrolling the page
+                if (!event.ctrlKey && !event.metaKey) return;
+                event.preventDefault();
+
+                zoom = Math.min(3, Math.max(0.2, zoom * (event.deltaY < 0 ? 1.1 : 1 / 1.1)));
+                svg.setAttribute('width', baseWidth * zoom);
+                svg.setAttribute('height', baseHeight * zoom);
+                container.dataset.zoom = zoom < 0.6 ? 'low' : 'high';
+            }, { passive: false });
+        })();
+"""
+
+# Viewport virtualization for the SVG diagram: tables and relationships scrolled
+# out of view are hidden so the browser skips painting and hit-testing them.
+# visibility (not display) keeps their boxes, so they are reported again on the
+# way back in. The implicit root clips by both the page viewport and the
+# horizontally scrolling .er-diagram-container
+_VIRTUALIZE_JS = """
+        (function() {
+            if (!('IntersectionObserver' in window)) return;
+
+            const observer = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    entry.target.style.visibility = entry.isIntersecting ? '' : 'hidden';
+                });
+            }, { rootMargin: '200px' });
+
+            document.querySelectorAll('.er-relationship, .er-table').forEach(el => observer.observe(el));
+        })();
+"""
+
+# Above this many relationships, render_mode="auto" draws lines on a <canvas>
+_CANVAS_RELATIONSHIP_THRESHOLD = 200
+
+# Client-side renderer for canvas mode: draws relationship paths and labels from
+# the embedded JSON and redraws on table clicks (tables stay in an SVG overlay)
+_CANVAS_RENDERER_JS = """
+        (function() {
+            const canvas = document.getElementById('er-canvas');
+            if (!canvas) return;
+
+            const data = JSON.parse(document.getElementById('er-canvas-data').textContent);
+            const ctx = canvas.getContext('2d');
+            const dpr = window.devicePixelRatio || 1;
+
+            // Scale backing store for sharp lines on high-DPI screens
+            canvas.width = data.width * dpr;
+            canvas.height = data.height * dpr;
+            canvas.style.width = data.width + 'px';
+            canvas.style.height = data.height + 'px';
+            ctx.scale(dpr, dpr);
+
+            const rels = data.relationships.map(r => Object.assign({ path: new Path2D(r.d) }, r));
+            const tablesByName = new Map();
+            document.querySelectorAll('.er-table').forEach(t => tablesByName.set(t.getAttribute('data-table'), t));
+            let selectedTable = null;
+
+            function drawLabel(label, color, highlighted) {
+                const [x, y, w, text, size, weight] = label;
+                ctx.fillStyle = 'white';
+                ctx.strokeStyle = color;
+                ctx.lineWidth = size > 10 ? 1 : 0.5;
+                ctx.beginPath();
+                if (ctx.roundRect) {
+                    ctx.roundRect(x - w / 2, y - 10, w, 20, 3);
+                } else {
+                    ctx.rect(x - w / 2, y - 10, w, 20);
+                }
+                ctx.fill();
+                ctx.stroke();
+                ctx.fillStyle = color;
+                ctx.font = (highlighted ? 700 : weight) + ' ' + size + 'px Inter, sans-serif';
+                ctx.fillText(text, x, y);
+            }
+
+            function draw() {
+                ctx.clearRect(0, 0, data.width, data.height);
+                ctx.textAlign = 'center';
+                ctx.textBaseline = 'middle';
+                rels.forEach(r => {
+                    const related = selectedTable === null || r.t1 === selectedTable || r.t2 === selectedTable;
+                    const highlighted = selectedTable !== null && related;
+                    const color = highlighted ? '#6606dc' : r.color;
+                    ctx.globalAlpha = related ? 1 : 0.2;
+                    ctx.strokeStyle = color;
+                    ctx.lineWidth = highlighted ? 3.5 : r.width;
+                    ctx.stroke(r.path);
+                    r.labels.forEach(label => drawLabel(label, color, highlighted));
+                });
+                ctx.globalAlpha = 1;
+            }
+
+            tablesByName.forEach((table, tableName) => {
+                table.addEventListener('click', function() {
+                    selectedTable = selectedTable === tableName ? null : tableName;
+                    draw();
+
+                    // The SVG click handler stays out of canvas mode, so table classes are set here
+                    if (selectedTable === null) {
+                        tablesByName.forEach(t => t.classList.remove('highlighted', 'dimmed'));
+                        return;
+                    }
+                    const relatedTables = new Set([tableName]);
+                    rels.forEach(r => {
+                        if (r.t1 === tableName) relatedTables.add(r.t2);
+                        if (r.t2 === tableName) relatedTables.add(r.t1);
+                    });
+                    tablesByName.forEach((t, name) => {
+                        const hit = relatedTables.has(name);
+                        t.classList.toggle('dimmed', !hit);
+                        t.classList.toggle('highlighted', hit);
+                    });
+                });
+            });
+
+            draw();
+        })();
+"""
+
+
+# Relationships below this confidence only draw their path in the SVG diagrams;
+# cardinality and column labels are created on hover from data-detail
+_DETAIL_LABEL_MIN_CONFIDENCE = 0.7
+
+# Hover handler building the labels of low-confidence relationships on demand
+# and dropping them again when the pointer leaves
+_LAZY_DETAIL_JS = """
+        (function() {
+            const SVG_NS = 'http://www.w3.org/2000/svg';
+
+            function svgElement(tag, attrs) {
+                const el = document.createElementNS(SVG_NS, tag);
+                for (const name in attrs) el.setAttribute(name, attrs[name]);
+                return el;
+            }
+
+            document.querySelectorAll('.er-relationship[data-detail]').forEach(rel => {
+                const layer = rel.querySelector('.lod-detail');
+
+                rel.addEventListener('mouseenter', function() {
+                    const detail = JSON.parse(rel.dataset.detail);
+                    const frag = document.createDocumentFragment();
+
+                    // Labels are [center_x, center_y, box_width, text, font_size, font_weight]
+                    detail.labels.forEach(([x, y, w, text, size, weight]) => {
+                        frag.appendChild(svgElement('rect', {
+                            x: x - w / 2, y: y - 10, width: w, height: 20, rx: 3,
+                            fill: 'white', stroke: detail.color, 'stroke-width': size > 10 ? 1 : 0.5
+                        }));
+                        const label = svgElement('text', {
+                            x: x, y: y, 'font-family': 'Inter, sans-serif', 'font-size': size,
+                            'font-weight': weight, fill: detail.color,
+                            'text-anchor': 'middle', 'dominant-baseline': 'middle'
+                        });
+                        label.textContent = text;
+                        frag.appendChild(label);
+                    });
+
+                    layer.replaceChildren(frag);
+                });
+                rel.addEventListener('mouseleave', function() {
+                    layer.replaceChildren();
+                });
+            });
+        })();
+"""
+
+
+def _relationship_path_svg(rel: Dict, rel_idx: int, path_d: str, detail: str) -> str:
+    """
+    Build the SVG group of a relationship drawn as a path only (labels built on hover)
+
+    Args:
+        rel: Prepared relationship dictionary
+        rel_idx: Index used for the data-rel-id attribute
+        path_d: SVG path data
+        detail: Escaped JSON label payload for the data-detail attribute
+
+    Returns:
+        SVG markup for the relationship
+    """
+    line_color = rel['line_color']
+    return f"""
+        <g class="er-relationship" data-table1="{rel['table1_label']}" data-table2="{rel['table2_label']}" data-rel-id="rel-{rel_idx}" data-detail="{detail}">
+            <title>{rel['tooltip']}</title>
+            <g class="lod-overview">
+                <path d="{path_d}" stroke="{line_color}" stroke-width="{rel['line_width']}"
+                      fill="none"/>
+            </g>
+            <g class="lod-detail"></g>
+        </g>
+        """
+
+
+def _relationship_svg(rel: Dict, rel_idx: int, path_d: str,
+                      label_start_x: float, label_start_y: float,
+                      label_end_x: float, label_end_y: float,
+                      col_label_x: float, col_label_y: float) -> str:
+    """
+    Build the SVG group of a relationship with its cardinality and column labels
+
+    Args:
+        rel: Prepared relationship dictionary
+        rel_idx: Index used for the data-rel-id attribute
+        path_d: SVG path data
+        label_start_x, label_start_y: Center of the start cardinality label
+        label_end_x, label_end_y: Center of the end cardinality label
+        col_label_x, col_label_y: Center of the column name label
+
+    Returns:
+        SVG markup for the relationship
+    """
+    line_color = rel['line_color']
+    return f"""
+        <g class="er-relationship" data-table1="{rel['table1_label']}" data-table2="{rel['table2_label']}" data-rel-id="rel-{rel_idx}">
+            <title>{rel['tooltip']}</title>
+            <!-- Always visible -->
+            <g class="lod-overview">
+                <path d="{path_d}" stroke="{line_color}" stroke-width="{rel['line_width']}"
+                      fill="none"/>
+            </g>
+            <!-- Hidden when zoomed out (see zoom script) -->
+            <g class="lod-detail">
+                <!-- Cardinality labels with backgrounds -->
+                <rect x="{_fmt_coord(label_start_x - 10)}" y="{_fmt_coord(label_start_y - 10)}" width="20" height="20"
+                      fill="white" stroke="{line_color}" stroke-width="1" rx="3"/>
+                <text x="{_fmt_coord(label_start_x)}" y="{_fmt_coord(label_start_y)}" font-family="Inter, sans-serif" font-size="13" font-weight="700"
+                      fill="{line_color}" text-anchor="middle" dominant-baseline="middle">
+                    {rel['label_start']}
+                </text>
+                <rect x="{_fmt_coord(label_end_x - 10)}" y="{_fmt_coord(label_end_y - 10)}" width="20" height="20"
+                      fill="white" stroke="{line_color}" stroke-width="1" rx="3"/>
+                <text x="{_fmt_coord(label_end_x)}" y="{_fmt_coord(label_end_y)}" font-family="Inter, sans-serif" font-size="13" font-weight="700"
+                      fill="{line_color}" text-anchor="middle" dominant-baseline="middle">
+                    {rel['label_end']}
+                </text>
+                <!-- Column name label with background (no rotation for orthogonal lines) -->
+                <use href="#lbl-{len(rel['column1'])}" x="{_fmt_coord(col_label_x - rel['column1_label_half_width'])}" y="{_fmt_coord(col_label_y - 10)}"
+                     stroke="{line_color}"/>
+                <text x="{_fmt_coord(col_label_x)}" y="{_fmt_coord(col_label_y)}" font-family="Inter, sans-serif" font-size="10"
+                      fill="{line_color}" text-anchor="middle" dominant-baseline="middle" font-weight="500">
+                    {rel['column1_label']}
+                </text>
+            </g>
+        </g>
+        """
+
+
+def _relationship_labels(rel: Dict,
+                         label_start_x: float, label_start_y: float,
+                         label_end_x: float, label_end_y: float,
+                         col_label_x: float, col_label_y: float) -> List[list]:
+    """
+    Build the label list drawn client-side (canvas mode and hover details)
+
+    Args:
+        rel: Prepared relationship dictionary
+        label_start_x, label_start_y: Center of the start cardinality label
+        label_end_x, label_end_y: Center of the end cardinality label
+        col_label_x, col_label_y: Center of the column name label
+
+    Returns:
+        Labels as [center_x, center_y, box_width, text, font_size, font_weight]
+    """
+    return [
+        [math.floor(label_start_x + 0.5), math.floor(label_start_y + 0.5), 20, rel['label_start'], 13, 700],
+        [math.floor(label_end_x + 0.5), math.floor(label_end_y + 0.5), 20, rel['label_end'], 13, 700],
+        [math.floor(col_label_x + 0.5), math.floor(col_label_y + 0.5),
+         rel['column1_label_width'], rel['column1'], 10, 500],
+    ]
+
+
+def _prepare_relationship(rel: Dict, escaped_names: Dict[str, str]) -> Dict:
+    """
+    Compute the display fields derived from a relationship once
+
+    Args:
+        rel: Relationship dictionary
+        escaped_names: Escaped table and column names (see _escape_names)
+
+    Returns:
+        Copy of the relationship with arrow, line style, cardinality labels,
+        confidence tier, escaped name, column label width and tooltip fields added
+    """
+    confidence = rel['confidence']
+    confidence_pct = confidence * 100
+    direction = rel.get('direction')
+    relationship_type = rel['relationship_type']
+
+    if direction == 'table1_to_table2':
+        arrow = "→"
+    elif direction == 'table2_to_table1':
+        arrow = "←"
+    else:
+        arrow = "↔"
+
+    # Line color based on confidence
+    if confidence >= 0.9:
+        line_color, line_width = "#6606dc", 2.5
+    elif confidence >= 0.7:
+        line_color, line_width = "#9ca3af", 2
+    else:
+        line_color, line_width = "#d1d5db", 1.5
+
+    # Cardinality labels (1 or n)
+    if relationship_type == "many-to-one" and direction == "table1_to_table2":
+        label_start, label_end = "n", "1"
+    elif relationship_type == "many-to-one" and direction == "table2_to_table1":
+        label_start, label_end = "1", "n"
+    elif relationship_type == "many-to-many":
+        label_start, label_end = "n", "n"
+    else:
+        label_start, label_end = "1", "1"
+
+    if confidence_pct >= 80:
+        confidence_class = 'confidence-high'
+    elif confidence_pct >= 50:
+        confidence_class = 'confidence-medium'
+    else:
+        confidence_class = 'confidence-low'
+
+    # Column label background is centered on the label position
+    column1_label_width = len(rel['column1']) * 7 + 4
+
+    column1_label = escaped_names[rel['column1']]
+    column2_label = escaped_names[rel['column2']]
+    tooltip = f"{column1_label} ↔ {column2_label}&#10;Confidence: {confidence:.1%}&#10;Type: {_xml_escape(relationship_type)}&#10;Overlap: {rel['overlap_ratio']:.1%}&#10;Matching: {rel['matching_values']:,}"
+
+    return dict(
+        rel,
+        arrow=arrow,
+        line_color=line_color,
+        line_width=line_width,
+        label_start=label_start,
+        label_end=label_end,
+        confidence_pct=confidence_pct,
+        overlap_pct=rel['overlap_ratio'] * 100,
+        confidence_class=confidence_class,
+        table1_label=escaped_names[rel['table1']],
+        table2_label=escaped_names[rel['table2']],
+        column1_label=column1_label,
+        column2_label=column2_label,
+        column1_label_width=column1_label_width,
+        column1_label_half_width=column1_label_width / 2,
+        tooltip=tooltip,
+    )
+
+
+# Above this many relationships, the details table body is shipped as JSON
+# and built in the browser instead of as one <tr> block per relationship
+_DETAILS_CLIENT_RENDER_THRESHOLD = 200
+
+# Client-side renderer for the details table: builds every row into a
+# DocumentFragment and appends it to the <tbody> once
+_DETAILS_TABLE_JS = """
+        (function() {
+            const data = JSON.parse(document.getElementById('rels-data').textContent);
+            const tbody = document.getElementById('rels-tbody');
+            const escapes = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+            const esc = value => String(value).replace(/[&<>"']/g, ch => escapes[ch]);
+            const pctClass = pct => data.classes[data.thresholds.filter(t => t <= pct).length];
+            const frag = document.createDocumentFragment();
+
+            // Rows are [table1, column1, table2, column2, type, matching, overlap %, confidence %, arrow]
+            data.rows.forEach(r => {
+                const typeClass = data.typeClasses[r[4]] || data.defaultTypeClass;
+                const overlapClass = pctClass(r[6]);
+                const confidenceClass = pctClass(r[7]);
+                const tr = document.createElement('tr');
+                tr.innerHTML =
+                    '<td><div class="relationship-cell-table">' + esc(r[0]) + '</div>' +
+                    '<div class="relationship-cell-column">' + esc(r[1]) + '</div></td>' +
+                    '<td class="center arrow">' + r[8] + '</td>' +
+                    '<td><div class="relationship-cell-table">' + esc(r[2]) + '</div>' +
+                    '<div class="relationship-cell-column">' + esc(r[3]) + '</div></td>' +
+                    '<td class="center"><span class="relationship-type-badge ' + typeClass + '">' + esc(r[4]) + '</span></td>' +
+                    '<td class="center relationship-matching">' + r[5].toLocaleString('en-US') + '</td>' +
+                    '<td class="center"><span class="confidence-pct ' + overlapClass + '">' + r[6].toFixed(0) + '%</span></td>' +
+                    '<td><div class="confidence-bar-container"><div class="confidence-bar-bg">' +
+                    '<div class="confidence-bar-fill ' + confidenceClass + '" style="width: ' + r[7].toFixed(1) + '%;"></div>' +
+                    '</div><span class="confidence-pct ' + confidenceClass + '">' + r[7].toFixed(0) + '%</span></div></td>';
+                frag.appendChild(tr);
+            });
+
+            tbody.appendChild(frag);
+        })();
+"""
+
+
+def _diagram_symbols(header_heights: Set[int], label_lengths: Set[int]) -> str:
+    """
+    Build the shared SVG <defs> for table box and column label backgrounds
+
+    Each table box is drawn with a <use> of the symbol matching its header
+    height; the outline stroke is read from CSS custom properties so the
+    highlight styling still reaches into the <use> shadow tree. Column label
+    backgrounds are shared per column name length and take their stroke
+    color from the <use>.
+
+    Args:
+        header_heights: Header heights used by the table boxes
+        label_lengths: Column name lengths of the drawn column labels
+
+    Returns:
+        SVG <defs> element with one symbol per header height and label length
+    """
+    symbols = "".join(f"""
+            <symbol id="er-box-{header_height}" overflow="visible">
+                <rect width="100%" height="100%" fill="white" rx="6"
+                      style="stroke: var(--er-box-stroke, #d1d5db); stroke-width: var(--er-box-stroke-width, 1.5);"/>
+                <rect width="100%" height="{header_height}" fill="#6606dc" rx="6"/>
+            </symbol>""" for header_height in sorted(header_heights))
+    # Same width formula as the column1_label_width prepared field
+    symbols += "".join(f"""
+            <symbol id="lbl-{length}" overflow="visible">
+                <rect width="{length * 7 + 4}" height="20" fill="white" rx="3" stroke-width="0.5"/>
+            </symbol>""" for length in sorted(label_lengths))
+    return f"""
+        <defs>{symbols}
+        </defs>"""
+
+
+def _index_relationships(relationships: List[Dict]) -> Tuple[Set[str], Dict[Tuple[str, str], List[Dict]], Dict[str, Set[str]]]:
+    """
+    Index relationships for diagram building in a single pass
+
+    Args:
+        relationships: Relationships to display
+
+    Returns:
+        Tuple of (tables involved, relationships grouped by sorted table pair,
+        columns involved in relationships per table)
+    """
+    tables = set()
+    table_pair_rels = defaultdict(list)
+    relationship_columns = defaultdict(set)
+
+    for rel in relationships:
+        table1 = rel['table1']
+        table2 = rel['table2']
+        tables.add(table1)
+        tables.add(table2)
+
+        # Consistent key for table pair (always sorted to avoid duplicates)
+        pair_key = (table1, table2) if table1 <= table2 else (table2, table1)
+        table_pair_rels[pair_key].append(rel)
+
+        relationship_columns[table1].add(rel['column1'])
+        if table2 != table1:
+            relationship_columns[table2].add(rel['column2'])
+
+    return tables, table_pair_rels, relationship_columns
+
+
+def _get_table_columns_for_diagram(table_name: str, relationship_columns: Set[str], tables_metadata: Dict[str, Dict]) -> Dict[str, List[str]]:
     """
     Extract columns to display in ER diagram for a table
 
     Args:
         table_name: Name of the table
-        relationships: All relationships
+        relationship_columns: Columns of this table involved in relationships
         tables_metadata: Table metadata with primary key info
 
     Returns:
@@ -32,16 +620,8 @@ def _get_table_columns_for_diagram(table_name: str, relationships: List[Dict], t
     if isinstance(pk_columns, str):
         pk_columns = [pk_columns]
 
-    # Get foreign key columns (columns involved in relationships)
-    fk_columns = set()
-    for rel in relationships:
-        if rel['table1'] == table_name:
-            fk_columns.add(rel['column1'])
-        elif rel['table2'] == table_name:
-            fk_columns.add(rel['column2'])
-
-    # Remove PKs from FK list (they'll be shown as PK)
-    fk_columns = fk_columns - set(pk_columns)
+    # Foreign key columns are the relationship columns, minus PKs (shown as PK)
+    fk_columns = relationship_columns - set(pk_columns)
 
     return {
         'pk': pk_columns,
@@ -50,7 +630,7 @@ def _get_table_columns_for_diagram(table_name: str, relationships: List[Dict], t
     }
 
 
-def _calculate_table_positions(tables: List[str], num_cols: int = 3) -> Dict[str, Tuple[int, int]]:
+def _calculate_table_positions(tables: List[str], num_cols: int = 3) -> Tuple[Dict[str, Tuple[int, int]], int, int]:
     """
     Calculate grid positions for tables
 
@@ -59,9 +639,11 @@ def _calculate_table_positions(tables: List[str], num_cols: int = 3) -> Dict[str
         num_cols: Number of columns in grid
 
     Returns:
-        Dict mapping table name to (x, y) position
+        Tuple of (dict mapping table name to (x, y) position, largest x, largest y)
     """
     positions = {}
+    max_x = 0
+    max_y = 0
     table_width = 280
     table_height = 200
     h_spacing = 150
@@ -73,8 +655,37 @@ def _calculate_table_positions(tables: List[str], num_cols: int = 3) -> Dict[str
         x = 50 + col * (table_width + h_spacing)
         y = 50 + row * (table_height + v_spacing)
         positions[table] = (x, y)
+        if x > max_x:
+            max_x = x
+        if y > max_y:
+            max_y = y
+
+    return positions, max_x, max_y
 
-    return positions
+
+def _table_anchor_points(positions: Dict[str, Tuple[int, int]],
+                         box_width: int = 280, box_height: int = 150) -> Dict[str, Tuple[int, int, int, int, int, int]]:
+    """
+    Precompute the center and edge coordinates of every table box once
+
+    Args:
+        positions: Dictionary mapping table names to (x, y) positions
+        box_width: Nominal box width used for edge connections
+        box_height: Nominal box height used for edge connections
+
+    Returns:
+        Dictionary mapping table names to (center_x, center_y, left, right, top, bottom)
+    """
+    half_width = box_width // 2
+    return {
+        table: (x + half_width, y + 100, x, x + box_width, y, y + box_height)
+        for table, (x, y) in positions.items()
+    }
+
+
+def _fmt_coord(value: float) -> str:
+    """Format an SVG attribute coordinate as the nearest integer pixel"""
+    return str(math.floor(value + 0.5))
 
 
 def _snap_to_grid(value: float, grid_size: int = 10) -> float:
@@ -162,14 +773,13 @@ def _boxes_overlap_segment(box_list: List[Tuple[float, float, float, float]],
     return False
 
 
-def _create_orthogonal_path(start_x: float, start_y: float, start_side: str,
-                            end_x: float, end_y: float, end_side: str,
-                            lane_offset: float, all_boxes: List[Tuple[float, float, float, float]],
-                            corner_radius: int = 4,
-                            grid: Optional[Grid] = None,
-                            lane_registry: Optional[LaneRegistry] = None) -> Tuple[str, List[Tuple[float, float]]]:
+def _route_orthogonal_waypoints(start_x: float, start_y: float, start_side: str,
+                                end_x: float, end_y: float, end_side: str,
+                                lane_offset: float, all_boxes: List[Tuple[float, float, float, float]],
+                                grid: Optional[Grid] = None,
+                                lane_registry: Optional[LaneRegistry] = None) -> List[Tuple[float, float]]:
     """
-    Create an orthogonal path using grid-based A* routing with collision avoidance.
+    Route an orthogonal connection through a free corridor, falling back to grid A*
 
     Args:
         start_x, start_y: Starting point on box edge
@@ -178,12 +788,11 @@ def _create_orthogonal_path(start_x: float, start_y: float, start_side: str,
         end_side: Side of ending box
         lane_offset: Offset for parallel lines (lane system)
         all_boxes: List of (x, y, w, h) for all table boxes for collision detection
-        corner_radius: Radius for rounded corners (3-6px)
         grid: Optional pre-configured Grid (creates new if None)
-        lane_registry: Optional LaneRegistry for global lane management
+        lane_registry: Optional LaneRegistry consulted for lane usage (not updated)
 
     Returns:
-        Tuple of (SVG path string, list of label positions on straight segments)
+        Raw waypoints from start to end, rounded to whole pixels
     """
     # Dynamic clearance based on obstacle density
     obstacle_count_between = sum(
@@ -223,17 +832,6 @@ def _create_orthogonal_path(start_x: float, start_y: float, start_side: str,
         entry_x = end_x
         entry_y = end_y + clearance
 
-    # Initialize grid if not provided
-    if grid is None:
-        # Estimate canvas size from boxes
-        max_x = max((bx + bw for bx, by, bw, bh in all_boxes), default=1500)
-        max_y = max((by + bh for bx, by, bw, bh in all_boxes), default=1000)
-        grid = Grid(max_x + 200, max_y + 200, resolution=30)
-
-        # Mark all boxes as obstacles
-        for box in all_boxes:
-            grid.mark_obstacle(box, margin=20)
-
     # Try corridor scan first (fast for simple cases)
     vertical_corridors, horizontal_corridors = scan_corridors(
         (exit_x, exit_y), (entry_x, entry_y), all_boxes
@@ -281,11 +879,21 @@ def _create_orthogonal_path(start_x: float, start_y: float, start_side: str,
     if corridor_route:
         waypoints = corridor_route
     else:
-        # Fall back to A* routing
+        # Fall back to A* routing (grid is only needed here)
+        if grid is None:
+            # Estimate canvas size from boxes
+            max_x = max((bx + bw for bx, by, bw, bh in all_boxes), default=1500)
+            max_y = max((by + bh for bx, by, bw, bh in all_boxes), default=1000)
+            grid = Grid(max_x + 200, max_y + 200, resolution=30)
+
+            # Mark all boxes as obstacles
+            for box in all_boxes:
+                grid.mark_obstacle(box, margin=20)
+
         start_cell = grid.to_grid(exit_x, exit_y)
         end_cell = grid.to_grid(entry_x, entry_y)
 
-        cell_path = astar_route(start_cell, end_cell, grid, lane_registry)
+        cell_path = route_auto(start_cell, end_cell, grid, lane_registry)
 
         if cell_path:
             # Convert grid cells to canvas coordinates
@@ -300,24 +908,83 @@ def _create_orthogonal_path(start_x: float, start_y: float, start_side: str,
             # A* failed - fallback to simple direct path
             waypoints = [(start_x, start_y), (exit_x, exit_y), (entry_x, entry_y), (end_x, end_y)]
 
-    # Register path segments in lane registry
-    if lane_registry:
-        lane_registry.add_path(waypoints)
+    # Whole pixels keep the emitted path data short
+    return [(round(x), round(y)) for x, y in waypoints]
+
+
+def _offset_route(waypoints: List[Tuple[float, float]],
+                  start: Tuple[float, float], end: Tuple[float, float],
+                  shift_x: float, shift_y: float,
+                  all_boxes: List[Tuple[float, float, float, float]]) -> Optional[List[Tuple[float, float]]]:
+    """
+    Derive a parallel route by translating the interior of an already routed path
+
+    The caller picks the shift so the first and last segments stay orthogonal:
+    the component along each box edge must equal the endpoint offset.
+
+    Args:
+        waypoints: Routed waypoints of the base path
+        start, end: Endpoints of the parallel path on the box edges
+        shift_x, shift_y: Translation applied to the interior waypoints
+        all_boxes: List of (x, y, w, h) for all table boxes for collision detection
+
+    Returns:
+        Translated waypoints, or None if more interior segments cross a box
+        than in the base path
+    """
+    base_interior = waypoints[1:-1]
+    interior = [(x + shift_x, y + shift_y) for x, y in base_interior]
+
+    base_crossings = sum(
+        1 for (x1, y1), (x2, y2) in zip(base_interior, base_interior[1:])
+        if _boxes_overlap_segment(all_boxes, x1, y1, x2, y2)
+    )
+    crossings = 0
+    for (x1, y1), (x2, y2) in zip(interior, interior[1:]):
+        if _boxes_overlap_segment(all_boxes, x1, y1, x2, y2):
+            crossings += 1
+            if crossings > base_crossings:
+                return None
+    return [start] + interior + [end]
+
+
+def _create_orthogonal_path(start_x: float, start_y: float, start_side: str,
+                            end_x: float, end_y: float, end_side: str,
+                            lane_offset: float, all_boxes: List[Tuple[float, float, float, float]],
+                            corner_radius: int = 4,
+                            grid: Optional[Grid] = None,
+                            lane_registry: Optional[LaneRegistry] = None) -> Tuple[str, List[Tuple[float, float]]]:
+    """
+    Create an orthogonal path using grid-based A* routing with collision avoidance.
+
+    Args:
+        start_x, start_y: Starting point on box edge
+        start_side: Side of starting box ('top', 'right', 'bottom', 'left')
+        end_x, end_y: Ending point on box edge
+        end_side: Side of ending box
+        lane_offset: Offset for parallel lines (lane system)
+        all_boxes: List of (x, y, w, h) for all table boxes for collision detection
+        corner_radius: Radius for rounded corners (3-6px)
+        grid: Optional pre-configured Grid (creates new if None)
+        lane_registry: Optional LaneRegistry for global lane management
 
-    # Optimize path
-    from .routing.path_optimizer import (
-        remove_duplicate_points,
-        remove_micro_segments,
-        snap_orthogonal,
-        smooth_corners
+    Returns:
+        Tuple of (SVG path string, list of label positions on straight segments)
+    """
+    waypoints = _route_orthogonal_waypoints(
+        start_x, start_y, start_side,
+        end_x, end_y, end_side,
+        lane_offset, all_boxes,
+        grid=grid,
+        lane_registry=lane_registry
     )
 
-    waypoints = remove_duplicate_points(waypoints)
-    waypoints = remove_micro_segments(waypoints)
-    waypoints = snap_orthogonal(waypoints)
+    # Register path segments in lane registry
+    if lane_registry:
+        lane_registry.add_path(waypoints)
 
-    # Generate SVG with smooth corners
-    path, label_positions = smooth_corners(waypoints, corner_radius)
+    # Optimize path and generate SVG with smooth corners in a single pass
+    path, label_positions = cleanup_waypoints(waypoints, corner_radius)
 
     return path, label_positions
 
@@ -372,6 +1039,8 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
     """
     # Filter relationships by minimum display confidence
     display_relationships = [r for r in relationships if r['confidence'] >= min_confidence]
+    escaped_names = _escape_names(display_relationships)
+    display_relationships = [_prepare_relationship(r, escaped_names) for r in display_relationships]
 
     if not display_relationships:
         return ""
@@ -379,11 +1048,8 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
     # Sort by confidence descending
     display_relationships.sort(key=lambda x: x['confidence'], reverse=True)
 
-    # Get tables involved in relationships
-    tables_in_relationships = set()
-    for rel in display_relationships:
-        tables_in_relationships.add(rel['table1'])
-        tables_in_relationships.add(rel['table2'])
+    # Get tables involved, table pairs and relationship columns in one pass
+    tables_in_relationships, table_pair_rels, relationship_columns = _index_relationships(display_relationships)
 
     tables_list = sorted(tables_in_relationships)
 
@@ -391,15 +1057,16 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
     diagram_html = ""
     if show_diagram:
         # Calculate table positions
-        positions = _calculate_table_positions(tables_list, num_cols=3)
+        positions, max_x, max_y = _calculate_table_positions(tables_list, num_cols=3)
 
         # Calculate SVG canvas size
-        max_x = max(pos[0] for pos in positions.values()) + 300
-        max_y = max(pos[1] for pos in positions.values()) + 250
+        max_x += 300
+        max_y += 250
 
         # Build table boxes SVG and track dimensions for endpoint snapping
-        table_boxes_svg = ""
+        table_boxes_parts = []
         table_dimensions = {}  # Store box dimensions for each table
+        box_header_heights = set()  # One shared box symbol per header height
 
         # Initialize global routing infrastructure for multi-pass routing
         grid = Grid(max_x, max_y, resolution=30)
@@ -407,7 +1074,8 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
 
         for table_name in tables_list:
             x, y = positions[table_name]
-            columns = _get_table_columns_for_diagram(table_name, display_relationships, tables_metadata)
+            table_label = escaped_names[table_name]
+            columns = _get_table_columns_for_diagram(table_name, relationship_columns[table_name], tables_metadata)
 
             # Get metadata
             metadata = tables_metadata.get(table_name, {})
@@ -435,58 +1103,55 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
 
             box_width = 280
             table_dimensions[table_name] = (x, y, box_width, box_height)
+            box_header_heights.add(header_height)
 
             # Create table box
-            table_boxes_svg += f"""
-        <g class="er-table" data-table="{table_name}">
-            <rect x="{x}" y="{y}" width="{box_width}" height="{box_height}"
-                  fill="white" stroke="#d1d5db" stroke-width="1.5" rx="6"/>
-            <rect x="{x}" y="{y}" width="{box_width}" height="{header_height}"
-                  fill="#6606dc" rx="6"/>
-            <rect x="{x}" y="{y + header_height}" width="{box_width}" height="{box_height - header_height}"
-                  fill="white" rx="0"/>
-            <text x="{x + box_width/2}" y="{y + header_height/2 + 2}"
+            table_boxes_parts.append(f"""
+        <g class="er-table" data-table="{table_label}">
+            <use href="#er-box-{header_height}" x="{x}" y="{y}" width="{box_width}" height="{box_height}"/>
+            <text x="{_fmt_coord(x + box_width/2)}" y="{_fmt_coord(y + header_height/2 + 2)}"
                   font-family="Inter, sans-serif" font-size="14" font-weight="600"
-                  fill="white" text-anchor="middle">{table_name}</text>
-            <text x="{x + box_width/2}" y="{y + header_height - 5}"
+                  fill="white" text-anchor="middle">{table_label}</text>
+            <text x="{_fmt_coord(x + box_width/2)}" y="{y + header_height - 5}"
                   font-family="Inter, sans-serif" font-size="10"
                   fill="rgba(255,255,255,0.8)" text-anchor="middle">{row_count_str} rows</text>
-        """
+        """)
 
             # Add columns
             y_offset = y + header_height + 18
             for pk_col in columns['pk']:
-                table_boxes_svg += f"""
-            <text x="{x + 10}" y="{y_offset}"
+                table_boxes_parts.append(f"""
+            <text class="lod-detail" x="{x + 10}" y="{y_offset}"
                   font-family="'Courier New', monospace" font-size="12" font-weight="bold"
-                  fill="#1f2937">🔑 {pk_col}</text>
-        """
+                  fill="#1f2937">🔑 {_xml_escape(pk_col)}</text>
+        """)
                 y_offset += column_spacing
 
             for fk_col in columns['fk']:
-                table_boxes_svg += f"""
-            <text x="{x + 10}" y="{y_offset}"
+                table_boxes_parts.append(f"""
+            <text class="lod-detail" x="{x + 10}" y="{y_offset}"
                   font-family="'Courier New', monospace" font-size="12"
-                  fill="#4b5563">{fk_col}</text>
-        """
+                  fill="#4b5563">{_xml_escape(fk_col)}</text>
+        """)
                 y_offset += column_spacing
 
-            table_boxes_svg += "</g>"
+            table_boxes_parts.append("</g>")
+
+        # Column label backgrounds are only drawn for relationships with full detail
+        label_lengths = {len(r['column1']) for r in display_relationships
+                         if r['confidence'] >= _DETAIL_LABEL_MIN_CONFIDENCE}
+        table_boxes_svg = _diagram_symbols(box_header_heights, label_lengths) + "".join(table_boxes_parts)
 
         # Mark all table boxes as obstacles in the grid
         for box in table_dimensions.values():
             grid.mark_obstacle(box, margin=20)
 
-        # Group relationships by table pair to handle multiple relationships between same tables
-        from collections import defaultdict
-        table_pair_rels = defaultdict(list)
-        for rel in display_relationships:
-            # Create consistent key for table pair (always sort to avoid duplicates)
-            pair_key = tuple(sorted([rel['table1'], rel['table2']]))
-            table_pair_rels[pair_key].append(rel)
+        # Box dimensions are fixed from here on; collect them once for collision detection
+        all_box_dims = list(table_dimensions.values())
 
-        # Build relationship lines with crow's foot notation
-        relationship_lines_svg = ""
+        # Build relationship lines with crow's foot notation, one table pair at a time
+        # so multiple relationships between the same tables get parallel offsets
+        relationship_lines_parts = []
         rel_idx = 0
         for pair_key, rels in table_pair_rels.items():
             table1, table2 = pair_key
@@ -533,51 +1198,18 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
                 start_x, start_y, start_side = _snap_to_box_edge(box1_x, box1_y, box1_w, box1_h, target_x2, target_y2)
                 end_x, end_y, end_side = _snap_to_box_edge(box2_x, box2_y, box2_w, box2_h, target_x1, target_y1)
 
-                # Line color based on confidence
-                confidence = rel['confidence']
-                if confidence >= 0.9:
-                    line_color = "#6606dc"
-                    line_width = 2.5
-                elif confidence >= 0.7:
-                    line_color = "#9ca3af"
-                    line_width = 2
-                else:
-                    line_color = "#d1d5db"
-                    line_width = 1.5
-
-                # Determine cardinality labels (1 or n)
-                if rel['relationship_type'] == "one-to-one":
-                    label_start = "1"
-                    label_end = "1"
-                elif rel['relationship_type'] == "many-to-one":
-                    if rel.get('direction') == "table1_to_table2":
-                        label_start = "n"
-                        label_end = "1"
-                    elif rel.get('direction') == "table2_to_table1":
-                        label_start = "1"
-                        label_end = "n"
-                    else:
-                        label_start = "1"
-                        label_end = "1"
-                elif rel['relationship_type'] == "many-to-many":
-                    label_start = "n"
-                    label_end = "n"
-                else:
-                    label_start = "1"
-                    label_end = "1"
+                # Route and draw on whole pixels
+                start_x, start_y = round(start_x), round(start_y)
+                end_x, end_y = round(end_x), round(end_y)
 
-                # Build tooltip text
-                tooltip_text = f"{rel['column1']} ↔ {rel['column2']}&#10;Confidence: {confidence:.1%}&#10;Type: {rel['relationship_type']}&#10;Overlap: {rel['overlap_ratio']:.1%}&#10;Matching: {rel['matching_values']:,}"
+                line_color = rel['line_color']
 
                 # Calculate lane offset for multiple parallel relationships
                 if num_rels > 1:
-                    lane_offset = (i - (num_rels - 1) / 2) * 12
+                    lane_offset = round((i - (num_rels - 1) / 2) * 12)
                 else:
                     lane_offset = 0
 
-                # Collect all box dimensions for collision detection
-                all_box_dims = list(table_dimensions.values())
-
                 # Create orthogonal path with collision avoidance
                 path_d, label_positions = _create_orthogonal_path(
                     start_x, start_y, start_side,
@@ -612,20 +1244,22 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
                 # Add offset to prevent overlap with parallel relationship labels
                 if label_positions:
                     # Find the longest segment
-                    max_len = 0
+                    # Squared lengths are enough to pick the longest segment
+                    max_len_sq = 0
                     best_pos = label_positions[0]
                     best_seg_start = None
                     best_seg_end = None
-                    for j in range(len(label_positions) - 1):
-                        seg_len = math.sqrt((label_positions[j+1][0] - label_positions[j][0])**2 +
-                                           (label_positions[j+1][1] - label_positions[j][1])**2)
-                        if seg_len > max_len:
-                            max_len = seg_len
-                            best_seg_start = label_positions[j]
-                            best_seg_end = label_positions[j+1]
+                    for seg_start, seg_end in zip(label_positions, label_positions[1:]):
+                        seg_dx = seg_end[0] - seg_start[0]
+                        seg_dy = seg_end[1] - seg_start[1]
+                        seg_len_sq = seg_dx * seg_dx + seg_dy * seg_dy
+                        if seg_len_sq > max_len_sq:
+                            max_len_sq = seg_len_sq
+                            best_seg_start = seg_start
+                            best_seg_end = seg_end
                             # Place label at midpoint of this segment
-                            best_pos = ((label_positions[j][0] + label_positions[j+1][0]) / 2,
-                                       (label_positions[j][1] + label_positions[j+1][1]) / 2)
+                            best_pos = ((seg_start[0] + seg_end[0]) / 2,
+                                        (seg_start[1] + seg_end[1]) / 2)
 
                     col_label_x, col_label_y = best_pos
 
@@ -644,41 +1278,30 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
                     col_label_x = (start_x + end_x) / 2
                     col_label_y = (start_y + end_y) / 2
 
-                relationship_lines_svg += f"""
-        <g class="er-relationship" data-table1="{rel['table1']}" data-table2="{rel['table2']}" data-rel-id="rel-{rel_idx}">
-            <title>{tooltip_text}</title>
-            <path d="{path_d}" stroke="{line_color}" stroke-width="{line_width}"
-                  fill="none"/>
-            <!-- Cardinality labels with backgrounds -->
-            <rect x="{label_start_x - 10}" y="{label_start_y - 10}" width="20" height="20"
-                  fill="white" stroke="{line_color}" stroke-width="1" rx="3"/>
-            <text x="{label_start_x}" y="{label_start_y}" font-family="Inter, sans-serif" font-size="13" font-weight="700"
-                  fill="{line_color}" text-anchor="middle" dominant-baseline="middle">
-                {label_start}
-            </text>
-            <rect x="{label_end_x - 10}" y="{label_end_y - 10}" width="20" height="20"
-                  fill="white" stroke="{line_color}" stroke-width="1" rx="3"/>
-            <text x="{label_end_x}" y="{label_end_y}" font-family="Inter, sans-serif" font-size="13" font-weight="700"
-                  fill="{line_color}" text-anchor="middle" dominant-baseline="middle">
-                {label_end}
-            </text>
-            <!-- Column name label with background (no rotation for orthogonal lines) -->
-            <rect x="{col_label_x - len(rel['column1']) * 3.5 - 2}" y="{col_label_y - 10}"
-                  width="{len(rel['column1']) * 7 + 4}" height="20"
-                  fill="white" rx="3" stroke="{line_color}" stroke-width="0.5"/>
-            <text x="{col_label_x}" y="{col_label_y}" font-family="Inter, sans-serif" font-size="10"
-                  fill="{line_color}" text-anchor="middle" dominant-baseline="middle" font-weight="500">
-                {rel['column1']}
-            </text>
-        </g>
-        """
+                if rel['confidence'] < _DETAIL_LABEL_MIN_CONFIDENCE:
+                    # Low-confidence relationships only draw their path; labels are built on hover
+                    detail = _xml_escape(json.dumps({
+                        'color': line_color,
+                        'labels': _relationship_labels(rel, label_start_x, label_start_y,
+                                                       label_end_x, label_end_y, col_label_x, col_label_y),
+                    }, separators=(',', ':')))
+                    relationship_lines_parts.append(_relationship_path_svg(rel, rel_idx, path_d, detail))
+                    rel_idx += 1
+                    continue
+
+                relationship_lines_parts.append(_relationship_svg(
+                    rel, rel_idx, path_d,
+                    label_start_x, label_start_y, label_end_x, label_end_y, col_label_x, col_label_y
+                ))
                 rel_idx += 1
 
+        relationship_lines_svg = "".join(relationship_lines_parts)
+
         # Build diagram HTML
         diagram_html = f"""
         <!-- ER Diagram with Crow's Foot Notation -->
         <div class="alert-info mb-20">
-            <strong>Interactive ER Diagram:</strong> Click on a table to highlight its relationships. Hover over connection lines to see details.
+            <strong>Interactive ER Diagram:</strong> Click on a table to highlight its relationships. Hover over connection lines to see details. {_ZOOM_HINT}
         </div>
 
         <div class="er-diagram-container">
@@ -704,18 +1327,17 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
                 cursor: pointer;
                 transition: all 0.2s;
             }}
-            .er-table:hover rect {{
+            .er-table:hover use {{
                 filter: brightness(0.95);
             }}
-            .er-table.highlighted rect:first-child {{
-                fill: #5005b8;
-                stroke: #4004a0;
-                stroke-width: 3;
+            .er-table.highlighted use {{
+                --er-box-stroke: #4004a0;
+                --er-box-stroke-width: 3;
             }}
             .er-relationship {{
                 transition: all 0.2s;
             }}
-            .er-relationship.highlighted > path {{
+            .er-relationship.highlighted path {{
                 stroke: #6606dc !important;
                 stroke-width: 3.5 !important;
             }}
@@ -729,63 +1351,18 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
             .er-table.dimmed {{
                 opacity: 0.3;
             }}
+            .er-diagram-container[data-zoom="low"] .lod-detail {{
+                display: none;
+            }}
         </style>
 
-        <script>
-            (function() {{
-                const tables = document.querySelectorAll('.er-table');
-                const relationships = document.querySelectorAll('.er-relationship');
-                let selectedTable = null;
-
-                tables.forEach(table => {{
-                    table.addEventListener('click', function() {{
-                        const tableName = this.getAttribute('data-table');
-
-                        // Toggle selection
-                        if (selectedTable === tableName) {{
-                            // Deselect
-                            selectedTable = null;
-                            tables.forEach(t => t.classList.remove('highlighted', 'dimmed'));
-                            relationships.forEach(r => r.classList.remove('highlighted', 'dimmed'));
-                        }} else {{
-                            // Select
-                            selectedTable = tableName;
-
-                            // Dim all tables and relationships
-                            tables.forEach(t => t.classList.add('dimmed'));
-                            relationships.forEach(r => r.classList.add('dimmed'));
-
-                            // Highlight selected table
-                            this.classList.remove('dimmed');
-                            this.classList.add('highlighted');
-
-                            // Highlight related tables and relationships
-                            relationships.forEach(rel => {{
-                                const table1 = rel.getAttribute('data-table1');
-                                const table2 = rel.getAttribute('data-table2');
-
-                                if (table1 === tableName || table2 === tableName) {{
-                                    rel.classList.remove('dimmed');
-                                    rel.classList.add('highlighted');
-
-                                    // Highlight the connected table
-                                    const connectedTable = table1 === tableName ? table2 : table1;
-                                    tables.forEach(t => {{
-                                        if (t.getAttribute('data-table') === connectedTable) {{
-                                            t.classList.remove('dimmed');
-                                            t.classList.add('highlighted');
-                                        }}
-                                    }});
-                                }}
-                            }});
-                        }}
-                    }});
-                }});
-            }})();
-        </script>
+        <script>{_HIGHLIGHT_JS}        </script>
+        <script>{_LAZY_DETAIL_JS}        </script>
+        <script>{_ZOOM_LOD_JS}        </script>
+        <script>{_VIRTUALIZE_JS}        </script>
         """
 
-    html = f"""
+    parts = [f"""
     <section class="relationships-section">
         <h2 class="relationships-title">
             Table Relationships
@@ -813,60 +1390,57 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
                     <th class="col-confidence">CONFIDENCE</th>
                 </tr>
             </thead>
-            <tbody>
-    """
+            <tbody id="rels-tbody">
+    """]
+
+    if len(display_relationships) > _DETAILS_CLIENT_RENDER_THRESHOLD:
+        details_json = json.dumps({
+            'thresholds': _PCT_THRESHOLDS,
+            'classes': _PCT_CLASSES,
+            'typeClasses': _TYPE_CLASSES,
+            'defaultTypeClass': _DEFAULT_TYPE_CLASS,
+            'rows': [
+                [rel['table1'], rel['column1'], rel['table2'], rel['column2'], rel['relationship_type'],
+                 rel['matching_values'], rel['overlap_pct'], rel['confidence_pct'], rel['arrow']]
+                for rel in display_relationships
+            ],
+        }, separators=(',', ':')).replace('<', '\\u003c')  # Keep "</script>" out of the inline JSON
+
+        parts.append(f"""
+            </tbody>
+        </table>
+        <script type="application/json" id="rels-data">{details_json}</script>
+        <script>{_DETAILS_TABLE_JS}        </script>
+    </section>
+    """)
+        return "".join(parts)
 
     for rel in display_relationships:
-        confidence_pct = rel['confidence'] * 100
-        overlap_pct = rel['overlap_ratio'] * 100
-
-        # Confidence color based on threshold
-        if confidence_pct >= 90:
-            confidence_color = "#10b981"  # Green
-        elif confidence_pct >= 70:
-            confidence_color = "#6606dc"  # Purple
-        else:
-            confidence_color = "#f59e0b"  # Orange
+        confidence_pct = rel['confidence_pct']
+        overlap_pct = rel['overlap_pct']
+        arrow = rel['arrow']
 
-        # Overlap color based on value
-        if overlap_pct >= 90:
-            overlap_color = "#10b981"  # Green
-        elif overlap_pct >= 70:
-            overlap_color = "#6606dc"  # Purple
-        else:
-            overlap_color = "#f59e0b"  # Orange
+        # Confidence and overlap colors based on threshold
+        confidence_class = _PCT_CLASSES[bisect_right(_PCT_THRESHOLDS, confidence_pct)]
+        overlap_class = _PCT_CLASSES[bisect_right(_PCT_THRESHOLDS, overlap_pct)]
 
-        # Determine arrow direction
-        if rel.get('direction') == 'table1_to_table2':
-            arrow = "→"
-        elif rel.get('direction') == 'table2_to_table1':
-            arrow = "←"
-        else:
-            arrow = "↔"
-
-        # Relationship type badge styling
-        type_styles = {
-            "one-to-one": "background: #dbeafe; color: #1e40af;",
-            "many-to-one": "background: #e0e7ff; color: #4338ca;",
-            "many-to-many": "background: #fce7f3; color: #9f1239;"
-        }
-        type_style = type_styles.get(rel['relationship_type'], "background: #f3f4f6; color: #4b5563;")
+        type_class = _TYPE_CLASSES.get(rel['relationship_type'], _DEFAULT_TYPE_CLASS)
 
-        html += f"""
+        parts.append(f"""
                 <tr>
                     <td>
-                        <div class="relationship-cell-table">{rel['table1']}</div>
-                        <div class="relationship-cell-column">{rel['column1']}</div>
+                        <div class="relationship-cell-table">{rel['table1_label']}</div>
+                        <div class="relationship-cell-column">{rel['column1_label']}</div>
                     </td>
                     <td class="center arrow">
                         {arrow}
                     </td>
                     <td>
-                        <div class="relationship-cell-table">{rel['table2']}</div>
-                        <div class="relationship-cell-column">{rel['column2']}</div>
+                        <div class="relationship-cell-table">{rel['table2_label']}</div>
+                        <div class="relationship-cell-column">{rel['column2_label']}</div>
                     </td>
                     <td class="center">
-                        <span class="relationship-type-badge" style="{type_style}">
+                        <span class="relationship-type-badge {type_class}">
                             {rel['relationship_type']}
                         </span>
                     </td>
@@ -874,33 +1448,205 @@ def generate_relationships_summary_section(relationships: List[Dict], tables_met
                         {rel['matching_values']:,}
                     </td>
                     <td class="center">
-                        <span class="confidence-pct" style="color: {overlap_color};">{overlap_pct:.0f}%</span>
+                        <span class="confidence-pct {overlap_class}">{overlap_pct:.0f}%</span>
                     </td>
                     <td>
                         <div class="confidence-bar-container">
                             <div class="confidence-bar-bg">
-                                <div class="confidence-bar-fill" style="width: {confidence_pct:.1f}%; background: {confidence_color};"></div>
+                                <div class="confidence-bar-fill {confidence_class}" style="width: {confidence_pct:.1f}%;"></div>
                             </div>
-                            <span class="confidence-pct" style="color: {confidence_color};">{confidence_pct:.0f}%</span>
+                            <span class="confidence-pct {confidence_class}">{confidence_pct:.0f}%</span>
                         </div>
                     </td>
                 </tr>
-        """
+        """)
 
-    html += """
+    parts.append("""
             </tbody>
         </table>
     </section>
+    """)
+
+    return "".join(parts)
+
+
+def _route_table_pair(anchor1: Tuple[int, int, int, int, int, int],
+                      anchor2: Tuple[int, int, int, int, int, int],
+                      num_rels: int,
+                      all_boxes: List[Tuple[float, float, float, float]],
+                      grid: Grid,
+                      lane_registry: LaneRegistry) -> Tuple[str, str, List[Tuple]]:
+    """
+    Route every relationship between two tables of the standalone ER diagram
+
+    Args:
+        anchor1, anchor2: Box anchors of both tables (see _table_anchor_points)
+        num_rels: Number of relationships between the two tables
+        all_boxes: List of (x, y, w, h) for all table boxes for collision detection
+        grid: Routing grid with all table boxes marked as obstacles
+        lane_registry: LaneRegistry shared by all paths routed on this grid
+
+    Returns:
+        Tuple of (start side, end side, per-relationship routes) where each route is
+        (start_x, start_y, end_x, end_y, lane_offset, SVG path, label positions)
+    """
+    center_x1, center_y1, left1, right1, top1, bottom1 = anchor1
+    center_x2, center_y2, left2, right2, top2, bottom2 = anchor2
+
+    # Calculate edge connection points
+    dx = center_x2 - center_x1
+    dy = center_y2 - center_y1
+
+    # Determine base connection points and the box sides they sit on
+    if abs(dx) > abs(dy):
+        if dx > 0:
+            base_start_x, base_start_y = right1, center_y1
+            base_end_x, base_end_y = left2, center_y2
+            start_side, end_side = 'right', 'left'
+        else:
+            base_start_x, base_start_y = left1, center_y1
+            base_end_x, base_end_y = right2, center_y2
+            start_side, end_side = 'left', 'right'
+        offset_axis = 'vertical'
+    else:
+        if dy > 0:
+            base_start_x, base_start_y = center_x1, bottom1
+            base_end_x, base_end_y = center_x2, top2
+            start_side, end_side = 'bottom', 'top'
+        else:
+            base_start_x, base_start_y = center_x1, top1
+            base_end_x, base_end_y = center_x2, bottom2
+            start_side, end_side = 'top', 'bottom'
+        offset_axis = 'horizontal'
+
+    # Parallel relationships reuse one routed base path, shifted per lane
+    base_waypoints = None
+
+    # Route each relationship with offset if multiple
+    routes = []
+    for i in range(num_rels):
+        # Calculate offset for multiple relationships
+        if num_rels > 1:
+            offset = round((i - (num_rels - 1) / 2) * 25)
+        else:
+            offset = 0
+
+        # Apply offset
+        if offset_axis == 'vertical':
+            start_x, start_y = base_start_x, base_start_y + offset
+            end_x, end_y = base_end_x, base_end_y + offset
+        else:
+            start_x, start_y = base_start_x + offset, base_start_y
+            end_x, end_y = base_end_x + offset, base_end_y
+
+        # Calculate lane offset for multiple parallel relationships
+        if num_rels > 1:
+            lane_offset = round((i - (num_rels - 1) / 2) * 12)
+        else:
+            lane_offset = 0
+
+        # Create orthogonal path with collision avoidance
+        waypoints = None
+        if num_rels > 1:
+            if base_waypoints is None:
+                base_waypoints = _route_orthogonal_waypoints(
+                    base_start_x, base_start_y, start_side,
+                    base_end_x, base_end_y, end_side,
+                    0, all_boxes,
+                    grid=grid,
+                    lane_registry=lane_registry
+                )
+            # Endpoints move along the box edge; the lane offset separates
+            # the parallel segments running across it
+            if offset_axis == 'vertical':
+                shift_x, shift_y = lane_offset, offset
+            else:
+                shift_x, shift_y = offset, lane_offset
+            waypoints = _offset_route(base_waypoints, (start_x, start_y), (end_x, end_y),
+                                      shift_x, shift_y, all_boxes)
+
+        if waypoints is not None:
+            lane_registry.add_path(waypoints)
+            path_d, label_positions = cleanup_waypoints(waypoints, 4)
+        else:
+            path_d, label_positions = _create_orthogonal_path(
+                start_x, start_y, start_side,
+                end_x, end_y, end_side,
+                lane_offset, all_boxes,
+                corner_radius=4,
+                grid=grid,
+                lane_registry=lane_registry
+            )
+
+        routes.append((start_x, start_y, end_x, end_y, lane_offset, path_d, label_positions))
+
+    return start_side, end_side, routes
+
+
+def _route_component(pairs: List[Tuple[Tuple[str, str], Tuple, Tuple, int]],
+                     all_boxes: List[Tuple[float, float, float, float]],
+                     width: int, height: int) -> Dict[Tuple[str, str], Tuple[str, str, List[Tuple]]]:
+    """
+    Route the table pairs of one connected component on a private grid (worker process entry point)
+
+    Args:
+        pairs: List of (pair key, anchor1, anchor2, number of relationships)
+        all_boxes: List of (x, y, w, h) for all table boxes
+        width, height: Diagram canvas size
+
+    Returns:
+        Dictionary mapping pair keys to _route_table_pair results
+    """
+    grid = Grid(width, height, resolution=30)
+    for box in all_boxes:
+        grid.mark_obstacle(box, margin=20)
+    lane_registry = LaneRegistry()
+
+    return {
+        pair_key: _route_table_pair(anchor1, anchor2, num_rels, all_boxes, grid, lane_registry)
+        for pair_key, anchor1, anchor2, num_rels in pairs
+    }
+
+
+def _connected_components(pair_keys: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """
+    Group table pairs into connected components of the relationship graph
+
+    Args:
+        pair_keys: Table pairs in routing order
+
+    Returns:
+        List of components, each a list of pair keys in their original order
     """
+    parent = {}
 
-    return html
+    def find(table):
+        root = parent.setdefault(table, table)
+        while root != parent[root]:
+            root = parent[root]
+        # Path compression
+        while table != root:
+            parent[table], table = root, parent[table]
+        return root
+
+    for table1, table2 in pair_keys:
+        root1, root2 = find(table1), find(table2)
+        if root1 != root2:
+            parent[root2] = root1
+
+    components = defaultdict(list)
+    for pair_key in pair_keys:
+        components[find(pair_key[0])].append(pair_key)
+    return list(components.values())
 
 
 def generate_standalone_relationships_report(
     relationships: List[Dict],
     tables_metadata: Dict[str, Dict],
     output_path: str,
-    min_confidence_display: float = 0.5
+    min_confidence_display: float = 0.5,
+    render_mode: str = "auto",
+    routing_workers: int = 1
 ) -> None:
     """
     Generate full interactive ER diagram report
@@ -910,36 +1656,51 @@ def generate_standalone_relationships_report(
         tables_metadata: Metadata about tables (row counts, column counts, primary keys)
         output_path: Path to save HTML file
         min_confidence_display: Minimum confidence to display
+        render_mode: How to draw relationship lines: 'svg', 'canvas', or 'auto'
+            (canvas above 200 relationships, where SVG DOM size slows the browser)
+        routing_workers: Worker processes used to route disconnected groups of tables
+            in parallel. Each group then avoids only its own lanes, so paths may differ
+            from serial routing (1, the default)
     """
+    if render_mode not in ('auto', 'svg', 'canvas'):
+        raise ValueError(f"render_mode must be 'auto', 'svg' or 'canvas', got '{render_mode}'")
+    if routing_workers < 1:
+        raise ValueError(f"routing_workers must be at least 1, got {routing_workers}")
+
     # Filter relationships
     display_relationships = [r for r in relationships if r['confidence'] >= min_confidence_display]
+    escaped_names = _escape_names(display_relationships)
+    display_relationships = [_prepare_relationship(r, escaped_names) for r in display_relationships]
     display_relationships.sort(key=lambda x: x['confidence'], reverse=True)
 
-    # Get tables involved in relationships
-    tables_in_relationships = set()
-    for rel in display_relationships:
-        tables_in_relationships.add(rel['table1'])
-        tables_in_relationships.add(rel['table2'])
+    use_canvas = render_mode == 'canvas' or (
+        render_mode == 'auto' and len(display_relationships) > _CANVAS_RELATIONSHIP_THRESHOLD
+    )
+
+    # Get tables involved, table pairs and relationship columns in one pass
+    tables_in_relationships, table_pair_rels, relationship_columns = _index_relationships(display_relationships)
 
     tables_list = sorted(tables_in_relationships)
 
     # Calculate table positions
-    positions = _calculate_table_positions(tables_list, num_cols=4)
+    positions, max_x, max_y = _calculate_table_positions(tables_list, num_cols=4)
 
     # Calculate SVG canvas size
-    max_x = max(pos[0] for pos in positions.values()) + 300
-    max_y = max(pos[1] for pos in positions.values()) + 250
+    max_x += 300
+    max_y += 250
 
     # Initialize global routing infrastructure for multi-pass routing
     grid = Grid(max_x, max_y, resolution=30)
     lane_registry = LaneRegistry()
 
     # Build table boxes SVG
-    table_boxes_svg = ""
+    table_boxes_parts = []
     table_dimensions = {}  # Track for obstacle marking
+    box_header_heights = set()  # One shared box symbol per header height
     for table_name in tables_list:
         x, y = positions[table_name]
-        columns = _get_table_columns_for_diagram(table_name, display_relationships, tables_metadata)
+        table_label = escaped_names[table_name]
+        columns = _get_table_columns_for_diagram(table_name, relationship_columns[table_name], tables_metadata)
 
         # Get metadata
         metadata = tables_metadata.get(table_name, {})
@@ -951,172 +1712,99 @@ def generate_standalone_relationships_report(
 
         # Calculate box height based on number of columns
         total_columns = len(columns['pk']) + len(columns['fk'])
-        box_height = 60 + (total_columns * 22)
+        header_height = 40
+        column_spacing = 22
+        box_height = header_height + 20 + (total_columns * column_spacing)
         box_width = 280
 
         # Track dimensions for routing
         table_dimensions[table_name] = (x, y, box_width, box_height)
+        box_header_heights.add(header_height)
 
         # Create table box
-        table_boxes_svg += f"""
-        <g class="er-table" data-table="{table_name}">
-            <rect x="{x}" y="{y}" width="{box_width}" height="{box_height}"
-                  fill="white" stroke="#d1d5db" stroke-width="1.5" rx="6"/>
-            <rect x="{x}" y="{y}" width="{box_width}" height="{header_height}"
-                  fill="#6606dc" rx="6"/>
-            <rect x="{x}" y="{y + header_height}" width="{box_width}" height="{box_height - header_height}"
-                  fill="white" rx="0"/>
-            <text x="{x + box_width/2}" y="{y + header_height/2 + 2}"
+        table_boxes_parts.append(f"""
+        <g class="er-table" data-table="{table_label}">
+            <use href="#er-box-{header_height}" x="{x}" y="{y}" width="{box_width}" height="{box_height}"/>
+            <text x="{_fmt_coord(x + box_width/2)}" y="{_fmt_coord(y + header_height/2 + 2)}"
                   font-family="Inter, sans-serif" font-size="14" font-weight="600"
-                  fill="white" text-anchor="middle">{table_name}</text>
-            <text x="{x + box_width/2}" y="{y + header_height - 5}"
+                  fill="white" text-anchor="middle">{table_label}</text>
+            <text x="{_fmt_coord(x + box_width/2)}" y="{y + header_height - 5}"
                   font-family="Inter, sans-serif" font-size="10"
                   fill="rgba(255,255,255,0.8)" text-anchor="middle">{row_count_str} rows</text>
-        """
+        """)
 
         # Add columns
         y_offset = y + header_height + 18
         for pk_col in columns['pk']:
-            table_boxes_svg += f"""
-            <text x="{x + 10}" y="{y_offset}"
+            table_boxes_parts.append(f"""
+            <text class="lod-detail" x="{x + 10}" y="{y_offset}"
                   font-family="'Courier New', monospace" font-size="12" font-weight="bold"
-                  fill="#1f2937">🔑 {pk_col}</text>
-        """
+                  fill="#1f2937">🔑 {_xml_escape(pk_col)}</text>
+        """)
             y_offset += column_spacing
 
         for fk_col in columns['fk']:
-            table_boxes_svg += f"""
-            <text x="{x + 10}" y="{y_offset}"
+            table_boxes_parts.append(f"""
+            <text class="lod-detail" x="{x + 10}" y="{y_offset}"
                   font-family="'Courier New', monospace" font-size="12"
-                  fill="#4b5563">{fk_col}</text>
-        """
+                  fill="#4b5563">{_xml_escape(fk_col)}</text>
+        """)
             y_offset += column_spacing
 
-        table_boxes_svg += "</g>"
+        table_boxes_parts.append("</g>")
+
+    # Column label backgrounds are only drawn in SVG mode, for relationships with full detail
+    label_lengths = set() if use_canvas else {
+        len(r['column1']) for r in display_relationships if r['confidence'] >= _DETAIL_LABEL_MIN_CONFIDENCE
+    }
+    table_boxes_parts.insert(0, _diagram_symbols(box_header_heights, label_lengths))
 
     # Mark all table boxes as obstacles in the grid
     for box in table_dimensions.values():
         grid.mark_obstacle(box, margin=20)
 
-    # Group relationships by table pair (same logic as summary section)
-    from collections import defaultdict
-    table_pair_rels = defaultdict(list)
-    for rel in display_relationships:
-        pair_key = tuple(sorted([rel['table1'], rel['table2']]))
-        table_pair_rels[pair_key].append(rel)
+    # Box dimensions are fixed from here on; collect them once for collision detection
+    all_box_dims = list(table_dimensions.values())
+
+    # Centers and edges of every box, looked up per table pair below
+    anchors = _table_anchor_points(positions)
+
+    # Optionally route each connected component in its own worker process
+    pair_routes = {}
+    if routing_workers > 1:
+        components = _connected_components(list(table_pair_rels))
+        if len(components) > 1:
+            component_pairs = [
+                [(pair_key, anchors[pair_key[0]], anchors[pair_key[1]], len(table_pair_rels[pair_key]))
+                 for pair_key in component]
+                for component in components
+            ]
+            with ProcessPoolExecutor(max_workers=min(routing_workers, len(components))) as executor:
+                for routed in executor.map(_route_component, component_pairs,
+                                           repeat(all_box_dims), repeat(max_x), repeat(max_y)):
+                    pair_routes.update(routed)
 
     # Build relationship lines with crow's foot notation
-    relationship_lines_svg = ""
+    relationship_lines_parts = []
+    canvas_relationships = []  # Canvas mode: line/label data drawn client-side
     rel_idx = 0
     for pair_key, rels in table_pair_rels.items():
         table1, table2 = pair_key
 
-        if table1 not in positions or table2 not in positions:
+        if table1 not in anchors or table2 not in anchors:
             continue
 
-        x1, y1 = positions[table1]
-        x2, y2 = positions[table2]
-
-        # Calculate center points of table boxes
-        center_x1 = x1 + 140
-        center_y1 = y1 + 100
-        center_x2 = x2 + 140
-        center_y2 = y2 + 100
-
-        # Calculate edge connection points
-        dx = center_x2 - center_x1
-        dy = center_y2 - center_y1
-
-        # Determine base connection points
-        if abs(dx) > abs(dy):
-            if dx > 0:
-                base_start_x, base_start_y = x1 + 280, center_y1
-                base_end_x, base_end_y = x2, center_y2
-            else:
-                base_start_x, base_start_y = x1, center_y1
-                base_end_x, base_end_y = x2 + 280, center_y2
-            offset_axis = 'vertical'
+        if pair_key in pair_routes:
+            start_side, end_side, routes = pair_routes[pair_key]
         else:
-            if dy > 0:
-                base_start_x, base_start_y = center_x1, y1 + 150
-                base_end_x, base_end_y = center_x2, y2
-            else:
-                base_start_x, base_start_y = center_x1, y1
-                base_end_x, base_end_y = center_x2, y2 + 150
-            offset_axis = 'horizontal'
-
-        # Draw each relationship with offset if multiple
-        num_rels = len(rels)
-        for i, rel in enumerate(rels):
-            # Calculate offset for multiple relationships
-            if num_rels > 1:
-                offset = (i - (num_rels - 1) / 2) * 25
-            else:
-                offset = 0
-
-            # Apply offset
-            if offset_axis == 'vertical':
-                start_x, start_y = base_start_x, base_start_y + offset
-                end_x, end_y = base_end_x, base_end_y + offset
-            else:
-                start_x, start_y = base_start_x + offset, base_start_y
-                end_x, end_y = base_end_x + offset, base_end_y
-
-            # Line color based on confidence
-            confidence = rel['confidence']
-            if confidence >= 0.9:
-                line_color = "#6606dc"
-                line_width = 2.5
-            elif confidence >= 0.7:
-                line_color = "#9ca3af"
-                line_width = 2
-            else:
-                line_color = "#d1d5db"
-                line_width = 1.5
-
-            # Determine cardinality labels (1 or n)
-            if rel['relationship_type'] == "one-to-one":
-                label_start = "1"
-                label_end = "1"
-            elif rel['relationship_type'] == "many-to-one":
-                if rel.get('direction') == "table1_to_table2":
-                    label_start = "n"
-                    label_end = "1"
-                elif rel.get('direction') == "table2_to_table1":
-                    label_start = "1"
-                    label_end = "n"
-                else:
-                    label_start = "1"
-                    label_end = "1"
-            elif rel['relationship_type'] == "many-to-many":
-                label_start = "n"
-                label_end = "n"
-            else:
-                label_start = "1"
-                label_end = "1"
-
-            # Build tooltip text
-            tooltip_text = f"{rel['column1']} ↔ {rel['column2']}&#10;Confidence: {confidence:.1%}&#10;Type: {rel['relationship_type']}&#10;Overlap: {rel['overlap_ratio']:.1%}&#10;Matching: {rel['matching_values']:,}"
-
-            # Calculate lane offset for multiple parallel relationships
-            if num_rels > 1:
-                lane_offset = (i - (num_rels - 1) / 2) * 12
-            else:
-                lane_offset = 0
-
-            # Collect all box dimensions for collision detection
-            all_box_dims = list(table_dimensions.values())
-
-            # Create orthogonal path with collision avoidance
-            path_d, label_positions = _create_orthogonal_path(
-                start_x, start_y, start_side,
-                end_x, end_y, end_side,
-                lane_offset, all_box_dims,
-                corner_radius=4,
-                grid=grid,
-                lane_registry=lane_registry
+            start_side, end_side, routes = _route_table_pair(
+                anchors[table1], anchors[table2], len(rels), all_box_dims, grid, lane_registry
             )
 
+        for rel, (start_x, start_y, end_x, end_y, lane_offset, path_d, label_positions) in zip(rels, routes):
+            line_color = rel['line_color']
+            line_width = rel['line_width']
+
             # Position cardinality labels based on edge sides (perpendicular offset from exit/entry)
             # Adjust offset to account for multiple parallel relationships
             base_offset = 22
@@ -1141,20 +1829,22 @@ def generate_standalone_relationships_report(
             # Add offset to prevent overlap with parallel relationship labels
             if label_positions:
                 # Find the longest segment
-                max_len = 0
+                # Squared lengths are enough to pick the longest segment
+                max_len_sq = 0
                 best_pos = label_positions[0]
                 best_seg_start = None
                 best_seg_end = None
-                for j in range(len(label_positions) - 1):
-                    seg_len = math.sqrt((label_positions[j+1][0] - label_positions[j][0])**2 +
-                                       (label_positions[j+1][1] - label_positions[j][1])**2)
-                    if seg_len > max_len:
-                        max_len = seg_len
-                        best_seg_start = label_positions[j]
-                        best_seg_end = label_positions[j+1]
+                for seg_start, seg_end in zip(label_positions, label_positions[1:]):
+                    seg_dx = seg_end[0] - seg_start[0]
+                    seg_dy = seg_end[1] - seg_start[1]
+                    seg_len_sq = seg_dx * seg_dx + seg_dy * seg_dy
+                    if seg_len_sq > max_len_sq:
+                        max_len_sq = seg_len_sq
+                        best_seg_start = seg_start
+                        best_seg_end = seg_end
                         # Place label at midpoint of this segment
-                        best_pos = ((label_positions[j][0] + label_positions[j+1][0]) / 2,
-                                   (label_positions[j][1] + label_positions[j+1][1]) / 2)
+                        best_pos = ((seg_start[0] + seg_end[0]) / 2,
+                                    (seg_start[1] + seg_end[1]) / 2)
 
                 col_label_x, col_label_y = best_pos
 
@@ -1173,71 +1863,90 @@ def generate_standalone_relationships_report(
                 col_label_x = (start_x + end_x) / 2
                 col_label_y = (start_y + end_y) / 2
 
-            relationship_lines_svg += f"""
-        <g class="er-relationship" data-table1="{rel['table1']}" data-table2="{rel['table2']}" data-rel-id="rel-{rel_idx}">
-            <title>{tooltip_text}</title>
-            <path d="{path_d}" stroke="{line_color}" stroke-width="{line_width}"
-                  fill="none"/>
-            <!-- Cardinality labels with backgrounds -->
-            <rect x="{label_start_x - 10}" y="{label_start_y - 10}" width="20" height="20"
-                  fill="white" stroke="{line_color}" stroke-width="1" rx="3"/>
-            <text x="{label_start_x}" y="{label_start_y}" font-family="Inter, sans-serif" font-size="13" font-weight="700"
-                  fill="{line_color}" text-anchor="middle" dominant-baseline="middle">
-                {label_start}
-            </text>
-            <rect x="{label_end_x - 10}" y="{label_end_y - 10}" width="20" height="20"
-                  fill="white" stroke="{line_color}" stroke-width="1" rx="3"/>
-            <text x="{label_end_x}" y="{label_end_y}" font-family="Inter, sans-serif" font-size="13" font-weight="700"
-                  fill="{line_color}" text-anchor="middle" dominant-baseline="middle">
-                {label_end}
-            </text>
-            <!-- Column name label with background (no rotation for orthogonal lines) -->
-            <rect x="{col_label_x - len(rel['column1']) * 3.5 - 2}" y="{col_label_y - 10}"
-                  width="{len(rel['column1']) * 7 + 4}" height="20"
-                  fill="white" rx="3" stroke="{line_color}" stroke-width="0.5"/>
-            <text x="{col_label_x}" y="{col_label_y}" font-family="Inter, sans-serif" font-size="10"
-                  fill="{line_color}" text-anchor="middle" dominant-baseline="middle" font-weight="500">
-                {rel['column1']}
-            </text>
-        </g>
-        """
-            rel_idx += 1
+            if use_canvas:
+                canvas_relationships.append({
+                    't1': rel['table1'],
+                    't2': rel['table2'],
+                    'd': path_d,
+                    'color': line_color,
+                    'width': line_width,
+                    'labels': _relationship_labels(rel, label_start_x, label_start_y,
+                                                   label_end_x, label_end_y, col_label_x, col_label_y),
+                })
+                rel_idx += 1
+                continue
 
-    # Generate relationships HTML list
-    relationships_html = ""
-    for rel in display_relationships:
-        confidence_pct = rel['confidence'] * 100
+            if rel['confidence'] < _DETAIL_LABEL_MIN_CONFIDENCE:
+                # Low-confidence relationships only draw their path; labels are built on hover
+                detail = _xml_escape(json.dumps({
+                    'color': line_color,
+                    'labels': _relationship_labels(rel, label_start_x, label_start_y,
+                                                   label_end_x, label_end_y, col_label_x, col_label_y),
+                }, separators=(',', ':')))
+                relationship_lines_parts.append(_relationship_path_svg(rel, rel_idx, path_d, detail))
+                rel_idx += 1
+                continue
 
-        if confidence_pct >= 80:
-            confidence_class = 'confidence-high'
-        elif confidence_pct >= 50:
-            confidence_class = 'confidence-medium'
-        else:
-            confidence_class = 'confidence-low'
+            relationship_lines_parts.append(_relationship_svg(
+                rel, rel_idx, path_d,
+                label_start_x, label_start_y, label_end_x, label_end_y, col_label_x, col_label_y
+            ))
+            rel_idx += 1
 
-        # Determine arrow direction for display
-        if rel.get('direction') == 'table1_to_table2':
-            arrow = "→"
-        elif rel.get('direction') == 'table2_to_table1':
-            arrow = "←"
-        else:
-            arrow = "↔"
+    # Diagram markup as a sequence of chunks, written to the file one by one
+    if use_canvas:
+        # Tables stay in an SVG overlay so click handling keeps working
+        canvas_json = json.dumps(
+            {'width': max_x, 'height': max_y, 'relationships': canvas_relationships},
+            separators=(',', ':')
+        ).replace('<', '\\u003c')  # Keep "</script>" out of the inline JSON
+        diagram_chunks = [f"""
+            <div class="er-canvas-stack" style="width: {max_x}px; height: {max_y}px;">
+                <canvas id="er-canvas"></canvas>
+                <svg id="er-diagram" width="{max_x}" height="{max_y}" xmlns="http://www.w3.org/2000/svg">
+                    <!-- Table boxes (relationship lines are drawn on the canvas below) -->
+                    """, table_boxes_parts, f"""
+                </svg>
+            </div>
+            <script type="application/json" id="er-canvas-data">{canvas_json}</script>"""]
+        canvas_script = f"""
+    <script>{_CANVAS_RENDERER_JS}    </script>"""
+        # Canvas lines have no hover details or zoom, so neither script is shipped
+        svg_scripts = ""
+        diagram_tip = "Click on a table to highlight its relationships."
+    else:
+        diagram_chunks = [f"""
+            <svg id="er-diagram" width="{max_x}" height="{max_y}" xmlns="http://www.w3.org/2000/svg">
+                <!-- Relationship lines (drawn first, behind tables) -->
+                """, relationship_lines_parts, """
+
+                <!-- Table boxes -->
+                """, table_boxes_parts, """
+            </svg>"""]
+        canvas_script = ""
+        svg_scripts = f"""
+    <script>{_LAZY_DETAIL_JS}    </script>
+    <script>{_ZOOM_LOD_JS}    </script>"""
+        diagram_tip = f"Click on a table to highlight its relationships. Hover over connection lines to see details. {_ZOOM_HINT}"
 
-        relationships_html += f'''
-        <div class="relationship-item {confidence_class}">
-            <strong>{rel['table1']}.{rel['column1']}</strong> {arrow}
-            <strong>{rel['table2']}.{rel['column2']}</strong><br>
+    # Generate relationships HTML list
+    relationships_parts = []
+    for rel in display_relationships:
+        relationships_parts.append(f'''
+        <div class="relationship-item {rel['confidence_class']}">
+            <strong>{rel['table1_label']}.{rel['column1_label']}</strong> {rel['arrow']}
+            <strong>{rel['table2_label']}.{rel['column2_label']}</strong><br>
             <small>
-                Confidence: {confidence_pct:.1f}% |
+                Confidence: {rel['confidence_pct']:.1f}% |
                 Type: {rel['relationship_type']} |
                 Matching values: {rel['matching_values']:,} |
                 Overlap: {rel['overlap_ratio']:.1%}
             </small>
         </div>
-        '''
+        ''')
 
-    # Generate HTML template
-    html_template = f'''<!DOCTYPE html>
+    # Page before the diagram
+    html_head = f'''<!DOCTYPE html>
 <html>
 <head>
     <title>Table Relationships - ER Diagram</title>
@@ -1283,18 +1992,17 @@ def generate_standalone_relationships_report(
             cursor: pointer;
             transition: all 0.2s;
         }}
-        .er-table:hover rect {{
+        .er-table:hover use {{
             filter: brightness(0.95);
         }}
-        .er-table.highlighted rect:first-child {{
-            fill: #5005b8;
-            stroke: #4004a0;
-            stroke-width: 3;
+        .er-table.highlighted use {{
+            --er-box-stroke: #4004a0;
+            --er-box-stroke-width: 3;
         }}
         .er-relationship {{
             transition: all 0.2s;
         }}
-        .er-relationship.highlighted > path {{
+        .er-relationship.highlighted path {{
             stroke: #6606dc !important;
             stroke-width: 3.5 !important;
         }}
@@ -1308,6 +2016,9 @@ def generate_standalone_relationships_report(
         .er-table.dimmed {{
             opacity: 0.3;
         }}
+        .er-diagram-container[data-zoom="low"] .lod-detail {{
+            display: none;
+        }}
         .info-panel {{
             background-color: white;
             border: 1px solid #e5e7eb;
@@ -1358,6 +2069,15 @@ def generate_standalone_relationships_report(
             color: #6b7280;
             margin-top: 4px;
         }}
+        .er-canvas-stack {{
+            position: relative;
+        }}
+        .er-canvas-stack canvas,
+        .er-canvas-stack svg {{
+            position: absolute;
+            top: 0;
+            left: 0;
+        }}
         .tip-box {{
             background: #f0f9ff;
             border: 1px solid #bae6fd;
@@ -1392,82 +2112,38 @@ def generate_standalone_relationships_report(
         </div>
 
         <div class="tip-box">
-            <strong>Interactive ER Diagram:</strong> Click on a table to highlight its relationships. Hover over connection lines to see details.
+            <strong>Interactive ER Diagram:</strong> {diagram_tip}
         </div>
 
-        <div class="er-diagram-container">
-            <svg id="er-diagram" width="{max_x}" height="{max_y}" xmlns="http://www.w3.org/2000/svg">
-                <!-- Relationship lines (drawn first, behind tables) -->
-                {relationship_lines_svg}
+        <div class="er-diagram-container">'''
 
-                <!-- Table boxes -->
-                {table_boxes_svg}
-            </svg>
+    # Between the diagram and the relationship list
+    html_middle = '''
         </div>
 
         <div class="info-panel">
             <h2>Detected Relationships</h2>
             <div id="relationships-list">
-                {relationships_html}
+                '''
+
+    html_tail = f'''
             </div>
         </div>
     </div>
 
-    <script>
-        (function() {{
-            const tables = document.querySelectorAll('.er-table');
-            const relationships = document.querySelectorAll('.er-relationship');
-            let selectedTable = null;
-
-            tables.forEach(table => {{
-                table.addEventListener('click', function() {{
-                    const tableName = this.getAttribute('data-table');
-
-                    // Toggle selection
-                    if (selectedTable === tableName) {{
-                        // Deselect
-                        selectedTable = null;
-                        tables.forEach(t => t.classList.remove('highlighted', 'dimmed'));
-                        relationships.forEach(r => r.classList.remove('highlighted', 'dimmed'));
-                    }} else {{
-                        // Select
-                        selectedTable = tableName;
-
-                        // Dim all tables and relationships
-                        tables.forEach(t => t.classList.add('dimmed'));
-                        relationships.forEach(r => r.classList.add('dimmed'));
-
-                        // Highlight selected table
-                        this.classList.remove('dimmed');
-                        this.classList.add('highlighted');
-
-                        // Highlight related tables and relationships
-                        relationships.forEach(rel => {{
-                            const table1 = rel.getAttribute('data-table1');
-                            const table2 = rel.getAttribute('data-table2');
-
-                            if (table1 === tableName || table2 === tableName) {{
-                                rel.classList.remove('dimmed');
-                                rel.classList.add('highlighted');
-
-                                // Highlight the connected table
-                                const connectedTable = table1 === tableName ? table2 : table1;
-                                tables.forEach(t => {{
-                                    if (t.getAttribute('data-table') === connectedTable) {{
-                                        t.classList.remove('dimmed');
-                                        t.classList.add('highlighted');
-                                    }}
-                                }});
-                            }}
-                        }});
-                    }}
-                }});
-            }});
-        }})();
-    </script>
+    <script>{_HIGHLIGHT_JS}    </script>{svg_scripts}
+    <script>{_VIRTUALIZE_JS}    </script>{canvas_script}
 </body>
 </html>'''
 
-    # Write to file
+    # Stream the page to the file instead of assembling it in memory first
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_template)
+        f.write(html_head)
+        for chunk in diagram_chunks:
+            if isinstance(chunk, list):
+                f.writelines(chunk)
+            else:
+                f.write(chunk)
+        f.write(html_middle)
+        f.writelines(relationships_parts)
+        f.write(html_tail)
@@ -8,8 +8,8 @@ and box intersections in entity-relationship diagrams.
 from .grid import Grid
 from .lane_manager import LaneRegistry
 from .corridor import scan_corridors, select_best_corridor
-from .astar import astar_route
-from .path_optimizer import compress_path, smooth_corners, validate_clearance
+from .astar import astar_route, route_bidirectional, route_auto
+from .path_optimizer import compress_path, smooth_corners, validate_clearance, cleanup_waypoints
 
 __all__ = [
     'Grid',
@@ -17,7 +17,10 @@ __all__ = [
     'scan_corridors',
     'select_best_corridor',
     'astar_route',
+    'route_bidirectional',
+    'route_auto',
     'compress_path',
     'smooth_corners',
     'validate_clearance',
+    'cleanup_waypoints',
 ]
@@ -9,96 +9,83 @@ Implements A* algorithm with custom cost function that considers:
 """
 
 from typing import List, Tuple, Optional
+from collections import deque
 import heapq
-from dataclasses import dataclass, field
+import itertools
 
 from .grid import Grid, GridCell
 from .lane_manager import LaneRegistry
 
 
-@dataclass(order=True)
-class Node:
-    """Node in A* search."""
-    f_cost: float = field(compare=True)  # f = g + h
-    g_cost: float = field(compare=False)  # Cost from start
-    h_cost: float = field(compare=False)  # Heuristic to goal
-    cell: GridCell = field(compare=False)
-    parent: Optional['Node'] = field(default=None, compare=False)
-
-    def __hash__(self):
-        return hash(self.cell)
-
-
 def manhattan_distance(cell1: GridCell, cell2: GridCell) -> int:
     """Calculate Manhattan distance between two cells."""
     return abs(cell1.x - cell2.x) + abs(cell1.y - cell2.y)
 
 
-def is_straight_move(parent: Optional[Node], current: Node, neighbor: GridCell) -> bool:
+def is_straight_move(parent: Optional[GridCell], current: GridCell, neighbor: GridCell) -> bool:
     """Check if move continues in same direction (no turn)."""
     if parent is None:
         return True  # First move
 
     # Get direction vectors
-    prev_dx = current.cell.x - parent.cell.x
-    prev_dy = current.cell.y - parent.cell.y
+    prev_dx = current.x - parent.x
+    prev_dy = current.y - parent.y
 
-    next_dx = neighbor.x - current.cell.x
-    next_dy = neighbor.y - current.cell.y
+    next_dx = neighbor.x - current.x
+    next_dy = neighbor.y - current.y
 
     # Same direction if vectors match
     return prev_dx == next_dx and prev_dy == next_dy
 
 
 def calculate_cost(
-    current: Node,
+    current: GridCell,
+    g_cost: float,
+    parent: Optional[GridCell],
+    grandparent: Optional[GridCell],
     neighbor: GridCell,
     end: GridCell,
-    grid: Grid,
-    lane_registry: Optional[LaneRegistry] = None
+    vertical_usage: int = 0,
+    horizontal_usage: int = 0
 ) -> Tuple[float, float]:
     """
-    Calculate g_cost and h_cost for a neighbor node.
+    Calculate g_cost and h_cost for a neighbor cell.
+
+    Lane usage only depends on the current cell (its column for vertical
+    moves, its row for horizontal ones), so callers look it up once per
+    expanded cell rather than once per neighbor.
 
     Args:
-        current: Current node
+        current: Current cell
+        g_cost: Cost from start to the current cell
+        parent: Cell before current on its path, if any
+        grandparent: Cell before parent on its path, if any
         neighbor: Neighbor cell to evaluate
         end: Goal cell
-        grid: Grid system
-        lane_registry: Optional lane usage tracker
+        vertical_usage: Usage of the vertical lane through current's column
+        horizontal_usage: Usage of the horizontal lane through current's row
 
     Returns:
         Tuple of (g_cost, h_cost)
     """
     # Base cost: distance from start
-    g_cost = current.g_cost + 1
+    g_cost += 1
 
     # Direction change penalty
-    if not is_straight_move(current.parent, current, neighbor):
+    straight = is_straight_move(parent, current, neighbor)
+    if not straight:
         g_cost += 5  # Penalize turns
 
-    # Lane usage penalty
-    if lane_registry:
-        # Determine if this is a vertical or horizontal move
-        is_vertical_move = neighbor.x == current.cell.x
-        is_horizontal_move = neighbor.y == current.cell.y
-
-        if is_vertical_move:
-            # Moving vertically - check vertical lane usage
-            lane_pos = int(neighbor.x * grid.resolution)
-            usage = lane_registry.get_lane_usage(lane_pos, is_vertical=True)
-            g_cost += usage * 3  # Penalty proportional to usage
-
-        elif is_horizontal_move:
-            # Moving horizontally - check horizontal lane usage
-            lane_pos = int(neighbor.y * grid.resolution)
-            usage = lane_registry.get_lane_usage(lane_pos, is_vertical=False)
-            g_cost += usage * 3  # Penalty proportional to usage
+    # Lane usage penalty, proportional to usage
+    if neighbor.x == current.x:
+        g_cost += vertical_usage * 3  # Moving vertically
+    elif neighbor.y == current.y:
+        g_cost += horizontal_usage * 3  # Moving horizontally
 
     # Straight corridor bonus
-    if current.parent and is_straight_move(current.parent, current, neighbor):
+    if parent and straight:
         # Check if we're in a long straight corridor
-        if current.parent.parent and is_straight_move(current.parent.parent, current.parent, current.cell):
+        if grandparent and is_straight_move(grandparent, parent, current):
             g_cost -= 2  # Reward continuing straight for 3+ cells
 
     # Heuristic: Manhattan distance to goal
@@ -107,14 +94,30 @@ def calculate_cost(
     return (g_cost, h_cost)
 
 
-def reconstruct_path(node: Node) -> List[GridCell]:
-    """Reconstruct path from goal node by following parent pointers."""
+def _lane_penalties(grid: Grid, lane_registry: Optional[LaneRegistry]) -> Tuple[List[int], List[int]]:
+    """
+    Look up the lane usage penalty of every grid column and row once per search.
+
+    Returns:
+        Tuple of (vertical penalty per column, horizontal penalty per row)
+    """
+    if not lane_registry:
+        return [0] * grid.cols, [0] * grid.rows
+
+    resolution = grid.resolution
+    vertical = lane_registry.vertical_lanes
+    horizontal = lane_registry.horizontal_lanes
+    return ([vertical.get(int(x * resolution), 0) * 3 for x in range(grid.cols)],
+            [horizontal.get(int(y * resolution), 0) * 3 for y in range(grid.rows)])
+
+
+def reconstruct_path(nodes: List[Tuple[int, int]], node_id: int, grid: Grid) -> List[GridCell]:
+    """Reconstruct path to an expanded node by following parent ids."""
     path = []
-    current = node
 
-    while current is not None:
-        path.append(current.cell)
-        current = current.parent
+    while node_id >= 0:
+        cell_id, node_id = nodes[node_id]
+        path.append(grid.cell_xy(cell_id))
 
     path.reverse()
     return path
@@ -129,6 +132,18 @@ def astar_route(
     """
     Find optimal path from start to end using A* algorithm.
 
+    Cells are handled as packed int ids (see Grid.cell_id) so set and dict
+    lookups hash plain ints, and a move's direction is the id difference.
+    All costs are integers, so the open set is a bucket queue: one deque of
+    entries per f cost, popped from the front of the lowest non-empty
+    bucket. Ties on f go towards the goal: an entry closer to it than the
+    bucket's front is pushed in front of it, which saves expansions without
+    the cost of fully ordering each bucket. Entries are (cell_id, g_cost,
+    parent_id, prev_delta, long_straight, h_cost): the id step into the
+    cell (0 at the start) and whether that step continued a straight run,
+    so turn and straight-run costs need no walk up the parent chain.
+    Expanded nodes are stored as (cell_id, parent_id) in a flat list.
+
     Args:
         start: Starting grid cell
         end: Goal grid cell
@@ -146,70 +161,291 @@ def astar_route(
     if grid.is_line_clear(start, end):
         return [start, end]
 
-    # Initialize search
-    open_set = []  # Priority queue (heap)
-    closed_set = set()  # Visited nodes
-
-    # Create start node
-    start_node = Node(
-        f_cost=manhattan_distance(start, end),
-        g_cost=0,
-        h_cost=manhattan_distance(start, end),
-        cell=start,
-        parent=None
-    )
+    cols = grid.cols
+    last_col = cols - 1
+    last_row = grid.rows - 1
+    blocked = grid.blocked
+    column_penalty, row_penalty = _lane_penalties(grid, lane_registry)
+    ex, ey = end
+    start_id = grid.cell_id(start.x, start.y)
+    end_id = grid.cell_id(ex, ey)
 
-    heapq.heappush(open_set, start_node)
+    # Initialize search
+    # Straight-run rewards make edge costs as low as -1, so f can drop below
+    # the bucket being popped; pushes move the pointer back down when it does
+    current_f = manhattan_distance(start, end)
+    buckets = {current_f: deque([(start_id, 0, -1, 0, False, current_f)])}  # Open set by f cost
+    open_count = 1
+    closed_set = set()  # Visited cell ids
+    nodes = []  # Expanded nodes as (cell_id, parent_id)
 
     # Track best g_cost to each cell
-    best_g_cost = {start: 0.0}
+    best_g_cost = {start_id: 0}
 
     # A* search
-    while open_set:
-        current = heapq.heappop(open_set)
-
-        # Goal reached
-        if current.cell == end:
-            return reconstruct_path(current)
+    while open_count:
+        bucket = buckets.get(current_f)
+        while not bucket:
+            current_f += 1
+            bucket = buckets.get(current_f)
+        cell_id, g_cost, parent_id, prev_delta, long_straight, _ = bucket.popleft()
+        open_count -= 1
 
         # Already visited
-        if current.cell in closed_set:
+        if cell_id in closed_set:
             continue
 
-        closed_set.add(current.cell)
+        node_id = len(nodes)
+        nodes.append((cell_id, parent_id))
+
+        # Goal reached
+        if cell_id == end_id:
+            return reconstruct_path(nodes, node_id, grid)
+
+        closed_set.add(cell_id)
+
+        cy, cx = divmod(cell_id, cols)
+
+        # Moves out of this cell use its column (vertical) or row (horizontal) lane
+        vertical_penalty = column_penalty[cx]
+        horizontal_penalty = row_penalty[cy]
 
         # Explore neighbors
-        for neighbor_cell in grid.get_neighbors(current.cell):
-            # Skip if already visited
-            if neighbor_cell in closed_set:
+        # Free neighbors up, right, down, left, read straight from the bitmap
+        for neighbor_id in (cell_id - cols if cy > 0 else -1,
+                            cell_id + 1 if cx < last_col else -1,
+                            cell_id + cols if cy < last_row else -1,
+                            cell_id - 1 if cx > 0 else -1):
+            # Skip if off the grid, blocked or already visited
+            if neighbor_id < 0 or blocked[neighbor_id] or neighbor_id in closed_set:
                 continue
 
-            # Calculate costs
-            g_cost, h_cost = calculate_cost(current, neighbor_cell, end, grid, lane_registry)
-            f_cost = g_cost + h_cost
+            # Cost model of calculate_cost, inlined for the hot loop
+            delta = neighbor_id - cell_id
+            neighbor_g = g_cost + 1
+            if prev_delta and delta != prev_delta:
+                neighbor_g += 5  # Penalize turns
+            elif long_straight:
+                neighbor_g -= 2  # Reward continuing straight for 3+ cells
+
+            # Lane usage penalty
+            neighbor_g += vertical_penalty if delta == cols or delta == -cols else horizontal_penalty
+
+            ny, nx = divmod(neighbor_id, cols)
+            neighbor_h = abs(nx - ex) + abs(ny - ey)
 
             # Skip if we've found a better path to this cell
-            if neighbor_cell in best_g_cost and g_cost >= best_g_cost[neighbor_cell]:
+            known_g = best_g_cost.get(neighbor_id)
+            if known_g is not None and neighbor_g >= known_g:
                 continue
 
             # Record best cost
-            best_g_cost[neighbor_cell] = g_cost
-
-            # Create neighbor node
-            neighbor_node = Node(
-                f_cost=f_cost,
-                g_cost=g_cost,
-                h_cost=h_cost,
-                cell=neighbor_cell,
-                parent=current
-            )
-
-            heapq.heappush(open_set, neighbor_node)
+            best_g_cost[neighbor_id] = neighbor_g
+
+            neighbor_f = neighbor_g + neighbor_h
+            bucket = buckets.get(neighbor_f)
+            entry = (neighbor_id, neighbor_g, node_id, delta, delta == prev_delta, neighbor_h)
+            # Break f ties towards the goal
+            if bucket is None:
+                buckets[neighbor_f] = deque([entry])
+            elif bucket and neighbor_h < bucket[0][5]:
+                bucket.appendleft(entry)
+            else:
+                bucket.append(entry)
+            if neighbor_f < current_f:
+                current_f = neighbor_f
+            open_count += 1
 
     # No path found
     return None
 
 
+def _meeting_cost(cell_id: int, nodes_fwd: List[Tuple[int, int]], fwd: Tuple[float, int],
+                  nodes_bwd: List[Tuple[int, int]], bwd: Tuple[float, int]) -> float:
+    """Cost of joining a forward and a backward (g_cost, parent_id) entry at the same cell."""
+    g_fwd, parent_fwd = fwd
+    g_bwd, parent_bwd = bwd
+    cost = g_fwd + g_bwd
+
+    # Neither half saw the move through the meeting cell, so add its turn penalty.
+    # Horizontal moves change the id by 1 and vertical ones by cols, so the
+    # moves are perpendicular when their id steps differ in size
+    if parent_fwd >= 0 and parent_bwd >= 0:
+        before = nodes_fwd[parent_fwd][0]
+        after = nodes_bwd[parent_bwd][0]
+        if abs(cell_id - before) != abs(after - cell_id):
+            cost += 5
+
+    return cost
+
+
+def route_bidirectional(
+    start: GridCell,
+    end: GridCell,
+    grid: Grid,
+    lane_registry: Optional[LaneRegistry] = None
+) -> Optional[List[GridCell]]:
+    """
+    Find a path from start to end with A* searches run from both endpoints.
+
+    Each step expands the frontier whose best entry has the lower f cost. The
+    searches stop once no frontier can improve on the cheapest meeting found,
+    so long routes explore two small regions instead of one large one.
+
+    Args:
+        start: Starting grid cell
+        end: Goal grid cell
+        grid: Grid system with obstacles
+        lane_registry: Optional lane usage tracker for cost calculation
+
+    Returns:
+        List of grid cells forming path, or None if no path exists
+    """
+    # Early exit if start or end is blocked
+    if not grid.is_traversable(start) or not grid.is_traversable(end):
+        return None
+
+    # Check if straight line is possible
+    if grid.is_line_clear(start, end):
+        return [start, end]
+
+    cols = grid.cols
+    last_col = cols - 1
+    last_row = grid.rows - 1
+    blocked = grid.blocked
+    column_penalty, row_penalty = _lane_penalties(grid, lane_registry)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    start_id = grid.cell_id(start.x, start.y)
+    end_id = grid.cell_id(end.x, end.y)
+
+    tick = itertools.count().__next__  # Heap tie-breaker
+    distance = manhattan_distance(start, end)
+    # Entries: (f_cost, h_cost, tick, cell_id, g_cost, parent_id, prev_delta, long_straight)
+    open_fwd = [(distance, distance, tick(), start_id, 0, -1, 0, False)]
+    open_bwd = [(distance, distance, tick(), end_id, 0, -1, 0, False)]
+
+    # Expanded nodes as (cell_id, parent_id), and best (g_cost, parent_id) per cell id
+    nodes_fwd, nodes_bwd = [], []
+    best_fwd = {start_id: (0, -1)}
+    best_bwd = {end_id: (0, -1)}
+    closed_fwd = set()
+    closed_bwd = set()
+
+    best_meet = float('inf')
+    meet = None  # (cell_id, forward entry, backward entry) of the cheapest meeting
+
+    while open_fwd and open_bwd:
+        # No frontier can produce a cheaper meeting any more
+        if max(open_fwd[0][0], open_bwd[0][0]) >= best_meet:
+            break
+
+        # Expand the frontier with the lower f cost, searching towards the other endpoint
+        forward = open_fwd[0][0] <= open_bwd[0][0]
+        if forward:
+            open_set, nodes, best, closed, other_best = open_fwd, nodes_fwd, best_fwd, closed_fwd, best_bwd
+            gx, gy = end
+        else:
+            open_set, nodes, best, closed, other_best = open_bwd, nodes_bwd, best_bwd, closed_bwd, best_fwd
+            gx, gy = start
+
+        _, _, _, cell_id, g_cost, parent_id, prev_delta, long_straight = heappop(open_set)
+
+        # Already visited
+        if cell_id in closed:
+            continue
+
+        closed.add(cell_id)
+        node_id = len(nodes)
+        nodes.append((cell_id, parent_id))
+
+        cy, cx = divmod(cell_id, cols)
+
+        # Moves out of this cell use its column (vertical) or row (horizontal) lane
+        vertical_penalty = column_penalty[cx]
+        horizontal_penalty = row_penalty[cy]
+
+        # Free neighbors up, right, down, left, read straight from the bitmap
+        for neighbor_id in (cell_id - cols if cy > 0 else -1,
+                            cell_id + 1 if cx < last_col else -1,
+                            cell_id + cols if cy < last_row else -1,
+                            cell_id - 1 if cx > 0 else -1):
+            if neighbor_id < 0 or blocked[neighbor_id] or neighbor_id in closed:
+                continue
+
+            # Cost model of calculate_cost, inlined for the hot loop
+            delta = neighbor_id - cell_id
+            neighbor_g = g_cost + 1
+            if prev_delta and delta != prev_delta:
+                neighbor_g += 5  # Penalize turns
+            elif long_straight:
+                neighbor_g -= 2  # Reward continuing straight for 3+ cells
+
+            # Lane usage penalty
+            neighbor_g += vertical_penalty if delta == cols or delta == -cols else horizontal_penalty
+
+            ny, nx = divmod(neighbor_id, cols)
+            neighbor_h = abs(nx - gx) + abs(ny - gy)
+
+            # Skip if we've found a better path to this cell
+            known = best.get(neighbor_id)
+            if known is not None and neighbor_g >= known[0]:
+                continue
+
+            entry = (neighbor_g, node_id)
+            best[neighbor_id] = entry
+            heappush(open_set, (neighbor_g + neighbor_h, neighbor_h, tick(), neighbor_id, neighbor_g, node_id,
+                                delta, delta == prev_delta))
+
+            # The other search already reached this cell: candidate meeting
+            other_entry = other_best.get(neighbor_id)
+            if other_entry is not None:
+                fwd, bwd = (entry, other_entry) if forward else (other_entry, entry)
+                cost = _meeting_cost(neighbor_id, nodes_fwd, fwd, nodes_bwd, bwd)
+                if cost < best_meet:
+                    best_meet = cost
+                    meet = (neighbor_id, fwd, bwd)
+
+    if meet is None:
+        return None
+
+    # Splice both halves at the meeting cell
+    cell_id, (_, parent_fwd), (_, parent_bwd) = meet
+    path = reconstruct_path(nodes_fwd, parent_fwd, grid) if parent_fwd >= 0 else []
+    path.append(grid.cell_xy(cell_id))
+    if parent_bwd >= 0:
+        path.extend(reversed(reconstruct_path(nodes_bwd, parent_bwd, grid)))
+
+    return path
+
+
+# Routes spanning more cells than this use bidirectional search
+BIDIRECTIONAL_MIN_DISTANCE = 40
+
+
+def route_auto(
+    start: GridCell,
+    end: GridCell,
+    grid: Grid,
+    lane_registry: Optional[LaneRegistry] = None
+) -> Optional[List[GridCell]]:
+    """
+    Find a path with bidirectional search for long routes and plain A* otherwise.
+
+    Args:
+        start: Starting grid cell
+        end: Goal grid cell
+        grid: Grid system with obstacles
+        lane_registry: Optional lane usage tracker for cost calculation
+
+    Returns:
+        List of grid cells forming path, or None if no path exists
+    """
+    if manhattan_distance(start, end) > BIDIRECTIONAL_MIN_DISTANCE:
+        return route_bidirectional(start, end, grid, lane_registry)
+    return astar_route(start, end, grid, lane_registry)
+
+
 def route_with_waypoints(
     waypoints: List[Tuple[float, float]],
     grid: Grid,
@@ -239,7 +475,7 @@ def route_with_waypoints(
         end_cell = grid.to_grid(end_x, end_y)
 
         # Find path for this segment
-        segment_path = astar_route(start_cell, end_cell, grid, lane_registry)
+        segment_path = route_auto(start_cell, end_cell, grid, lane_registry)
 
         if segment_path is None:
             return None  # Cannot complete route
@@ -5,8 +5,10 @@ Provides heuristic-based routing that finds straight corridors
 between tables before falling back to expensive A* pathfinding.
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Set
+from bisect import bisect_left, insort
 from dataclasses import dataclass
+import heapq
 
 
 @dataclass
@@ -26,6 +28,116 @@ class Corridor:
         return self.start <= point <= self.end
 
 
+def _sweep_corridors(
+    candidates: Set[float],
+    spans: List[Tuple[float, float, float, float]],
+    scan_min: float,
+    scan_max: float,
+    cross_min: float,
+    cross_max: float,
+    min_width: float,
+    is_vertical: bool
+) -> List[Corridor]:
+    """
+    Find the corridors at each candidate position with a sweep line.
+
+    Obstacles enter the active set when the sweep reaches their start and
+    leave it once it passes their end, so each candidate only looks at the
+    obstacles it crosses. The gaps between merged blocked ranges are reused
+    for every candidate until the active set changes.
+
+    Candidates outside the scan range and obstacles that cannot change a
+    gap are filtered out in one pass before sorting: obstacles that never
+    reach the scan range, and obstacles ending more than min_width before
+    (or starting more than min_width after) the cross range, whose gaps
+    would be clipped away anyway.
+
+    Args:
+        candidates: Positions along the scan axis to test
+        spans: Per obstacle (start, end) along the scan axis and (start, end) across it
+        scan_min, scan_max: Range of candidate positions to keep
+        cross_min, cross_max: Range across the scan axis the corridor must overlap
+        min_width: Minimum corridor width to consider valid
+        is_vertical: Whether the corridors run vertically (constant x)
+
+    Returns:
+        Corridors sorted by position, then by start
+    """
+    low = cross_min - min_width
+    high = cross_max + min_width
+    spans = sorted([
+        span for span in spans
+        if span[1] >= scan_min and span[0] <= scan_max and span[3] >= low and span[2] <= high
+    ])
+    positions = sorted([position for position in candidates if scan_min <= position <= scan_max])
+
+    active = []  # Blocked (start, end, index) ranges across the axis, sorted
+    leaving = []  # Heap of (end along the axis, active entry)
+    next_span = 0
+    gaps = None  # Gaps for the current active set, None once it changes
+
+    corridors = []
+
+    for position in positions:
+        # Obstacles blocking this position: start <= position <= end
+        while next_span < len(spans) and spans[next_span][0] <= position:
+            span_start, span_end, range_start, range_end = spans[next_span]
+            entry = (range_start, range_end, next_span)
+            insort(active, entry)
+            heapq.heappush(leaving, (span_end, entry))
+            next_span += 1
+            gaps = None
+        while leaving and leaving[0][0] < position:
+            entry = heapq.heappop(leaving)[1]
+            del active[bisect_left(active, entry)]
+            gaps = None
+
+        if gaps is None:
+            gaps = []
+
+            # Merge overlapping ranges
+            merged_ranges = []
+            for range_start, range_end, _ in active:
+                if merged_ranges and range_start <= merged_ranges[-1][1]:
+                    # Overlaps with previous range - merge
+                    merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], range_end))
+                else:
+                    merged_ranges.append((range_start, range_end))
+
+            # Find gaps (clear corridors)
+            prev_end = cross_min - min_width  # Start before first range
+
+            for range_start, range_end in merged_ranges:
+                # Check gap between prev_end and range_start
+                gap_start = prev_end
+                gap_end = range_start
+
+                if gap_end - gap_start >= min_width:
+                    # Valid corridor found
+                    if gap_start <= cross_max and gap_end >= cross_min:
+                        gaps.append((max(gap_start, cross_min), min(gap_end, cross_max)))
+
+                prev_end = range_end
+
+            # Check gap after last obstacle
+            gap_start = prev_end
+            gap_end = cross_max + min_width
+
+            if gap_end - gap_start >= min_width:
+                if gap_start <= cross_max:
+                    gaps.append((max(gap_start, cross_min), min(gap_end, cross_max)))
+
+        for gap_start, gap_end in gaps:
+            corridors.append(Corridor(
+                position=position,
+                is_vertical=is_vertical,
+                start=gap_start,
+                end=gap_end
+            ))
+
+    return corridors
+
+
 def scan_vertical_corridors(
     start: Tuple[float, float],
     end: Tuple[float, float],
@@ -65,68 +177,13 @@ def scan_vertical_corridors(
     mid_x = (start_x + end_x) / 2
     x_positions.add(mid_x)
 
-    corridors = []
-
-    # Check each x-position
-    for x in sorted(x_positions):
-        if x < min_x or x > max_x:
-            continue
-
-        # Check if this vertical line intersects any obstacles
-        y_ranges = []  # Collect blocked y-ranges
-
-        for obs_x, obs_y, obs_w, obs_h in obstacles:
-            # Check if obstacle blocks this x-coordinate
-            if obs_x <= x <= obs_x + obs_w:
-                y_ranges.append((obs_y, obs_y + obs_h))
-
-        # Merge overlapping ranges
-        y_ranges.sort()
-        merged_ranges = []
-        for y_start, y_end in y_ranges:
-            if merged_ranges and y_start <= merged_ranges[-1][1]:
-                # Overlaps with previous range - merge
-                merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], y_end))
-            else:
-                merged_ranges.append((y_start, y_end))
-
-        # Find gaps (clear corridors)
-        min_y = min(start_y, end_y)
-        max_y = max(start_y, end_y)
-
-        prev_end = min_y - min_width  # Start before first range
-
-        for y_start, y_end in merged_ranges:
-            # Check gap between prev_end and y_start
-            gap_start = prev_end
-            gap_end = y_start
-
-            if gap_end - gap_start >= min_width:
-                # Valid corridor found
-                if gap_start <= max_y and gap_end >= min_y:
-                    corridors.append(Corridor(
-                        position=x,
-                        is_vertical=True,
-                        start=max(gap_start, min_y),
-                        end=min(gap_end, max_y)
-                    ))
-
-            prev_end = y_end
-
-        # Check gap after last obstacle
-        gap_start = prev_end
-        gap_end = max_y + min_width
-
-        if gap_end - gap_start >= min_width:
-            if gap_start <= max_y:
-                corridors.append(Corridor(
-                    position=x,
-                    is_vertical=True,
-                    start=max(gap_start, min_y),
-                    end=min(gap_end, max_y)
-                ))
+    # Each obstacle blocks [obs_y, obs_y + obs_h] for x in [obs_x, obs_x + obs_w]
+    spans = [(obs_x, obs_x + obs_w, obs_y, obs_y + obs_h) for obs_x, obs_y, obs_w, obs_h in obstacles]
 
-    return corridors
+    return _sweep_corridors(
+        x_positions, spans, min_x, max_x,
+        min(start_y, end_y), max(start_y, end_y), min_width, is_vertical=True
+    )
 
 
 def scan_horizontal_corridors(
@@ -168,68 +225,13 @@ def scan_horizontal_corridors(
     mid_y = (start_y + end_y) / 2
     y_positions.add(mid_y)
 
-    corridors = []
+    # Each obstacle blocks [obs_x, obs_x + obs_w] for y in [obs_y, obs_y + obs_h]
+    spans = [(obs_y, obs_y + obs_h, obs_x, obs_x + obs_w) for obs_x, obs_y, obs_w, obs_h in obstacles]
 
-    # Check each y-position
-    for y in sorted(y_positions):
-        if y < min_y or y > max_y:
-            continue
-
-        # Check if this horizontal line intersects any obstacles
-        x_ranges = []  # Collect blocked x-ranges
-
-        for obs_x, obs_y_pos, obs_w, obs_h in obstacles:
-            # Check if obstacle blocks this y-coordinate
-            if obs_y_pos <= y <= obs_y_pos + obs_h:
-                x_ranges.append((obs_x, obs_x + obs_w))
-
-        # Merge overlapping ranges
-        x_ranges.sort()
-        merged_ranges = []
-        for x_start, x_end in x_ranges:
-            if merged_ranges and x_start <= merged_ranges[-1][1]:
-                # Overlaps with previous range - merge
-                merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], x_end))
-            else:
-                merged_ranges.append((x_start, x_end))
-
-        # Find gaps (clear corridors)
-        min_x = min(start_x, end_x)
-        max_x = max(start_x, end_x)
-
-        prev_end = min_x - min_width  # Start before first range
-
-        for x_start, x_end in merged_ranges:
-            # Check gap between prev_end and x_start
-            gap_start = prev_end
-            gap_end = x_start
-
-            if gap_end - gap_start >= min_width:
-                # Valid corridor found
-                if gap_start <= max_x and gap_end >= min_x:
-                    corridors.append(Corridor(
-                        position=y,
-                        is_vertical=False,
-                        start=max(gap_start, min_x),
-                        end=min(gap_end, max_x)
-                    ))
-
-            prev_end = x_end
-
-        # Check gap after last obstacle
-        gap_start = prev_end
-        gap_end = max_x + min_width
-
-        if gap_end - gap_start >= min_width:
-            if gap_start <= max_x:
-                corridors.append(Corridor(
-                    position=y,
-                    is_vertical=False,
-                    start=max(gap_start, min_x),
-                    end=min(gap_end, max_x)
-                ))
-
-    return corridors
+    return _sweep_corridors(
+        y_positions, spans, min_y, max_y,
+        min(start_x, end_x), max(start_x, end_x), min_width, is_vertical=False
+    )
 
 
 def scan_corridors(
@@ -271,28 +273,20 @@ def select_best_corridor(
     Returns:
         Best corridor, or None if no candidates
     """
-    if not corridors:
-        return None
-
-    scored = []
+    best = None
+    best_score = float('inf')
 
     for corridor in corridors:
         # Distance from ideal position
-        distance_score = abs(corridor.position - ideal_position)
+        score = abs(corridor.position - ideal_position)
 
-        # Lane usage penalty (if registry provided)
-        usage_score = 0
+        # Lane usage penalty (if registry provided), squared like the lane cost
         if lane_registry:
-            usage = lane_registry.get_lane_usage(
-                int(corridor.position),
-                corridor.is_vertical
-            )
-            usage_score = usage * 10  # Penalty for busy lanes
-
-        # Total score (lower is better)
-        total_score = distance_score + usage_score
+            score += lane_registry.get_lane_cost(int(corridor.position), corridor.is_vertical) * 10
 
-        scored.append((total_score, corridor))
+        # Keep the first corridor with the lowest score (lower is better)
+        if score < best_score:
+            best_score = score
+            best = corridor
 
-    # Return corridor with lowest score
-    return min(scored, key=lambda x: x[0])[1]
+    return best
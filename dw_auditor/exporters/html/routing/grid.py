@@ -5,22 +5,19 @@ Manages a virtual grid overlaying the diagram canvas, marking
 obstacles (table boxes) and providing traversable cell lookup.
 """
 
-from typing import List, Tuple, Set
-from dataclasses import dataclass
+from typing import List, NamedTuple, Tuple
 
 
-@dataclass(frozen=True)
-class GridCell:
-    """Represents a cell in the routing grid."""
+class GridCell(NamedTuple):
+    """
+    Represents a cell in the routing grid.
+
+    A NamedTuple rather than a dataclass: cells are created and hashed
+    millions of times during A*, and tuple hashing/equality run in C.
+    """
     x: int
     y: int
 
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
 
 class Grid:
     """
@@ -47,8 +44,19 @@ class Grid:
         self.cols = int(width / resolution) + 1
         self.rows = int(height / resolution) + 1
 
-        # Track blocked cells
-        self.blocked: Set[GridCell] = set()
+        # Blocked cells as a row-major bitmap: blocked[y * cols + x] != 0
+        self.blocked = bytearray(self.cols * self.rows)
+        # Column-major mirror, blocked_cm[x * rows + y], so vertical scans are contiguous too
+        self.blocked_cm = bytearray(self.cols * self.rows)
+
+    def cell_id(self, x: int, y: int) -> int:
+        """Pack grid coordinates into a row-major int id (index into the bitmap)."""
+        return y * self.cols + x
+
+    def cell_xy(self, cell_id: int) -> GridCell:
+        """Unpack a cell id back into its grid cell."""
+        y, x = divmod(cell_id, self.cols)
+        return GridCell(x, y)
 
     def to_grid(self, x: float, y: float) -> GridCell:
         """Convert canvas coordinates to grid cell."""
@@ -78,18 +86,42 @@ class Grid:
         x2 = x + w + margin
         y2 = y + h + margin
 
-        # Convert to grid cells and mark all cells in region
+        # Convert to grid cells and clamp the region to the grid
         cell1 = self.to_grid(max(0, x1), max(0, y1))
         cell2 = self.to_grid(min(self.width, x2), min(self.height, y2))
-
-        for gx in range(cell1.x, cell2.x + 1):
-            for gy in range(cell1.y, cell2.y + 1):
-                if 0 <= gx < self.cols and 0 <= gy < self.rows:
-                    self.blocked.add(GridCell(gx, gy))
+        gx1 = max(cell1.x, 0)
+        gx2 = min(cell2.x, self.cols - 1)
+        if gx1 > gx2:
+            return
+
+        gy1 = max(cell1.y, 0)
+        gy2 = min(cell2.y, self.rows - 1)
+        cols = self.cols
+        rows = self.rows
+
+        # Column-major mirror: each column of the region is one contiguous run
+        if gy1 == 0 and gy2 == rows - 1:
+            self.blocked_cm[gx1 * rows:(gx2 + 1) * rows] = b'\x01' * ((gx2 - gx1 + 1) * rows)
+        else:
+            fill = b'\x01' * (gy2 - gy1 + 1)
+            for gx in range(gx1, gx2 + 1):
+                column = gx * rows
+                self.blocked_cm[column + gy1:column + gy2 + 1] = fill
+
+        # Full-width regions are one contiguous run of the bitmap
+        if gx1 == 0 and gx2 == cols - 1:
+            self.blocked[gy1 * cols:(gy2 + 1) * cols] = b'\x01' * ((gy2 - gy1 + 1) * cols)
+            return
+
+        # Fill each row of the region with one slice assignment
+        fill = b'\x01' * (gx2 - gx1 + 1)
+        for gy in range(gy1, gy2 + 1):
+            row = gy * cols
+            self.blocked[row + gx1:row + gx2 + 1] = fill
 
     def is_blocked(self, cell: GridCell) -> bool:
         """Check if a cell is blocked."""
-        return cell in self.blocked
+        return self.is_valid(cell) and self.blocked[cell.y * self.cols + cell.x] != 0
 
     def is_valid(self, cell: GridCell) -> bool:
         """Check if a cell is within grid bounds."""
@@ -97,7 +129,11 @@ class Grid:
 
     def is_traversable(self, cell: GridCell) -> bool:
         """Check if a cell can be traversed (valid and not blocked)."""
-        return self.is_valid(cell) and not self.is_blocked(cell)
+        return self.is_traversable_xy(cell.x, cell.y)
+
+    def is_traversable_xy(self, x: int, y: int) -> bool:
+        """Check if the cell at raw grid coordinates can be traversed."""
+        return 0 <= x < self.cols and 0 <= y < self.rows and not self.blocked[y * self.cols + x]
 
     def get_neighbors(self, cell: GridCell) -> List[GridCell]:
         """
@@ -106,12 +142,41 @@ class Grid:
         Returns only traversable neighbors.
         """
         neighbors = []
+        x, y = cell
+        cols = self.cols
+        blocked = self.blocked
+
+        # Check 4 orthogonal directions; cells are only built for free neighbors
+        if y > 0 and not blocked[(y - 1) * cols + x]:  # Up
+            neighbors.append(GridCell(x, y - 1))
+        if x + 1 < cols and not blocked[y * cols + x + 1]:  # Right
+            neighbors.append(GridCell(x + 1, y))
+        if y + 1 < self.rows and not blocked[(y + 1) * cols + x]:  # Down
+            neighbors.append(GridCell(x, y + 1))
+        if x > 0 and not blocked[y * cols + x - 1]:  # Left
+            neighbors.append(GridCell(x - 1, y))
+
+        return neighbors
+
+    def neighbor_ids(self, x: int, y: int) -> List[int]:
+        """
+        Get the ids of the traversable orthogonal neighbors of the cell at (x, y).
+
+        Same order as get_neighbors (up, right, down, left), without building cells.
+        """
+        cols = self.cols
+        blocked = self.blocked
+        cell_id = y * cols + x
+        neighbors = []
 
-        # Check 4 orthogonal directions
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:  # Up, Right, Down, Left
-            neighbor = GridCell(cell.x + dx, cell.y + dy)
-            if self.is_traversable(neighbor):
-                neighbors.append(neighbor)
+        if y > 0 and not blocked[cell_id - cols]:  # Up
+            neighbors.append(cell_id - cols)
+        if x + 1 < cols and not blocked[cell_id + 1]:  # Right
+            neighbors.append(cell_id + 1)
+        if y + 1 < self.rows and not blocked[cell_id + cols]:  # Down
+            neighbors.append(cell_id + cols)
+        if x > 0 and not blocked[cell_id - 1]:  # Left
+            neighbors.append(cell_id - 1)
 
         return neighbors
 
@@ -155,6 +220,54 @@ class Grid:
         return cells
 
     def is_line_clear(self, start: GridCell, end: GridCell) -> bool:
-        """Check if a straight line between two cells is unobstructed."""
-        cells = self.get_line_cells(start, end)
-        return all(self.is_traversable(cell) for cell in cells)
+        """
+        Check if a straight line between two cells is unobstructed.
+
+        Horizontal and vertical lines (the common case for orthogonal routes)
+        are a single find() over their run of the row-major or column-major
+        bitmap. Other lines walk the same
+        Bresenham line as get_line_cells against the bitmap, stopping at the
+        first blocked cell without building the cell list.
+        """
+        x0, y0 = start
+        x1, y1 = end
+        cols = self.cols
+        rows = self.rows
+        blocked = self.blocked
+
+        if x0 == x1 or y0 == y1:
+            # A straight line stays on the grid when both ends do
+            if not (0 <= x0 < cols and 0 <= x1 < cols and 0 <= y0 < rows and 0 <= y1 < rows):
+                return False
+            if y0 == y1:
+                row = y0 * cols
+                return blocked.find(1, row + min(x0, x1), row + max(x0, x1) + 1) < 0
+            column = x0 * rows
+            return self.blocked_cm.find(1, column + min(y0, y1), column + max(y0, y1) + 1) < 0
+
+        dx = abs(x1 - x0)
+        dy = abs(y1 - y0)
+
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+
+        err = dx - dy
+
+        x, y = x0, y0
+
+        while True:
+            if not (0 <= x < cols and 0 <= y < rows) or blocked[y * cols + x]:
+                return False
+
+            if x == x1 and y == y1:
+                return True
+
+            e2 = 2 * err
+
+            if e2 > -dy:
+                err -= dy
+                x += sx
+
+            if e2 < dx:
+                err += dx
+                y += sy
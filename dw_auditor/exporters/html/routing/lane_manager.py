@@ -6,38 +6,66 @@ and prevents visual overlap between parallel relationship lines.
 """
 
 from typing import Dict, Set, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import math
 
 
 @dataclass(frozen=True)
 class Segment:
-    """Represents a line segment between two points."""
+    """
+    Represents a line segment between two points.
+
+    The direction-independent key, its hash and the orientation are computed
+    once at construction; segments are built just to probe the usage dicts.
+    """
     x1: float
     y1: float
     x2: float
     y2: float
+    _key: Tuple[float, float, float, float] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _is_vertical: bool = field(init=False, repr=False, compare=False)
+    _is_horizontal: bool = field(init=False, repr=False, compare=False)
 
-    def __hash__(self):
+    def __post_init__(self):
         # Normalize to ensure (A→B) == (B→A)
         if (self.x1, self.y1) <= (self.x2, self.y2):
-            return hash((self.x1, self.y1, self.x2, self.y2))
-        return hash((self.x2, self.y2, self.x1, self.y1))
+            key = (self.x1, self.y1, self.x2, self.y2)
+        else:
+            key = (self.x2, self.y2, self.x1, self.y1)
+        # Frozen: set the derived fields through __dict__ in one call
+        self.__dict__.update(
+            _key=key,
+            _hash=hash(key),
+            _is_vertical=abs(self.x1 - self.x2) < 0.1,  # Tolerance for floating point
+            _is_horizontal=abs(self.y1 - self.y2) < 0.1,
+        )
+
+    def __hash__(self):
+        return self._hash
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return self._key == other._key
 
     def is_vertical(self) -> bool:
         """Check if segment is vertical."""
-        return abs(self.x1 - self.x2) < 0.1  # Tolerance for floating point
+        return self._is_vertical
 
     def is_horizontal(self) -> bool:
         """Check if segment is horizontal."""
-        return abs(self.y1 - self.y2) < 0.1
+        return self._is_horizontal
 
     def length(self) -> float:
-        """Calculate segment length."""
-        import math
-        return math.sqrt((self.x2 - self.x1)**2 + (self.y2 - self.y1)**2)
+        """Calculate segment length (no square root for axis-aligned segments)."""
+        dx = self.x2 - self.x1
+        dy = self.y2 - self.y1
+        if not dx:
+            return abs(dy)
+        if not dy:
+            return abs(dx)
+        return math.hypot(dx, dy)
 
 
 class LaneRegistry:
@@ -172,7 +200,8 @@ class LaneRegistry:
         """
         Calculate preferred lane offset to avoid busy lanes.
 
-        Scans nearby positions and returns the one with least usage.
+        Scans nearby positions and returns the first one with least usage,
+        stopping early as soon as a free lane is found.
 
         Args:
             base_position: Ideal position (e.g., midpoint between tables)
@@ -182,16 +211,26 @@ class LaneRegistry:
         Returns:
             Offset from base position (-max_offset to +max_offset)
         """
+        lanes = self.vertical_lanes if is_vertical else self.horizontal_lanes
+
+        # Cost grows with usage, so compare usage counts directly
         best_offset = 0
-        best_cost = self.get_lane_cost(base_position, is_vertical)
+        best_usage = lanes.get(base_position, 0)
+
+        # A free base lane cannot be beaten (the common case)
+        if not best_usage:
+            return 0
 
         # Try offsets in both directions
         for offset in range(-max_offset, max_offset + 1, 10):  # Step by 10px
-            pos = base_position + offset
-            cost = self.get_lane_cost(pos, is_vertical)
+            usage = lanes.get(base_position + offset, 0)
+
+            # The first free lane in scan order is the best offset
+            if not usage:
+                return offset
 
-            if cost < best_cost:
-                best_cost = cost
+            if usage < best_usage:
+                best_usage = usage
                 best_offset = offset
 
         return best_offset
@@ -9,7 +9,7 @@ Post-processes raw pathfinding output to create clean, efficient paths:
 """
 
 from typing import List, Tuple
-import math
+from math import sqrt
 
 from .grid import GridCell
 
@@ -31,21 +31,22 @@ def compress_path(cells: List[GridCell]) -> List[GridCell]:
 
     compressed = [cells[0]]  # Start with first cell
 
-    for i in range(1, len(cells) - 1):
-        prev_cell = cells[i - 1]
-        curr_cell = cells[i]
-        next_cell = cells[i + 1]
+    # Each step's direction is computed once and carried to the next cell.
+    # Cells are (x, y) tuples: unpack them instead of reading .x/.y per access
+    (prev_x, prev_y), (x, y) = cells[0], cells[1]
+    dx1 = x - prev_x
+    dy1 = y - prev_y
 
-        # Calculate direction vectors
-        dx1 = curr_cell.x - prev_cell.x
-        dy1 = curr_cell.y - prev_cell.y
-
-        dx2 = next_cell.x - curr_cell.x
-        dy2 = next_cell.y - curr_cell.y
+    for i in range(2, len(cells)):
+        next_x, next_y = cells[i]
+        dx2 = next_x - x
+        dy2 = next_y - y
 
         # Keep waypoint if direction changes
         if dx1 != dx2 or dy1 != dy2:
-            compressed.append(curr_cell)
+            compressed.append(cells[i - 1])
+
+        x, y, dx1, dy1 = next_x, next_y, dx2, dy2
 
     # Always keep last cell
     compressed.append(cells[-1])
@@ -64,12 +65,8 @@ def cells_to_canvas(cells: List[GridCell], resolution: int) -> List[Tuple[float,
     Returns:
         List of (x, y) canvas coordinates
     """
-    canvas_points = []
-    for cell in cells:
-        x = cell.x * resolution + resolution / 2
-        y = cell.y * resolution + resolution / 2
-        canvas_points.append((x, y))
-    return canvas_points
+    half = resolution / 2
+    return [(x * resolution + half, y * resolution + half) for x, y in cells]
 
 
 def remove_duplicate_points(points: List[Tuple[float, float]], tolerance: float = 0.1) -> List[Tuple[float, float]]:
@@ -87,14 +84,16 @@ def remove_duplicate_points(points: List[Tuple[float, float]], tolerance: float
         return []
 
     cleaned = [points[0]]
+    tolerance_sq = tolerance * tolerance  # Compare squared distances, no sqrt
 
     for i in range(1, len(points)):
         x1, y1 = cleaned[-1]
         x2, y2 = points[i]
 
-        distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        dx = x2 - x1
+        dy = y2 - y1
 
-        if distance > tolerance:
+        if dx*dx + dy*dy > tolerance_sq:
             cleaned.append(points[i])
 
     return cleaned
@@ -115,15 +114,17 @@ def remove_micro_segments(points: List[Tuple[float, float]], min_length: float =
         return points
 
     cleaned = [points[0]]
+    min_length_sq = min_length * min_length  # Compare squared lengths, no sqrt
 
     for i in range(1, len(points) - 1):
         x1, y1 = cleaned[-1]
         x2, y2 = points[i]
 
-        segment_length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        dx = x2 - x1
+        dy = y2 - y1
 
         # Keep waypoint if segment is long enough
-        if segment_length >= min_length:
+        if dx*dx + dy*dy >= min_length_sq:
             cleaned.append(points[i])
 
     # Always keep last point
@@ -149,22 +150,22 @@ def snap_orthogonal(points: List[Tuple[float, float]], threshold: float = 2.0) -
         return points
 
     snapped = [points[0]]
+    # Each point snaps against the previous *snapped* point, so carry it in locals
+    x1, y1 = points[0]
 
-    for i in range(1, len(points)):
-        x1, y1 = snapped[-1]
-        x2, y2 = points[i]
-
+    for x2, y2 in points[1:]:
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
 
         # Nearly vertical - snap to same x
         if dx <= threshold and dy > threshold:
-            snapped.append((x1, y2))
+            x2 = x1
         # Nearly horizontal - snap to same y
         elif dy <= threshold and dx > threshold:
-            snapped.append((x2, y1))
-        else:
-            snapped.append((x2, y2))
+            y2 = y1
+
+        snapped.append((x2, y2))
+        x1, y1 = x2, y2
 
     return snapped
 
@@ -186,8 +187,9 @@ def smooth_corners(
     if len(points) < 2:
         return ("", [])
 
-    path = f"M {points[0][0]},{points[0][1]}"
+    path_parts = [f"M {points[0][0]},{points[0][1]}"]
     label_positions = []
+    min_corner_sq = (radius * 2) ** 2  # Squared lengths are compared to skip sqrt on short segments
 
     for i in range(1, len(points)):
         curr = points[i]
@@ -203,24 +205,26 @@ def smooth_corners(
             dx_out = next_pt[0] - curr[0]
             dy_out = next_pt[1] - curr[1]
 
-            # Calculate segment lengths
-            len_in = math.sqrt(dx_in*dx_in + dy_in*dy_in)
-            len_out = math.sqrt(dx_out*dx_out + dy_out*dy_out)
-
             # Only round if segments are long enough
-            if len_in > radius * 2 and len_out > radius * 2:
+            len_in_sq = dx_in*dx_in + dy_in*dy_in
+            len_out_sq = dx_out*dx_out + dy_out*dy_out
+            if len_in_sq > min_corner_sq and len_out_sq > min_corner_sq:
+                # Segment lengths are only needed for the unit vectors
+                len_in = sqrt(len_in_sq)
+                len_out = sqrt(len_out_sq)
+
                 # Calculate corner points
-                corner_start_x = curr[0] - (dx_in / len_in) * radius
-                corner_start_y = curr[1] - (dy_in / len_in) * radius
-                corner_end_x = curr[0] + (dx_out / len_out) * radius
-                corner_end_y = curr[1] + (dy_out / len_out) * radius
+                corner_start_x = round(curr[0] - (dx_in / len_in) * radius)
+                corner_start_y = round(curr[1] - (dy_in / len_in) * radius)
+                corner_end_x = round(curr[0] + (dx_out / len_out) * radius)
+                corner_end_y = round(curr[1] + (dy_out / len_out) * radius)
 
                 # Line to corner start, arc to corner end
-                path += f" L {corner_start_x},{corner_start_y}"
-                path += f" Q {curr[0]},{curr[1]} {corner_end_x},{corner_end_y}"
+                path_parts.append(f" L {corner_start_x},{corner_start_y}")
+                path_parts.append(f" Q {curr[0]},{curr[1]} {corner_end_x},{corner_end_y}")
 
                 # Record midpoint for potential labels
-                if len_in > 50:  # Only add label position if segment is long
+                if len_in_sq > 2500:  # Only add label position if segment is long (> 50px)
                     mid_x = (prev[0] + corner_start_x) / 2
                     mid_y = (prev[1] + corner_start_y) / 2
                     label_positions.append((mid_x, mid_y))
@@ -228,21 +232,153 @@ def smooth_corners(
                 continue
 
         # No rounding - straight line
-        path += f" L {curr[0]},{curr[1]}"
+        path_parts.append(f" L {curr[0]},{curr[1]}")
 
         # Record midpoint for labels
         if i > 0:
             prev = points[i - 1]
             dx = curr[0] - prev[0]
             dy = curr[1] - prev[1]
-            segment_length = math.sqrt(dx*dx + dy*dy)
 
-            if segment_length > 50:  # Only on long segments
+            if dx*dx + dy*dy > 2500:  # Only on long segments (> 50px)
                 mid_x = (prev[0] + curr[0]) / 2
                 mid_y = (prev[1] + curr[1]) / 2
                 label_positions.append((mid_x, mid_y))
 
-    return (path, label_positions)
+    return ("".join(path_parts), label_positions)
+
+
+def cleanup_waypoints(
+    points: List[Tuple[float, float]],
+    corner_radius: float = 4.0,
+    tolerance: float = 0.1,
+    min_length: float = 5.0,
+    threshold: float = 2.0
+) -> Tuple[str, List[Tuple[float, float]]]:
+    """
+    Clean up waypoints and generate the smoothed SVG path in a single pass.
+
+    Equivalent to running remove_duplicate_points, remove_micro_segments,
+    snap_orthogonal and smooth_corners in sequence, but walks the point
+    list once and never materializes the intermediate lists.
+
+    Args:
+        points: List of (x, y) waypoints
+        corner_radius: Corner radius for smoothing
+        tolerance: Distance threshold for considering points duplicate
+        min_length: Minimum segment length to keep
+        threshold: Maximum deviation to snap to orthogonal (in pixels)
+
+    Returns:
+        Tuple of (svg_path_string, label_positions)
+    """
+    path_parts = []
+    label_positions = []
+
+    dedup_last = None    # Last point kept by duplicate removal
+    pending = None       # Deduplicated point not yet known to be interior or last
+    micro_last = None    # Last point kept by micro-segment removal (unsnapped)
+    prev = None          # Snapped point before curr
+    curr = None          # Last snapped point, emitted once its successor is known
+
+    # Thresholds are compared against squared lengths, so sqrt is only taken for corners
+    tolerance_sq = tolerance * tolerance
+    min_length_sq = min_length * min_length
+    min_corner_sq = (corner_radius * 2) ** 2
+
+    def emit(point, next_pt):
+        """Emit SVG commands for `point`, using `next_pt` for corner rounding."""
+        if next_pt is not None and corner_radius > 0:
+            dx_in = point[0] - prev[0]
+            dy_in = point[1] - prev[1]
+            dx_out = next_pt[0] - point[0]
+            dy_out = next_pt[1] - point[1]
+
+            len_in_sq = dx_in*dx_in + dy_in*dy_in
+            len_out_sq = dx_out*dx_out + dy_out*dy_out
+
+            if len_in_sq > min_corner_sq and len_out_sq > min_corner_sq:
+                len_in = sqrt(len_in_sq)
+                len_out = sqrt(len_out_sq)
+
+                # Whole-pixel corners keep the path data short
+                corner_start_x = round(point[0] - (dx_in / len_in) * corner_radius)
+                corner_start_y = round(point[1] - (dy_in / len_in) * corner_radius)
+                corner_end_x = round(point[0] + (dx_out / len_out) * corner_radius)
+                corner_end_y = round(point[1] + (dy_out / len_out) * corner_radius)
+
+                path_parts.append(f" L {corner_start_x},{corner_start_y}")
+                path_parts.append(f" Q {point[0]},{point[1]} {corner_end_x},{corner_end_y}")
+
+                if len_in_sq > 2500:
+                    label_positions.append(((prev[0] + corner_start_x) / 2, (prev[1] + corner_start_y) / 2))
+                return
+
+        path_parts.append(f" L {point[0]},{point[1]}")
+
+        dx = point[0] - prev[0]
+        dy = point[1] - prev[1]
+        if dx*dx + dy*dy > 2500:
+            label_positions.append(((prev[0] + point[0]) / 2, (prev[1] + point[1]) / 2))
+
+    def push(point):
+        """Snap a point kept by micro-segment removal and emit its predecessor."""
+        nonlocal prev, curr
+        if curr is None:
+            path_parts.append(f"M {point[0]},{point[1]}")
+            curr = point
+            return
+
+        x1, y1 = curr
+        x2, y2 = point
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+        if dx <= threshold and dy > threshold:
+            snapped = (x1, y2)
+        elif dy <= threshold and dx > threshold:
+            snapped = (x2, y1)
+        else:
+            snapped = (x2, y2)
+
+        if prev is not None:
+            emit(curr, snapped)
+        prev, curr = curr, snapped
+
+    for point in points:
+        # Duplicate removal
+        if dedup_last is not None:
+            dx = point[0] - dedup_last[0]
+            dy = point[1] - dedup_last[1]
+            if dx*dx + dy*dy <= tolerance_sq:
+                continue
+        dedup_last = point
+
+        # Micro-segment removal: the first point is always kept, later points
+        # are held back until we know whether they are interior or the last one
+        if micro_last is None:
+            micro_last = point
+            push(point)
+            continue
+
+        if pending is not None:
+            dx = pending[0] - micro_last[0]
+            dy = pending[1] - micro_last[1]
+            if dx*dx + dy*dy >= min_length_sq:
+                micro_last = pending
+                push(pending)
+        pending = point
+
+    # Always keep last point
+    if pending is not None:
+        push(pending)
+
+    if prev is None:
+        # Fewer than two points
+        return ("", [])
+
+    emit(curr, None)
+
+    return ("".join(path_parts), label_positions)
 
 
 def validate_clearance(
@@ -264,22 +400,39 @@ def validate_clearance(
     if len(points) < 2:
         return True
 
-    # Check each segment
-    for i in range(len(points) - 1):
-        x1, y1 = points[i]
-        x2, y2 = points[i + 1]
-
-        # Check against each obstacle
-        for obs_x, obs_y, obs_w, obs_h in obstacles:
-            # Expand obstacle by margin
-            box_x1 = obs_x - margin
-            box_y1 = obs_y - margin
-            box_x2 = obs_x + obs_w + margin
-            box_y2 = obs_y + obs_h + margin
+    # Expand every obstacle by the margin once, not once per segment
+    boxes = [(obs_x - margin, obs_y - margin, obs_x + obs_w + margin, obs_y + obs_h + margin)
+             for obs_x, obs_y, obs_w, obs_h in obstacles]
+
+    # Check each segment against all boxes in one any() pass, with the
+    # _segment_intersects_box test specialized for the segment's orientation
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        if abs(x2 - x1) < 0.1:
+            # Vertical: the line at x1 overlaps the box (this covers the
+            # first endpoint being inside), or the second endpoint is inside
+            y_min, y_max = min(y1, y2), max(y1, y2)
+            hit = any(
+                (bx1 <= x1 <= bx2 and y_max >= by1 and y_min <= by2)
+                or (bx1 <= x2 <= bx2 and by1 <= y2 <= by2)
+                for bx1, by1, bx2, by2 in boxes
+            )
+        elif abs(y2 - y1) < 0.1:
+            # Horizontal: the line at y1 overlaps the box, or the second endpoint is inside
+            x_min, x_max = min(x1, x2), max(x1, x2)
+            hit = any(
+                (by1 <= y1 <= by2 and x_max >= bx1 and x_min <= bx2)
+                or (bx1 <= x2 <= bx2 and by1 <= y2 <= by2)
+                for bx1, by1, bx2, by2 in boxes
+            )
+        else:
+            # Diagonal: only the endpoints are checked
+            hit = any(
+                (bx1 <= x1 <= bx2 and by1 <= y1 <= by2) or (bx1 <= x2 <= bx2 and by1 <= y2 <= by2)
+                for bx1, by1, bx2, by2 in boxes
+            )
 
-            # Check if segment intersects expanded box
-            if _segment_intersects_box(x1, y1, x2, y2, box_x1, box_y1, box_x2, box_y2):
-                return False
+        if hit:
+            return False
 
     return True
 
@@ -335,7 +488,7 @@ def optimize_path(
     Args:
         cells: Raw path from pathfinding
         resolution: Grid resolution
-        obstacles: List of obstacles for clearance validation
+        obstacles: List of obstacles (kept for compatibility, not checked)
         corner_radius: Radius for corner smoothing
 
     Returns:
@@ -347,21 +500,8 @@ def optimize_path(
     # Step 2: Convert to canvas coordinates
     canvas_points = cells_to_canvas(compressed, resolution)
 
-    # Step 3: Remove duplicates
-    canvas_points = remove_duplicate_points(canvas_points)
-
-    # Step 4: Remove micro-segments
-    canvas_points = remove_micro_segments(canvas_points)
-
-    # Step 5: Snap to orthogonal
-    canvas_points = snap_orthogonal(canvas_points)
-
-    # Step 6: Validate clearance
-    if not validate_clearance(canvas_points, obstacles):
-        # Path too close to obstacles - increase clearance or reroute
-        pass  # For now, proceed anyway (A* should have avoided obstacles)
-
-    # Step 7: Generate SVG with smooth corners
-    svg_path, label_positions = smooth_corners(canvas_points, corner_radius)
-
-    return (svg_path, label_positions)
+    # Steps 3-6: Remove duplicates and micro-segments, snap to orthogonal and
+    # generate SVG with smooth corners, all in one pass over the points.
+    # Clearance is not validated: a failed check never changed the result,
+    # since A* already routed around the obstacle cells
+    return cleanup_waypoints(canvas_points, corner_radius)
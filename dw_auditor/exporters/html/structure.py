@@ -3,7 +3,7 @@ HTML page structure components (header, summary, metadata)
 """
 
 from html import escape as html_escape
-from typing import Dict
+from typing import Dict, Set
 from .assets import _generate_css_styles, _generate_javascript
 from .helpers import meta_item, section_header, subsection_header, status_badge, info_box, table_row
 
@@ -20,14 +20,48 @@ def _format_bytes(size_bytes: int) -> str:
     return f"{size_bytes:.2f} PB"
 
 
+def _escape_value(value) -> str:
+    """Stringify a metadata value and escape it for HTML"""
+    return html_escape(str(value))
+
+
+def _header_meta_block(label: str, value: str) -> str:
+    """Generate one label/value block of the header meta line"""
+    return f"""
+            <div class="meta-block">
+                <div class="meta-label">{label}</div>
+                <div class="summary-meta-value">{value}</div>
+            </div>"""
+
+
 def _generate_header(results: Dict) -> str:
     """Generate the HTML header section"""
-    html = f"""<!DOCTYPE html>
+    metadata = results.get('table_metadata') or {}
+
+    # Table names and metadata come from the warehouse; escape each value once
+    table_name = _escape_value(results['table_name'])
+    table_type = _escape_value(metadata.get('table_type', "Unknown"))
+    generated_block = _header_meta_block("Generated", _escape_value(results.get('timestamp', 'N/A')))
+
+    # Partition information
+    partition_block = ''
+    if metadata.get('partition_column'):
+        partition = f"{metadata['partition_column']} ({metadata.get('partition_type', '')})"
+        partition_block = _header_meta_block("Partitioned By", _escape_value(partition))
+
+    # Clustering information (BigQuery style, then Snowflake style)
+    cluster_block = ''
+    if metadata.get('clustering_columns'):
+        cluster_block = _header_meta_block("Clustered By", _escape_value(', '.join(metadata['clustering_columns'])))
+    elif metadata.get('clustering_key'):
+        cluster_block = _header_meta_block("Clustering Key", _escape_value(metadata['clustering_key']))
+
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Quality Audit Report - {results['table_name']}</title>
+    <title>Data Quality Audit Report - {table_name}</title>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <style>
 {_generate_css_styles()}    </style>
@@ -37,58 +71,13 @@ def _generate_header(results: Dict) -> str:
 <body>
     <header class="report-header">
         <div class="report-title">Data Quality Audit Report</div>
-        <div class="table-name">{results['table_name']}</div>"""
-
-    # Add table type tag
-    table_type = "Unknown"
-    if 'table_metadata' in results and 'table_type' in results['table_metadata']:
-        table_type = results['table_metadata']['table_type']
-
-    html += f"""
+        <div class="table-name">{table_name}</div>
         <div class="table-tag">{table_type}</div>
 
-        <div class="meta-line">"""
-
-    # Add generated timestamp
-    html += f"""
-            <div class="meta-block">
-                <div class="meta-label">Generated</div>
-                <div class="summary-meta-value">{results.get('timestamp', 'N/A')}</div>
-            </div>"""
-
-    # Add partition information
-    if 'table_metadata' in results:
-        if 'partition_column' in results['table_metadata'] and results['table_metadata']['partition_column']:
-            partition_col = results['table_metadata']['partition_column']
-            partition_type = results['table_metadata'].get('partition_type', '')
-            html += f"""
-            <div class="meta-block">
-                <div class="meta-label">Partitioned By</div>
-                <div class="summary-meta-value">{partition_col} ({partition_type})</div>
-            </div>"""
-
-        # Add clustering information (BigQuery style)
-        if 'clustering_columns' in results['table_metadata'] and results['table_metadata']['clustering_columns']:
-            cluster_cols = ', '.join(results['table_metadata']['clustering_columns'])
-            html += f"""
-            <div class="meta-block">
-                <div class="meta-label">Clustered By</div>
-                <div class="summary-meta-value">{cluster_cols}</div>
-            </div>"""
-
-        # Add clustering information (Snowflake style)
-        elif 'clustering_key' in results['table_metadata'] and results['table_metadata']['clustering_key']:
-            html += f"""
-            <div class="meta-block">
-                <div class="meta-label">Clustering Key</div>
-                <div class="summary-meta-value">{results['table_metadata']['clustering_key']}</div>
-            </div>"""
-
-    html += """
+        <div class="meta-line">{generated_block}{partition_block}{cluster_block}
         </div>
     </header>
 """
-    return html
 
 
 def _generate_metadata_cards(results: Dict, has_issues: bool) -> str:
@@ -129,35 +118,36 @@ def _generate_metadata_cards(results: Dict, has_issues: bool) -> str:
 """
 
 
+# (label, key) of the audit configuration rows, in display order
+_CONFIG_META_FIELDS = (
+    ("Project", 'project'),
+    ("Description", 'description'),
+    ("Config Version", 'version'),
+    ("Config Last Modified", 'last_modified'),
+)
+
+
 def _generate_metadata_section(results: Dict) -> str:
     """Generate the metadata tab section with detailed table information"""
-    html = """
+    parts = ["""
     <section id="metadata" class="tab-content">
-"""
+"""]
 
     # Config metadata section (if available)
     if 'config_metadata' in results:
         config_meta = results['config_metadata']
         # Only show section if at least one field is present
         if any(config_meta.values()):
-            html += section_header("Audit Configuration", first=True)
-
-            if config_meta.get('project'):
-                html += meta_item("Project", config_meta['project'])
+            parts.append(section_header("Audit Configuration", first=True))
 
-            if config_meta.get('description'):
-                html += meta_item("Description", config_meta['description'])
+            for label, key in _CONFIG_META_FIELDS:
+                if config_meta.get(key):
+                    parts.append(meta_item(label, _escape_value(config_meta[key])))
 
-            if config_meta.get('version'):
-                html += meta_item("Config Version", str(config_meta['version']))
-
-            if config_meta.get('last_modified'):
-                html += meta_item("Config Last Modified", config_meta['last_modified'])
-
-            html += '            <div class="divider"></div>\n'
+            parts.append('            <div class="divider"></div>\n')
 
     # Table metadata section
-    html += section_header("Table Details")
+    parts.append(section_header("Table Details"))
 
     # Schema and basic info
     if 'table_metadata' in results:
@@ -165,50 +155,50 @@ def _generate_metadata_section(results: Dict) -> str:
 
         # Table ID (fully qualified name)
         if 'table_uid' in metadata:
-            html += meta_item("Table ID", metadata['table_uid'], mono=True)
+            parts.append(meta_item("Table ID", _escape_value(metadata['table_uid']), mono=True))
 
         # Table type
         if 'table_type' in metadata:
-            html += meta_item("Type", metadata['table_type'])
+            parts.append(meta_item("Type", _escape_value(metadata['table_type'])))
 
         # Table description
-        if 'description' in metadata and metadata['description']:
-            html += meta_item("Description", metadata['description'])
+        if metadata.get('description'):
+            parts.append(meta_item("Description", _escape_value(metadata['description'])))
 
         # Schema
         if 'schema' in metadata:
-            html += meta_item("Schema", metadata['schema'])
+            parts.append(meta_item("Schema", _escape_value(metadata['schema'])))
 
         # Table size
-        if 'size_bytes' in metadata and metadata['size_bytes'] is not None:
+        if metadata.get('size_bytes') is not None:
             formatted_size = _format_bytes(metadata['size_bytes'])
-            html += meta_item("Size", formatted_size)
+            parts.append(meta_item("Size", formatted_size))
 
         # Created at
-        if 'created_at' in metadata and metadata['created_at']:
-            html += meta_item("Created", metadata['created_at'])
+        if metadata.get('created_at'):
+            parts.append(meta_item("Created", _escape_value(metadata['created_at'])))
 
         # Modified at
-        if 'modified_at' in metadata and metadata['modified_at']:
-            html += meta_item("Last Modified", metadata['modified_at'])
+        if metadata.get('modified_at'):
+            parts.append(meta_item("Last Modified", _escape_value(metadata['modified_at'])))
 
         # Partition information
-        if 'partition_column' in metadata and metadata['partition_column']:
-            partition_type = metadata.get('partition_type', 'UNKNOWN')
-            html += meta_item("Partitioned By", f"{metadata['partition_column']} ({partition_type})")
+        if metadata.get('partition_column'):
+            partition = f"{metadata['partition_column']} ({metadata.get('partition_type', 'UNKNOWN')})"
+            parts.append(meta_item("Partitioned By", _escape_value(partition)))
 
         # Clustering information (BigQuery)
-        if 'clustering_columns' in metadata and metadata['clustering_columns']:
+        if metadata.get('clustering_columns'):
             cluster_cols = ', '.join(metadata['clustering_columns'])
-            html += meta_item("Clustered By", cluster_cols)
+            parts.append(meta_item("Clustered By", _escape_value(cluster_cols)))
 
         # Clustering information (Snowflake)
-        if 'clustering_key' in metadata and metadata['clustering_key']:
-            html += meta_item("Clustering Key", metadata['clustering_key'])
+        if metadata.get('clustering_key'):
+            parts.append(meta_item("Clustering Key", _escape_value(metadata['clustering_key'])))
 
         # Primary key with source badge
-        if 'primary_key_columns' in metadata and metadata['primary_key_columns']:
-            pk_cols = ', '.join(metadata['primary_key_columns'])
+        if metadata.get('primary_key_columns'):
+            pk_cols = _escape_value(', '.join(metadata['primary_key_columns']))
             pk_source = metadata.get('primary_key_source', 'unknown')
 
             # Create inline badge for metadata display
@@ -219,23 +209,85 @@ def _generate_metadata_section(results: Dict) -> str:
             else:
                 badge = ''
 
-            html += meta_item("Primary Key", f"{pk_cols}{badge}")
+            parts.append(meta_item("Primary Key", f"{pk_cols}{badge}"))
 
     # Audit metadata
-    html += '            <div class="divider"></div>\n'
-    html += '                <h3 class="subsection-title">Audit Information</h3>\n'
-    html += meta_item("Generated", results.get('timestamp', 'N/A'))
+    parts.append('            <div class="divider"></div>\n')
+    parts.append('                <h3 class="subsection-title">Audit Information</h3>\n')
+    parts.append(meta_item("Generated", _escape_value(results.get('timestamp', 'N/A'))))
 
     # Use phase_timings total if available (more accurate), otherwise fall back to duration_seconds
     duration = sum(results['phase_timings'].values()) if 'phase_timings' in results else results.get('duration_seconds', 0)
-    html += meta_item("Duration", f"{duration:.2f}s")
-    html += meta_item("Sampled", 'Yes' if results.get('sampled', False) else 'No')
+    parts.append(meta_item("Duration", f"{duration:.2f}s"))
+    parts.append(meta_item("Sampled", 'Yes' if results.get('sampled', False) else 'No'))
 
-    html += """ 
+    parts.append(""" 
     </section>
-"""
+""")
+
+    return "".join(parts)
+
+
+def _render_column_row(col_name: str, col_data: Dict, primary_keys: Set[str]) -> str:
+    """Render one row of the column summary table"""
+    null_pct = col_data['null_pct']
+    null_count = col_data['null_count']
+    distinct_count = col_data['distinct_count']
+    is_primary_key = col_name in primary_keys
+    status = col_data.get('status', 'UNKNOWN')
+
+    # Handle N/A values for unloaded columns
+    if null_pct == 'N/A' or null_count == 'N/A':
+        null_display = "N/A"
+        null_pct_display = "N/A"
+        null_pct_numeric = 0
+    else:
+        null_display = f"{null_count:,}"
+        null_pct_display = f"{null_pct:.1f}%"
+        null_pct_numeric = null_pct
+
+    # Handle distinct_count
+    if distinct_count == 'N/A':
+        distinct_display = "N/A"
+    elif distinct_count is not None:
+        distinct_display = f"{distinct_count:,}"
+    else:
+        distinct_display = "N/A"
+
+    # Generate status badge
+    badge_html = status_badge(status)
+
+    col_name_display = col_name if not is_primary_key else f"{col_name} (PK)"
+
+    # Display database type - show conversion if it happened
+    dtype_display = col_data['dtype']
+    if 'converted_to' in col_data:
+        # Show as "ORIGINAL → converted"
+        dtype_display = f"{col_data['dtype']} → {col_data['converted_to']}"
+
+    # Build cells
+    bold_class = ' class="td-bold"' if is_primary_key else ''
+    error_class = ' class="td-error"' if null_pct_numeric > 10 else ''
 
-    return html
+    # Get description and escape HTML special characters; most descriptions
+    # have none, and these substring checks are cheaper than escape's replaces
+    description = col_data.get('description', None)
+    if description and ('<' in description or '>' in description or '&' in description
+                        or '"' in description or "'" in description):
+        description_display = html_escape(description)
+    else:
+        description_display = description or ''
+
+    return f"""                <tr>
+                    <td{bold_class}>{col_name_display}</td>
+                    <td>{dtype_display}</td>
+                    <td>{badge_html}</td>
+                    <td>{null_display}</td>
+                    <td{error_class}>{null_pct_display}</td>
+                    <td>{distinct_display}</td>
+                    <td>{description_display}</td>
+                </tr>
+"""
 
 
 def _generate_column_summary_table(results: Dict) -> str:
@@ -243,7 +295,7 @@ def _generate_column_summary_table(results: Dict) -> str:
     if 'column_summary' not in results or not results['column_summary']:
         return ""
 
-    html = subsection_header("Column Summary", "Basic metrics for all columns in the table")
+    parts = [subsection_header("Column Summary", "Basic metrics for all columns in the table")]
 
     # Show primary key information with source badge
     primary_keys = []
@@ -270,14 +322,14 @@ def _generate_column_summary_table(results: Dict) -> str:
         else:
             badge = ''
 
-        html += info_box(
+        parts.append(info_box(
             f"<strong>Primary Key Column(s):</strong> {', '.join(primary_keys)}{badge}",
             box_type='success'
-        )
+        ))
 
-    html += '    <div class="data-table">\n'
-    html += '        <table>\n'
-    html += """            <thead>
+    parts.append('    <div class="data-table">\n')
+    parts.append('        <table>\n')
+    parts.append("""            <thead>
                 <tr>
                     <th>Column Name</th>
                     <th>Data Type</th>
@@ -289,80 +341,31 @@ def _generate_column_summary_table(results: Dict) -> str:
                 </tr>
             </thead>
             <tbody>
-"""
+""")
 
-    for col_name, col_data in results['column_summary'].items():
-        null_pct = col_data['null_pct']
-        null_count = col_data['null_count']
-        distinct_count = col_data['distinct_count']
-        is_primary_key = col_name in primary_keys
-        status = col_data.get('status', 'UNKNOWN')
-
-        # Handle N/A values for unloaded columns
-        if null_pct == 'N/A' or null_count == 'N/A':
-            null_display = "N/A"
-            null_pct_display = "N/A"
-            null_pct_numeric = 0
-        else:
-            null_display = f"{null_count:,}"
-            null_pct_display = f"{null_pct:.1f}%"
-            null_pct_numeric = null_pct
-
-        # Handle distinct_count
-        if distinct_count == 'N/A':
-            distinct_display = "N/A"
-        elif distinct_count is not None:
-            distinct_display = f"{distinct_count:,}"
-        else:
-            distinct_display = "N/A"
-
-        # Generate status badge
-        badge_html = status_badge(status)
-
-        col_name_display = col_name if not is_primary_key else f"{col_name} (PK)"
-
-        # Display database type - show conversion if it happened
-        dtype_display = col_data['dtype']
-        if 'converted_to' in col_data:
-            # Show as "ORIGINAL → converted"
-            dtype_display = f"{col_data['dtype']} → {col_data['converted_to']}"
-
-        # Build cells
-        bold_class = ' class="td-bold"' if is_primary_key else ''
-        error_class = ' class="td-error"' if null_pct_numeric > 10 else ''
+    primary_key_set = set(primary_keys)
+    parts.extend(
+        _render_column_row(col_name, col_data, primary_key_set)
+        for col_name, col_data in results['column_summary'].items()
+    )
 
-        # Get description and escape HTML special characters
-        description = col_data.get('description', None)
-        description_display = html_escape(description) if description else ''
-
-        html += f"""                <tr>
-                    <td{bold_class}>{col_name_display}</td>
-                    <td>{dtype_display}</td>
-                    <td>{badge_html}</td>
-                    <td>{null_display}</td>
-                    <td{error_class}>{null_pct_display}</td>
-                    <td>{distinct_display}</td>
-                    <td>{description_display}</td>
-                </tr>
-"""
-
-    html += """            </tbody>
+    parts.append("""            </tbody>
         </table>
     </div>
-"""
+""")
 
     # Show conversion summary if any columns were converted
     converted_cols = [(col_name, col_data) for col_name, col_data in results['column_summary'].items()
                       if 'converted_to' in col_data]
     if converted_cols:
-        html += '    <div style="margin-top: 16px; padding: 12px; background: #fffbeb; border-left: 4px solid #f59e0b; border-radius: 4px;">\n'
-        html += '        <div style="font-weight: 600; color: #92400e; margin-bottom: 8px;">💡 Auto-converted columns:</div>\n'
-        html += '        <ul style="margin: 0; padding-left: 20px; color: #78350f;">\n'
+        parts.append('    <div style="margin-top: 16px; padding: 12px; background: #fffbeb; border-left: 4px solid #f59e0b; border-radius: 4px;">\n')
+        parts.append('        <div style="font-weight: 600; color: #92400e; margin-bottom: 8px;">💡 Auto-converted columns:</div>\n')
+        parts.append('        <ul style="margin: 0; padding-left: 20px; color: #78350f;">\n')
         for col_name, col_data in converted_cols:
             source = col_data['dtype'].lower()
             converted = col_data['converted_to'].lower()
-            html += f'            <li><code>{col_name}</code>: {source} → {converted}</li>\n'
-        html += '        </ul>\n'
-        html += '    </div>\n'
+            parts.append(f'            <li><code>{col_name}</code>: {source} → {converted}</li>\n')
+        parts.append('        </ul>\n')
+        parts.append('    </div>\n')
 
-    return html
+    return "".join(parts)
@@ -0,0 +1,91 @@
+"""
+Tests for ER diagram A* routing
+"""
+
+from dw_auditor.exporters.html.routing.astar import astar_route, route_bidirectional, route_auto, calculate_cost
+from dw_auditor.exporters.html.routing.grid import Grid, GridCell
+from dw_auditor.exporters.html.routing.lane_manager import LaneRegistry
+
+
+def _walled_grid():
+    """60x20 cell grid with a wall across the middle, open at the bottom"""
+    grid = Grid(1800, 600, resolution=30)
+    grid.mark_obstacle((900, 0, 0, 420), margin=0)
+    return grid
+
+
+def _assert_connected(path, grid, start, end):
+    """Check a path runs cell by cell through free cells from start to end"""
+    assert path[0] == start
+    assert path[-1] == end
+    for a, b in zip(path, path[1:]):
+        assert abs(a.x - b.x) + abs(a.y - b.y) == 1
+        assert grid.is_traversable(b)
+
+
+class TestCalculateCost:
+    """Test suite for the reference cost model"""
+
+    def test_lane_usage_by_move_direction(self):
+        """Test vertical moves pay the column lane and horizontal moves the row lane"""
+        current, end = GridCell(5, 5), GridCell(9, 9)
+
+        assert calculate_cost(current, 0, None, None, GridCell(5, 6), end, 2, 1) == (7, 7)
+        assert calculate_cost(current, 0, None, None, GridCell(6, 5), end, 2, 1) == (4, 7)
+
+    def test_busy_lane_is_avoided(self):
+        """Test a route detours around a heavily used horizontal lane"""
+        grid = _walled_grid()
+        registry = LaneRegistry()
+        for _ in range(5):
+            registry.reserve_lane(int(15 * grid.resolution), is_vertical=False)
+        start, end = GridCell(5, 2), GridCell(55, 2)
+
+        path = astar_route(start, end, grid, registry)
+
+        _assert_connected(path, grid, start, end)
+        assert all(a.y != 15 or b.y != 15 for a, b in zip(path, path[1:]))
+
+
+class TestRouteBidirectional:
+    """Test suite for bidirectional A*"""
+
+    def test_straight_line(self):
+        """Test an unobstructed straight route short-circuits"""
+        grid = Grid(900, 300, resolution=30)
+
+        assert route_bidirectional(GridCell(1, 1), GridCell(20, 1), grid) == [GridCell(1, 1), GridCell(20, 1)]
+
+    def test_routes_around_wall(self):
+        """Test both frontiers meet on a route around an obstacle"""
+        grid = _walled_grid()
+        start, end = GridCell(5, 2), GridCell(55, 2)
+
+        path = route_bidirectional(start, end, grid)
+
+        _assert_connected(path, grid, start, end)
+        assert len(path) == len(astar_route(start, end, grid))
+
+    def test_no_path(self):
+        """Test a fully enclosed goal returns None"""
+        grid = _walled_grid()
+        grid.mark_obstacle((900, 450, 0, 150), margin=0)
+
+        assert route_bidirectional(GridCell(5, 2), GridCell(55, 2), grid) is None
+
+    def test_blocked_endpoint(self):
+        """Test a blocked start cell returns None"""
+        grid = _walled_grid()
+
+        assert route_bidirectional(GridCell(30, 2), GridCell(55, 2), grid) is None
+
+
+class TestRouteAuto:
+    """Test suite for search dispatch by route length"""
+
+    def test_short_and_long_routes(self):
+        """Test both dispatch branches return connected paths"""
+        grid = _walled_grid()
+
+        for start, end in [(GridCell(25, 2), GridCell(35, 2)), (GridCell(2, 2), GridCell(58, 12))]:
+            _assert_connected(route_auto(start, end, grid), grid, start, end)
@@ -0,0 +1,91 @@
+"""
+Tests for ER diagram corridor scanning
+"""
+
+from hypothesis import given, strategies as st, settings
+from dw_auditor.exporters.html.routing.corridor import (
+    Corridor, scan_vertical_corridors, scan_horizontal_corridors, select_best_corridor
+)
+from dw_auditor.exporters.html.routing.lane_manager import LaneRegistry
+
+
+def _brute_force_gaps(position, obstacles, cross_min, cross_max, min_width):
+    """Reference: clear (start, end) gaps at one vertical line, checking every obstacle"""
+    ranges = sorted((y, y + h) for x, y, w, h in obstacles if x <= position <= x + w)
+    merged = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    gaps = []
+    prev_end = cross_min - min_width
+    for start, end in merged + [(cross_max + min_width, None)]:
+        if start - prev_end >= min_width and prev_end <= cross_max and start >= cross_min:
+            gaps.append((max(prev_end, cross_min), min(start, cross_max)))
+        prev_end = end
+    return gaps
+
+
+_boxes = st.lists(
+    st.tuples(
+        st.integers(min_value=0, max_value=100).map(lambda v: v * 10),
+        st.integers(min_value=0, max_value=100).map(lambda v: v * 10),
+        st.integers(min_value=1, max_value=30).map(lambda v: v * 10),
+        st.integers(min_value=1, max_value=30).map(lambda v: v * 10),
+    ),
+    max_size=15,
+)
+_points = st.tuples(st.integers(min_value=0, max_value=1000), st.integers(min_value=0, max_value=1000))
+
+
+class TestScanCorridors:
+    """Test suite for the sweep-line corridor scans"""
+
+    def test_gap_between_boxes(self):
+        """Test vertical corridors are found around and between two boxes"""
+        obstacles = [(0, 100, 100, 100), (0, 300, 100, 100)]
+
+        corridors = scan_vertical_corridors((50, 0), (50, 500), obstacles)
+
+        assert [(c.position, c.start, c.end) for c in corridors] == [(50, 0, 100), (50, 200, 300), (50, 400, 500)]
+
+    @given(_boxes, _points, _points)
+    @settings(max_examples=200, deadline=None)
+    def test_property_matches_brute_force(self, obstacles, start, end):
+        """Test every corridor matches a per-position scan of all obstacles"""
+        corridors = scan_vertical_corridors(start, end, obstacles)
+
+        positions = sorted({c.position for c in corridors})
+        min_y, max_y = min(start[1], end[1]), max(start[1], end[1])
+        for position in positions:
+            found = [(c.start, c.end) for c in corridors if c.position == position]
+            assert found == _brute_force_gaps(position, obstacles, min_y, max_y, 40)
+
+        # Horizontal scans are the same sweep on transposed boxes
+        transposed = [(y, x, h, w) for x, y, w, h in obstacles]
+        horizontal = scan_horizontal_corridors(start[::-1], end[::-1], transposed)
+        assert [(c.position, c.start, c.end) for c in horizontal] == [(c.position, c.start, c.end) for c in corridors]
+
+
+class TestSelectBestCorridor:
+    """Test suite for corridor scoring"""
+
+    def test_busy_lane_penalty_is_squared(self):
+        """Test a twice-used lane loses to a free one 30px further away"""
+        registry = LaneRegistry()
+        registry.reserve_lane(100, is_vertical=True)
+        registry.reserve_lane(100, is_vertical=True)
+        busy = Corridor(100, True, 0, 500)
+        free = Corridor(130, True, 0, 500)
+
+        assert select_best_corridor([busy, free], 100, registry) is free
+        assert select_best_corridor([busy, free], 100) is busy
+
+    def test_ties_keep_first(self):
+        """Test equally scored corridors resolve to the first candidate"""
+        left, right = Corridor(80, True, 0, 500), Corridor(120, True, 0, 500)
+
+        assert select_best_corridor([left, right], 100) is left
+        assert select_best_corridor([], 100) is None
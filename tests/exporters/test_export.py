@@ -0,0 +1,34 @@
+"""
+Tests for HTML report export
+"""
+
+import gzip
+
+from dw_auditor.exporters.html import export_to_html
+
+
+def _results():
+    """Minimal audit results for one clean column"""
+    return {
+        'table_name': 'orders',
+        'timestamp': '2024-01-01',
+        'total_rows': 1000,
+        'analyzed_rows': 1000,
+        'columns': {'id': {'issues': [], 'checks_run': []}},
+        'column_summary': {'id': {'dtype': 'INT64', 'null_pct': 0.0, 'null_count': 0, 'distinct_count': 1000, 'status': 'OK'}},
+    }
+
+
+class TestExportToHtml:
+    """Test suite for writing the HTML report"""
+
+    def test_compressed_report(self, tmp_path):
+        """Test the gzip report holds the same HTML as the plain one, under a .gz path"""
+        plain = export_to_html(_results(), str(tmp_path / "report.html"))
+        compressed = export_to_html(_results(), str(tmp_path / "report.html"), compress=True)
+
+        assert plain == str(tmp_path / "report.html")
+        assert compressed == str(tmp_path / "report.html.gz")
+        with gzip.open(compressed, 'rt', encoding='utf-8') as f:
+            assert f.read() == (tmp_path / "report.html").read_text(encoding='utf-8')
+        assert export_to_html(_results(), compressed, compress=True) == compressed
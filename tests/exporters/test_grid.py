@@ -0,0 +1,73 @@
+"""
+Tests for the ER diagram routing grid
+"""
+
+from dw_auditor.exporters.html.routing.grid import Grid, GridCell
+
+
+def _grid_with_box():
+    """20x20 cell grid with cells (5..9, 5..9) blocked"""
+    grid = Grid(600, 600, resolution=30)
+    grid.mark_obstacle((150, 150, 120, 120), margin=0)
+    return grid
+
+
+class TestGrid:
+    """Test suite for the blocked-cell bitmap"""
+
+    def test_mark_obstacle(self):
+        """Test an obstacle blocks exactly the cells it covers"""
+        grid = _grid_with_box()
+
+        assert grid.is_blocked(GridCell(5, 5))
+        assert grid.is_blocked(GridCell(9, 9))
+        assert not grid.is_blocked(GridCell(4, 5))
+        assert not grid.is_blocked(GridCell(10, 9))
+        assert not grid.is_traversable(GridCell(-1, 0))
+
+    def test_mark_obstacle_clipped(self):
+        """Test obstacles reaching past the grid edges only fill cells inside it"""
+        grid = Grid(600, 600, resolution=30)
+        grid.mark_obstacle((-100, 540, 200, 200), margin=0)  # Bottom-left corner
+        grid.mark_obstacle((-50, 0, 700, 30), margin=0)      # Full-width band
+
+        blocked = {(x, y) for y in range(grid.rows) for x in range(grid.cols) if grid.is_blocked(GridCell(x, y))}
+
+        corner = {(x, y) for x in range(0, 4) for y in range(18, 21)}
+        band = {(x, y) for x in range(grid.cols) for y in range(0, 2)}
+        assert blocked == corner | band
+        assert len(grid.blocked) == grid.cols * grid.rows
+
+    def test_column_major_mirror(self):
+        """Test the column-major bitmap holds the same cells as the row-major one"""
+        grid = _grid_with_box()
+        grid.mark_obstacle((-50, 0, 700, 30), margin=0)   # Full-width band
+        grid.mark_obstacle((540, -10, 30, 700), margin=0)  # Full-height band
+
+        for x in range(grid.cols):
+            for y in range(grid.rows):
+                assert grid.blocked_cm[x * grid.rows + y] == grid.blocked[y * grid.cols + x]
+
+    def test_cell_ids_round_trip(self):
+        """Test cell ids unpack to the same cell and neighbors skip blocked cells"""
+        grid = _grid_with_box()
+
+        assert grid.cell_xy(grid.cell_id(7, 3)) == GridCell(7, 3)
+        assert grid.neighbor_ids(4, 5) == [grid.cell_id(4, 4), grid.cell_id(4, 6), grid.cell_id(3, 5)]
+
+    def test_line_clear_matches_cells(self):
+        """Test the bitmap scans agree with checking every Bresenham cell"""
+        grid = _grid_with_box()
+        lines = [
+            (GridCell(0, 7), GridCell(19, 7)),    # Horizontal through the box
+            (GridCell(19, 2), GridCell(0, 2)),    # Horizontal above it
+            (GridCell(7, 19), GridCell(7, 0)),    # Vertical through the box
+            (GridCell(12, 0), GridCell(12, 19)),  # Vertical beside it
+            (GridCell(0, 0), GridCell(19, 19)),   # Diagonal through the box
+            (GridCell(0, 12), GridCell(6, 19)),   # Diagonal below it
+            (GridCell(3, 3), GridCell(3, 25)),    # Leaves the grid
+        ]
+
+        for start, end in lines:
+            expected = all(grid.is_traversable(cell) for cell in grid.get_line_cells(start, end))
+            assert grid.is_line_clear(start, end) == expected
@@ -0,0 +1,55 @@
+"""
+Tests for ER diagram lane management
+"""
+
+from dw_auditor.exporters.html.routing.lane_manager import LaneRegistry, Segment
+
+
+class TestSegment:
+    """Test suite for direction-independent segments"""
+
+    def test_reversed_segment_is_equal(self):
+        """Test A→B and B→A are the same segment and dict key"""
+        registry = LaneRegistry()
+        registry.add_segment(0, 0, 0, 100)
+        registry.add_segment(0, 100, 0, 0)
+
+        assert Segment(0, 0, 0, 100) == Segment(0, 100, 0, 0)
+        assert Segment(0, 0, 0, 100) != Segment(0, 0, 100, 0)
+        assert registry.get_segment_usage_count(0, 0, 0, 100) == 2
+        assert registry.get_lane_usage(0, is_vertical=True) == 2
+
+    def test_length(self):
+        """Test axis-aligned and diagonal segment lengths"""
+        assert Segment(0, 100, 0, 40).length() == 60
+        assert Segment(10, 5, -20, 5).length() == 30
+        assert Segment(0, 0, 30, 40).length() == 50
+
+
+class TestPreferredOffset:
+    """Test suite for LaneRegistry.get_preferred_offset"""
+
+    def test_free_base_lane(self):
+        """Test a free base lane keeps a zero offset"""
+        registry = LaneRegistry()
+        registry.reserve_lane(110, is_vertical=True)
+
+        assert registry.get_preferred_offset(100, is_vertical=True) == 0
+
+    def test_first_free_lane(self):
+        """Test the first free lane in scan order is picked"""
+        registry = LaneRegistry()
+        for position in range(50, 160, 10):
+            if position not in (130, 150):
+                registry.reserve_lane(position, is_vertical=True)
+
+        assert registry.get_preferred_offset(100, is_vertical=True) == 30
+
+    def test_least_used_lane(self):
+        """Test the least used lane wins when every lane is taken"""
+        registry = LaneRegistry()
+        for position, usage in [(80, 3), (90, 2), (100, 4), (110, 2), (120, 3)]:
+            for _ in range(usage):
+                registry.reserve_lane(position, is_vertical=False)
+
+        assert registry.get_preferred_offset(100, is_vertical=False, max_offset=20) == -10
@@ -0,0 +1,130 @@
+"""
+Tests for ER diagram path optimization
+"""
+
+from hypothesis import given, strategies as st, settings
+from dw_auditor.exporters.html.routing.grid import GridCell
+from dw_auditor.exporters.html.routing.path_optimizer import (
+    cleanup_waypoints,
+    compress_path,
+    optimize_path,
+    remove_duplicate_points,
+    remove_micro_segments,
+    snap_orthogonal,
+    smooth_corners,
+    validate_clearance,
+    _segment_intersects_box,
+)
+
+
+def _brute_force_clear(points, obstacles, margin):
+    """Reference: every segment checked against every expanded obstacle"""
+    return not any(
+        _segment_intersects_box(x1, y1, x2, y2, ox - margin, oy - margin, ox + w + margin, oy + h + margin)
+        for (x1, y1), (x2, y2) in zip(points, points[1:])
+        for ox, oy, w, h in obstacles
+    )
+
+
+def _sequential_cleanup(points, corner_radius=4.0):
+    """Reference pipeline: the four passes applied one after the other"""
+    points = remove_duplicate_points(points)
+    points = remove_micro_segments(points)
+    points = snap_orthogonal(points)
+    return smooth_corners(points, corner_radius)
+
+
+class TestCleanupWaypoints:
+    """Test suite for the fused cleanup_waypoints pass"""
+
+    def test_empty_and_single_point(self):
+        """Test that fewer than two points produce no path"""
+        assert cleanup_waypoints([]) == ("", [])
+        assert cleanup_waypoints([(10.0, 10.0)]) == ("", [])
+
+    def test_straight_line(self):
+        """Test a two-point path is emitted as a single line"""
+        path, labels = cleanup_waypoints([(0.0, 0.0), (100.0, 0.0)])
+
+        assert path == "M 0.0,0.0 L 100.0,0.0"
+        assert labels == [(50.0, 0.0)]
+
+    def test_duplicates_removed(self):
+        """Test consecutive duplicate points are dropped"""
+        path, _ = cleanup_waypoints([(0.0, 0.0), (0.0, 0.0), (0.05, 0.0), (100.0, 0.0)])
+
+        assert path == "M 0.0,0.0 L 100.0,0.0"
+
+    def test_near_orthogonal_snapped(self):
+        """Test nearly vertical segments are snapped to a constant x"""
+        path, _ = cleanup_waypoints([(0.0, 0.0), (1.5, 100.0)], corner_radius=0)
+
+        assert path == "M 0.0,0.0 L 0.0,100.0"
+
+    def test_corner_rounded(self):
+        """Test an L-shaped path gets a quadratic corner on whole pixels"""
+        path, _ = cleanup_waypoints([(0, 0), (100, 0), (100, 100)], corner_radius=4.0)
+
+        assert path == "M 0,0 L 96,0 Q 100,0 100,4 L 100,100"
+
+    @given(st.lists(
+        st.tuples(
+            st.integers(min_value=0, max_value=60).map(lambda v: v * 2.5),
+            st.integers(min_value=0, max_value=60).map(lambda v: v * 2.5),
+        ),
+        max_size=20,
+    ), st.sampled_from([0.0, 4.0, 6.0]))
+    @settings(max_examples=200, deadline=None)
+    def test_property_matches_sequential_pipeline(self, points, corner_radius):
+        """Test the fused pass is equivalent to the sequential passes"""
+        assert cleanup_waypoints(points, corner_radius) == _sequential_cleanup(points, corner_radius)
+
+
+class TestCompressPath:
+    """Test suite for collinear cell compression"""
+
+    def test_keeps_turns_only(self):
+        """Test straight runs collapse to their end cells"""
+        cells = [GridCell(0, 0), GridCell(1, 0), GridCell(2, 0), GridCell(2, 1), GridCell(2, 2), GridCell(3, 2)]
+
+        assert compress_path(cells) == [GridCell(0, 0), GridCell(2, 0), GridCell(2, 2), GridCell(3, 2)]
+        assert compress_path(cells[:2]) == cells[:2]
+
+
+class TestOptimizePath:
+    """Test suite for the cell path to SVG pipeline"""
+
+    def test_cell_path(self):
+        """Test an L-shaped cell path with a repeated cell becomes one rounded corner"""
+        cells = [GridCell(0, 0), GridCell(1, 0), GridCell(2, 0), GridCell(2, 1), GridCell(2, 2), GridCell(2, 2)]
+
+        path, labels = optimize_path(cells, 30, [])
+
+        assert path == "M 15.0,15.0 L 71,15 Q 75.0,15.0 75,19 L 75.0,75.0"
+        assert labels == [(43.0, 15.0), (75.0, 45.0)]
+
+
+_coords = st.integers(min_value=-2, max_value=30).map(lambda v: v * 10)
+
+
+class TestValidateClearance:
+    """Test suite for path clearance checks"""
+
+    def test_segments_through_and_beside_box(self):
+        """Test segments crossing the margin fail and segments outside it pass"""
+        obstacles = [(100, 100, 100, 100)]
+
+        assert not validate_clearance([(150, 0), (150, 300)], obstacles)
+        assert not validate_clearance([(0, 205), (300, 205)], obstacles)
+        assert validate_clearance([(0, 215), (300, 215)], obstacles)
+        assert validate_clearance([(0, 0), (300, 300)], obstacles)  # Diagonals only check endpoints
+
+    @given(
+        st.lists(st.tuples(_coords, _coords), max_size=6),
+        st.lists(st.tuples(_coords, _coords, _coords.map(abs), _coords.map(abs)), max_size=6),
+        st.sampled_from([0, 10]),
+    )
+    @settings(max_examples=300, deadline=None)
+    def test_property_matches_brute_force(self, points, obstacles, margin):
+        """Test the specialized scan agrees with the per-pair intersection test"""
+        assert validate_clearance(points, obstacles, margin) == _brute_force_clear(points, obstacles, margin)
@@ -0,0 +1,148 @@
+"""
+Tests for the relationships report
+"""
+
+import json
+import re
+
+import pytest
+
+from dw_auditor.exporters.html.relationships import (
+    generate_standalone_relationships_report, generate_relationships_summary_section, _connected_components,
+    _CANVAS_RELATIONSHIP_THRESHOLD, _DETAILS_CLIENT_RENDER_THRESHOLD, _ZOOM_HINT, _ZOOM_LOD_JS
+)
+
+
+def _relationships(count, num_tables=6, column='col'):
+    """Relationships chaining num_tables tables, all above the display confidence"""
+    return [
+        {
+            'table1': f"tbl_{i % num_tables}",
+            'column1': f"{column}_{i}",
+            'table2': f"tbl_{(i + 1) % num_tables}",
+            'column2': 'id',
+            'confidence': 0.95,
+            'relationship_type': 'many-to-one',
+            'direction': 'table1_to_table2',
+            'overlap_ratio': 0.5,
+            'matching_values': 10,
+        }
+        for i in range(count)
+    ]
+
+
+def _report(tmp_path, relationships, **kwargs):
+    """Write the standalone report and return its HTML"""
+    output_path = tmp_path / "relationships.html"
+    generate_standalone_relationships_report(relationships, {}, str(output_path), **kwargs)
+    return output_path.read_text(encoding='utf-8')
+
+
+class TestRenderMode:
+    """Test suite for choosing between SVG and canvas relationship lines"""
+
+    def test_auto_switches_to_canvas_above_threshold(self, tmp_path):
+        """Test auto mode keeps SVG lines up to the threshold and uses canvas above it"""
+        svg_html = _report(tmp_path, _relationships(_CANVAS_RELATIONSHIP_THRESHOLD))
+        canvas_html = _report(tmp_path, _relationships(_CANVAS_RELATIONSHIP_THRESHOLD + 1))
+
+        assert 'id="er-canvas"' not in svg_html
+        assert svg_html.count('class="er-relationship') == _CANVAS_RELATIONSHIP_THRESHOLD
+        assert 'id="er-canvas"' in canvas_html
+        assert 'id="er-canvas-data"' in canvas_html
+
+    def test_explicit_modes(self, tmp_path):
+        """Test svg and canvas modes are honoured regardless of relationship count"""
+        canvas_html = _report(tmp_path, _relationships(3), render_mode='canvas')
+        svg_html = _report(tmp_path, _relationships(_CANVAS_RELATIONSHIP_THRESHOLD + 1), render_mode='svg')
+
+        assert 'id="er-canvas"' in canvas_html
+        assert 'id="er-canvas"' not in svg_html
+        assert '<strong>Interactive ER Diagram:</strong> Click on a table to highlight its relationships.\n' in canvas_html
+        assert 'Hover over connection lines to see details.' in svg_html
+
+    def test_zoom_hint_only_with_zoom_script(self, tmp_path):
+        """Test the zoom hint is shown exactly on the diagrams that ship the zoom script"""
+        canvas_html = _report(tmp_path, _relationships(3), render_mode='canvas')
+        svg_html = _report(tmp_path, _relationships(3), render_mode='svg')
+        summary_html = generate_relationships_summary_section(_relationships(3), {}, show_diagram=True)
+
+        assert _ZOOM_HINT not in canvas_html
+        assert _ZOOM_LOD_JS not in canvas_html
+        for html in (svg_html, summary_html):
+            assert _ZOOM_HINT in html
+            assert _ZOOM_LOD_JS in html
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        """Test an unknown render mode raises before anything is written"""
+        with pytest.raises(ValueError, match="render_mode"):
+            _report(tmp_path, _relationships(3), render_mode='webgl')
+
+        assert not (tmp_path / "relationships.html").exists()
+
+    def test_canvas_data_cannot_close_script(self, tmp_path):
+        """Test a column name containing </script> stays inside the canvas data block"""
+        html = _report(tmp_path, _relationships(1, column='x</script><b>'), render_mode='canvas')
+
+        data = re.search(r'<script type="application/json" id="er-canvas-data">(.*?)</script>', html, re.S).group(1)
+        labels = json.loads(data)['relationships'][0]['labels']
+
+        assert '<' not in data
+        assert 'x</script><b>_0' in [label[3] for label in labels]
+
+
+class TestParallelRouting:
+    """Test suite for routing disconnected table groups in worker processes"""
+
+    def test_connected_components(self):
+        """Test pairs are grouped by shared tables and keep their original order"""
+        pair_keys = [('a', 'b'), ('x', 'y'), ('c', 'd'), ('b', 'c'), ('y', 'z'), ('solo', 'solo')]
+
+        components = _connected_components(pair_keys)
+
+        assert components == [
+            [('a', 'b'), ('c', 'd'), ('b', 'c')],
+            [('x', 'y'), ('y', 'z')],
+            [('solo', 'solo')],
+        ]
+
+    def test_workers_route_disconnected_groups(self, tmp_path):
+        """Test two disconnected groups routed in workers give a line per relationship"""
+        relationships = _relationships(2, num_tables=3) + [
+            dict(rel, table1=rel['table1'].replace('tbl', 'other'), table2=rel['table2'].replace('tbl', 'other'))
+            for rel in _relationships(2, num_tables=3)
+        ]
+
+        html = _report(tmp_path, relationships, routing_workers=2)
+
+        pairs = re.findall(r'data-table1="([^"]*)" data-table2="([^"]*)"', html)
+        assert sorted(pairs) == sorted((rel['table1'], rel['table2']) for rel in relationships)
+        assert len(re.findall(r' d="M [^"]+"', html)) == len(relationships)
+
+    def test_workers_must_be_positive(self, tmp_path):
+        """Test routing_workers below 1 raises"""
+        with pytest.raises(ValueError, match="routing_workers"):
+            _report(tmp_path, _relationships(3), routing_workers=0)
+
+
+class TestDetailsTable:
+    """Test suite for the relationship details table in the summary section"""
+
+    def test_rows_rendered_up_to_threshold(self):
+        """Test the table body is rendered as rows up to the threshold"""
+        html = generate_relationships_summary_section(_relationships(_DETAILS_CLIENT_RENDER_THRESHOLD), {})
+
+        assert 'id="rels-data"' not in html
+        assert html.count('<tr>') == _DETAILS_CLIENT_RENDER_THRESHOLD + 1  # Plus the header row
+
+    def test_json_payload_above_threshold(self):
+        """Test the rows move to the rels-data JSON payload above the threshold, with < escaped"""
+        relationships = _relationships(_DETAILS_CLIENT_RENDER_THRESHOLD + 1, column='x</script><b>')
+
+        html = generate_relationships_summary_section(relationships, {})
+
+        data = re.search(r'<script type="application/json" id="rels-data">(.*?)</script>', html, re.S).group(1)
+        rows = json.loads(data)['rows']
+        assert '<' not in data
+        assert len(rows) == len(relationships)
+        assert html.count('<tr>') == 1
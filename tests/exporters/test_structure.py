@@ -0,0 +1,40 @@
+"""
+Tests for HTML report structure sections
+"""
+
+from dw_auditor.exporters.html.structure import _generate_header, _generate_metadata_section
+
+
+def _results():
+    """Audit results whose warehouse-provided values contain HTML special characters"""
+    return {
+        'table_name': 'orders<1>',
+        'timestamp': '2024-01-01',
+        'table_metadata': {
+            'table_type': 'TABLE',
+            'description': 'Orders & "returns" <draft>',
+            'partition_column': 'created_at',
+            'partition_type': 'DAY',
+            'primary_key_columns': ['id'],
+            'primary_key_source': 'user_config',
+        },
+    }
+
+
+class TestMetadataEscaping:
+    """Test suite for escaping warehouse metadata in the report sections"""
+
+    def test_header_escapes_values(self):
+        """Test the table name is escaped in the title and the header"""
+        html = _generate_header(_results())
+
+        assert html.count('orders&lt;1&gt;') == 2
+        assert 'orders<1>' not in html
+
+    def test_metadata_section_escapes_values(self):
+        """Test descriptions are escaped while the generated PK badge markup is kept"""
+        html = _generate_metadata_section(_results())
+
+        assert 'Orders &amp; &quot;returns&quot; &lt;draft&gt;' in html
+        assert 'created_at (DAY)' in html
+        assert 'id <span style=' in html